@@ -4,7 +4,36 @@ __version__ = "0.1.0"
 __author__ = "Arthur Souza Rodrigues"
 __email__ = "arthrod@umich.edu"
 
-from .splitter import TextProcessor
-from .formatter import TaskFormatter
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ["TextProcessor", "TaskFormatter"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .splitter import TextProcessor
+    from .formatter import TaskDocument, TaskFormatter
+    from .jsonl import read_jsonl
+
+__all__ = ["TextProcessor", "TaskFormatter", "TaskDocument", "read_jsonl"]
+
+# Public names and the submodule defining each, imported on first access so
+# that importing the package does not load the native splitter
+_LAZY_ATTRIBUTES = {
+    "TextProcessor": "splitter",
+    "TaskFormatter": "formatter",
+    "TaskDocument": "formatter",
+    "read_jsonl": "jsonl",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes from their submodules on first access (PEP 562)."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
@@ -0,0 +1,153 @@
+"""asyncio-native text splitting that keeps the event loop responsive."""
+
+import asyncio
+import concurrent.futures
+from typing import Any, Callable, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from .splitter import TextProcessor, split_with_settings
+
+T = TypeVar("T")
+
+
+class AsyncTextProcessor:
+    """Splits text on a bounded executor so coroutines never block the loop.
+
+    At most ``max_concurrency`` splits run at a time; further calls wait on
+    a semaphore, which gives callers backpressure. Cancelling a call drops
+    it if it has not started yet. A split that is already running cannot be
+    interrupted, so its slot stays taken until it finishes and concurrency
+    remains bounded.
+    """
+
+    def __init__(
+        self,
+        chunk_size: Union[int, Tuple[int, int]] = (300, 500),
+        model: str = "gpt-4",
+        file_type: str = "text",
+        max_concurrency: int = 4,
+        use_processes: bool = False,
+        executor: Optional[concurrent.futures.Executor] = None,
+        language: Optional[str] = None,
+        overlap: int = 0
+    ):
+        """Initialize async text processor.
+
+        Args:
+            chunk_size: Maximum chunk size (int) or range (tuple)
+            model: Tiktoken model name for tokenization
+            file_type: Type of file being processed (text, markdown, code)
+            max_concurrency: Maximum number of splits running at once
+            use_processes: Split in a process pool instead of a thread pool
+            executor: Executor to use instead of creating one (not shut down by close)
+            language: Tree-sitter grammar language of code, e.g. ``python``
+            overlap: Tokens each chunk shares with the end of the previous one
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.processor = TextProcessor(
+            chunk_size=chunk_size, model=model, file_type=file_type, language=language, overlap=overlap
+        )
+        self.max_concurrency = max_concurrency
+        self.use_processes = use_processes
+        self._executor = executor
+        self._owns_executor = executor is None
+        # Created on first use so it binds to the running loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_concurrency)
+            else:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="cut-it"
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a function on the executor while holding a concurrency slot."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._get_semaphore()
+        await semaphore.acquire()
+
+        release = True
+        try:
+            future = self._get_executor().submit(func, *args)
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                if not future.cancel():
+                    # Already running: keep the slot until the work actually ends
+                    release = False
+                    future.add_done_callback(lambda _: _release_threadsafe(loop, semaphore))
+                raise
+        finally:
+            if release:
+                semaphore.release()
+
+    async def split_text(self, text: str) -> List[str]:
+        """Split text into semantic chunks without blocking the event loop.
+
+        Args:
+            text: Input text to split
+
+        Returns:
+            List of text chunks
+        """
+        if self.use_processes:
+            processor = self.processor
+            return await self._run(
+                split_with_settings,
+                processor.chunk_size, processor.model, processor.file_type, text,
+                processor.language, processor.overlap
+            )
+        return await self._run(self.processor.split_text, text)
+
+    async def split_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """Split many texts concurrently, bounded by ``max_concurrency``.
+
+        If any split fails, the remaining ones are cancelled and the error
+        is raised.
+
+        Args:
+            texts: Input texts to split
+
+        Returns:
+            Chunks of each text, in input order
+        """
+        tasks = [asyncio.ensure_future(self.split_text(text)) for text in texts]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled tasks settle so none is left pending
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def close(self) -> None:
+        """Shut down the executor created by this processor."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self) -> "AsyncTextProcessor":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _release_threadsafe(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore) -> None:
+    """Release an asyncio semaphore from an executor thread."""
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:
+        # The loop is closed, so nothing waits on the semaphore any more
+        pass
@@ -0,0 +1,316 @@
+"""Batch processing of many files across a process pool."""
+
+import glob
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .cache import DEFAULT_MAX_MB, ChunkCache, store_chunks
+from .formatter import TaskFormatter
+from .grammars import language_for_path
+from .jsonl import write_jsonl
+from .splitter import TextProcessor
+from .walk import walk_files
+
+
+@dataclass
+class BatchSettings:
+    """Settings shared by every file in a batch run."""
+
+    chunk_size_min: int = 300
+    chunk_size_max: int = 500
+    overlap: int = 0
+    model: str = "gpt-4"
+    pt_br: bool = False
+    cache_dir: Optional[Path] = None
+    cache_max_mb: int = DEFAULT_MAX_MB
+    output_format: str = "markdown"
+
+
+@dataclass
+class BatchItem:
+    """A single file scheduled for processing.
+
+    An item without ``output_path`` is split into JSONL records that are
+    returned in its result, for the caller to write to a combined output.
+    """
+
+    input_path: Path
+    output_path: Optional[Path]
+    file_type: str
+    size: int = 0
+
+
+@dataclass
+class FileResult:
+    """Outcome of processing a single file."""
+
+    input_path: Path
+    output_path: Optional[Path]
+    chunks: int = 0
+    error: Optional[str] = None
+    size: int = 0
+    records: Optional[List[Any]] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was processed successfully."""
+        return self.error is None
+
+
+# Per-process state, populated once in each pool worker
+_worker_settings: Optional[BatchSettings] = None
+_worker_processors: Dict[Tuple[str, Optional[str]], TextProcessor] = {}
+_worker_formatter: Optional[TaskFormatter] = None
+_worker_cache: Optional[ChunkCache] = None
+
+
+def is_batch_pattern(file_path: str) -> bool:
+    """Check whether a path argument refers to more than a single file."""
+    return glob.has_magic(file_path) or os.path.isdir(file_path)
+
+
+def expand_inputs(patterns: Iterable[str]) -> List[Path]:
+    """Expand file, directory and glob arguments into a list of input files.
+
+    Directories are walked recursively the way ``cut-it ingest`` walks
+    them: ``.git`` directories, files matched by ``.gitignore``, symlinks,
+    binary files and previously generated ``.tasks.md`` and
+    ``.tasks.jsonl`` files are skipped. Results keep argument order and
+    contain no duplicates.
+
+    Args:
+        patterns: File paths, directories or glob patterns
+
+    Returns:
+        List of input file paths
+    """
+    paths: List[Path] = []
+    seen = set()
+
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            candidates = [Path(match) for match in sorted(glob.glob(pattern, recursive=True))]
+        else:
+            candidates = [Path(pattern)]
+
+        for candidate in candidates:
+            if candidate.is_dir():
+                files = [
+                    candidate.joinpath(*source.relative.split('/'))
+                    for source in walk_files(candidate)
+                ]
+            else:
+                files = [candidate]
+
+            for path in files:
+                if path not in seen:
+                    seen.add(path)
+                    paths.append(path)
+
+    return paths
+
+
+def _init_worker(settings: BatchSettings) -> None:
+    """Initialize per-process state in a pool worker."""
+    global _worker_settings, _worker_formatter, _worker_cache
+    _worker_settings = settings
+    _worker_processors.clear()
+    _worker_formatter = TaskFormatter(pt_br=settings.pt_br)
+    _worker_cache = None
+    if settings.cache_dir is not None:
+        _worker_cache = ChunkCache(settings.cache_dir, settings.cache_max_mb * 1024 * 1024)
+
+
+def _get_processor(file_type: str, language: Optional[str] = None) -> TextProcessor:
+    """Get this worker's processor for a file type and language, creating it once."""
+    processor = _worker_processors.get((file_type, language))
+    if processor is None:
+        settings = _worker_settings or BatchSettings()
+        processor = TextProcessor(
+            chunk_size=(settings.chunk_size_min, settings.chunk_size_max),
+            model=settings.model,
+            file_type=file_type,
+            language=language,
+            overlap=settings.overlap
+        )
+        _worker_processors[(file_type, language)] = processor
+    return processor
+
+
+def process_item(item: BatchItem) -> FileResult:
+    """Process a single file, capturing any failure in the result.
+
+    Args:
+        item: File to process
+
+    Returns:
+        Result of processing the file
+    """
+    result = FileResult(input_path=item.input_path, output_path=item.output_path, size=item.size)
+    try:
+        language = language_for_path(item.input_path) if item.file_type == "code" else None
+        processor = _get_processor(item.file_type, language)
+        if item.output_path is None:
+            result.records = list(processor.iter_records(item.input_path.read_text(encoding='utf-8')))
+            result.chunks = len(result.records)
+            return result
+        jsonl = _worker_settings is not None and _worker_settings.output_format == "jsonl"
+        cached_chunks = None
+        # Cached chunks have no offsets, so JSONL output always re-splits
+        if _worker_cache is not None and not jsonl:
+            cache_key = ChunkCache.make_key(
+                item.input_path, processor.model, processor.chunk_size, processor.splitter_type, processor.overlap
+            )
+            cached_chunks = _worker_cache.get(cache_key)
+        
+        if jsonl:
+            records = processor.iter_records(item.input_path.read_text(encoding='utf-8'))
+        elif cached_chunks is not None:
+            chunks = iter(cached_chunks)
+        else:
+            text_content = item.input_path.read_text(encoding='utf-8')
+            chunks = processor.iter_chunks(text_content)
+            if _worker_cache is not None:
+                chunks = store_chunks(_worker_cache, cache_key, chunks)
+        formatter = _worker_formatter or TaskFormatter()
+        item.output_path.parent.mkdir(parents=True, exist_ok=True)
+        with item.output_path.open('w', encoding='utf-8') as output_file:
+            if jsonl:
+                result.chunks = write_jsonl(records, output_file, source=item.input_path.name)
+            else:
+                result.chunks = formatter.write_tasks(
+                    chunks=chunks,
+                    filename=item.input_path.name,
+                    fp=output_file
+                )
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def run_batch(
+    items: List[BatchItem],
+    settings: BatchSettings,
+    jobs: int = 1
+) -> Iterator[FileResult]:
+    """Process files, optionally spread across a pool of worker processes.
+
+    Results are yielded in the same order as ``items`` regardless of which
+    worker finishes first. A failing file produces a result with ``error``
+    set instead of aborting the run.
+
+    Args:
+        items: Files to process
+        settings: Settings shared by every file
+        jobs: Number of worker processes (1 processes files in-process)
+
+    Yields:
+        One result per item, in input order
+    """
+    if jobs <= 1 or len(items) <= 1:
+        _init_worker(settings)
+        for item in items:
+            yield process_item(item)
+        return
+
+    # Deferred so single-file runs never load multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    
+    workers = min(jobs, len(items))
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(settings,)
+    ) as executor:
+        yield from executor.map(process_item, items, chunksize=chunksize)
+
+
+def run_stream(
+    items: Iterable[BatchItem],
+    settings: BatchSettings,
+    jobs: int = 1,
+    max_pending: Optional[int] = None
+) -> Iterator[FileResult]:
+    """Process a stream of files, yielding each result as soon as it is ready.
+
+    Unlike ``run_batch``, items are pulled from ``items`` only as workers
+    free up, so a lazily walked tree starts producing results immediately
+    and never has more than ``max_pending`` files in flight. Results arrive
+    in completion order.
+
+    Args:
+        items: Files to process, possibly a lazy iterator
+        settings: Settings shared by every file
+        jobs: Number of worker processes (1 processes files in-process)
+        max_pending: Most files submitted but not yet finished (default 4 per job)
+
+    Yields:
+        One result per item, in completion order
+    """
+    if jobs <= 1:
+        _init_worker(settings)
+        for item in items:
+            yield process_item(item)
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+    
+    limit = max(max_pending or jobs * 4, jobs)
+    iterator = iter(items)
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(settings,)
+    ) as executor:
+        pending: Set["Future[FileResult]"] = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < limit:
+                queued = next(iterator, None)
+                if queued is None:
+                    exhausted = True
+                else:
+                    pending.add(executor.submit(process_item, queued))
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def plan_outputs(
+    inputs: List[Path],
+    output_dir: Optional[Path] = None,
+    suffix: str = ".tasks.md"
+) -> List[Tuple[Path, Path]]:
+    """Pair each input file with its ``.tasks.md`` (or other suffix) output path.
+
+    Args:
+        inputs: Input file paths
+        output_dir: Directory for outputs (defaults to next to each input)
+        suffix: Suffix replacing each input's suffix
+
+    Returns:
+        List of (input, output) path pairs
+
+    Raises:
+        ValueError: If two inputs would be written to the same output file
+    """
+    pairs = []
+    targets: Dict[Path, Path] = {}
+
+    for input_path in inputs:
+        output_path = input_path.with_suffix(suffix)
+        if output_dir is not None:
+            output_path = output_dir / output_path.name
+        if output_path in targets:
+            raise ValueError(
+                f"{targets[output_path]} and {input_path} both write to {output_path}"
+            )
+        targets[output_path] = input_path
+        pairs.append((input_path, output_path))
+
+    return pairs
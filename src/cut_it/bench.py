@@ -0,0 +1,391 @@
+"""Benchmarks of the split and format pipeline on synthetic corpora."""
+
+import gc
+import json
+import platform
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from . import __version__
+from .formatter import TaskFormatter
+
+if TYPE_CHECKING:
+    from .splitter import TextProcessor
+
+CORPUS_KINDS = ("text", "markdown", "code", "paragraphs")
+DEFAULT_KINDS = ("text", "markdown", "code")
+STAGES = ("split", "fallback", "format")
+DEFAULT_SIZES = ("1KB", "100KB", "1MB")
+SCALING_MODES = ("serial", "thread", "process")
+DEFAULT_WORKER_COUNTS = (1, 2, 4, 8, 16, 32)
+
+# Larger corpora repeat a block of this many unique bytes
+_UNIQUE_BLOCK_SIZE = 1024 * 1024
+
+_SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+
+_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua enim ad minim veniam quis nostrud"
+).split()
+
+T = TypeVar("T")
+
+
+@dataclass
+class BenchResult:
+    """Timing of one pipeline stage on one corpus."""
+
+    kind: str
+    size_bytes: int
+    stage: str
+    best_seconds: float
+    mean_seconds: float
+    chunks: int
+    mb_per_s: float
+    chunks_per_s: float
+    # Peak RSS of the whole benchmark process so far, not of this case alone
+    peak_rss_mb: Optional[float]
+
+
+@dataclass
+class ScalingResult:
+    """Time to split a batch of documents with one execution mode."""
+
+    mode: str
+    workers: int
+    documents: int
+    seconds: float
+    mb_per_s: float
+    speedup: float
+
+
+def parse_size(size: str) -> int:
+    """Parse a size such as ``500MB`` or ``1KB`` into bytes.
+
+    Args:
+        size: Number with an optional B, KB, MB or GB suffix
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the size is malformed
+    """
+    text = size.strip().upper()
+    for unit in ("GB", "MB", "KB", "B"):
+        if text.endswith(unit):
+            number, multiplier = text[:-len(unit)], _SIZE_UNITS[unit]
+            break
+    else:
+        number, multiplier = text, 1
+
+    try:
+        value = float(number)
+    except ValueError:
+        raise ValueError(f"invalid size '{size}'")
+    if value <= 0:
+        raise ValueError(f"invalid size '{size}'")
+    return int(value * multiplier)
+
+
+def format_size(size_bytes: int) -> str:
+    """Format a byte count with the largest whole unit, e.g. ``100KB``."""
+    for unit in ("GB", "MB", "KB"):
+        if size_bytes >= _SIZE_UNITS[unit] and size_bytes % _SIZE_UNITS[unit] == 0:
+            return f"{size_bytes // _SIZE_UNITS[unit]}{unit}"
+    return f"{size_bytes}B"
+
+
+def _sentence(rng: random.Random, min_words: int, max_words: int) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def _text_block(rng: random.Random, index: int) -> str:
+    return " ".join(_sentence(rng, 4, 20) for _ in range(rng.randint(1, 8))) + "\n\n"
+
+
+def _paragraph_block(rng: random.Random, index: int) -> str:
+    return _sentence(rng, 3, 8) + "\n\n"
+
+
+def _markdown_block(rng: random.Random, index: int) -> str:
+    roll = rng.random()
+    if roll < 0.15:
+        return "#" * rng.randint(1, 3) + f" Section {index}\n\n"
+    if roll < 0.3:
+        items = "".join(f"- {_sentence(rng, 3, 10)}\n" for _ in range(rng.randint(2, 6)))
+        return items + "\n"
+    return _text_block(rng, index)
+
+
+def _code_block(rng: random.Random, index: int) -> str:
+    lines = [f"def function_{index}({', '.join(rng.sample(_WORDS, rng.randint(0, 3)))}):"]
+    lines.append(f'    """{_sentence(rng, 3, 12)}"""')
+    for _ in range(rng.randint(2, 12)):
+        lines.append(f"    {rng.choice(_WORDS)}_{rng.randint(0, 99)} = {rng.randint(0, 9999)}")
+    lines.append(f"    return {rng.choice(_WORDS)}")
+    return "\n".join(lines) + "\n\n\n"
+
+
+_BLOCK_GENERATORS: Dict[str, Callable[[random.Random, int], str]] = {
+    "text": _text_block,
+    "markdown": _markdown_block,
+    "code": _code_block,
+    "paragraphs": _paragraph_block,
+}
+
+# File type each corpus kind is split as, when it differs from the kind
+_KIND_FILE_TYPES = {"paragraphs": "text"}
+
+# Grammar language of code corpora, used when its grammar is installed
+_KIND_LANGUAGES = {"code": "python"}
+
+
+def corpus_processor(
+    kind: str,
+    chunk_size: Union[int, Tuple[int, int]] = (300, 500),
+    model: str = "gpt-4"
+) -> "TextProcessor":
+    """Get the text processor that splits a corpus kind in the benchmarks."""
+    from .splitter import TextProcessor
+
+    return TextProcessor(
+        chunk_size=chunk_size,
+        model=model,
+        file_type=_KIND_FILE_TYPES.get(kind, kind),
+        language=_KIND_LANGUAGES.get(kind)
+    )
+
+
+def generate_corpus(kind: str, size_bytes: int, seed: int = 0) -> str:
+    """Generate a reproducible synthetic document of an exact size.
+
+    Args:
+        kind: Corpus kind (text, markdown, code, paragraphs)
+        size_bytes: Size of the document in bytes (the corpus is ASCII)
+        seed: Random seed
+
+    Returns:
+        Synthetic document
+    """
+    if kind not in _BLOCK_GENERATORS:
+        raise ValueError(f"unknown corpus kind '{kind}'")
+    if size_bytes <= 0:
+        return ""
+    generate_block = _BLOCK_GENERATORS[kind]
+    rng = random.Random(seed)
+
+    blocks: List[str] = []
+    length = 0
+    unique_size = min(size_bytes, _UNIQUE_BLOCK_SIZE)
+    while length < unique_size:
+        block = generate_block(rng, len(blocks))
+        blocks.append(block)
+        length += len(block)
+    unique = "".join(blocks)[:unique_size]
+
+    repeats, remainder = divmod(size_bytes, len(unique))
+    return unique * repeats + unique[:remainder]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of this process in MB, if available.
+
+    This is the high-water mark of the whole process so far: it never
+    decreases, so it reflects the largest case run before the call rather
+    than the last one.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _measure(func: Callable[[], T], repeat: int) -> Tuple[List[float], T]:
+    """Run a function ``repeat`` times (at least once), returning each duration and the last result."""
+    durations = []
+    while True:
+        gc.collect()
+        start = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - start)
+        if len(durations) >= repeat:
+            return durations, result
+
+
+def _result(
+    kind: str,
+    size_bytes: int,
+    stage: str,
+    durations: List[float],
+    chunks: int
+) -> BenchResult:
+    best = min(durations)
+    return BenchResult(
+        kind=kind,
+        size_bytes=size_bytes,
+        stage=stage,
+        best_seconds=best,
+        mean_seconds=sum(durations) / len(durations),
+        chunks=chunks,
+        mb_per_s=size_bytes / (1024 * 1024) / best if best else 0.0,
+        chunks_per_s=chunks / best if best else 0.0,
+        peak_rss_mb=peak_rss_mb(),
+    )
+
+
+def run_benchmarks(
+    sizes: Iterable[int],
+    kinds: Iterable[str] = DEFAULT_KINDS,
+    stages: Iterable[str] = STAGES,
+    chunk_size: Union[int, Tuple[int, int]] = (300, 500),
+    model: str = "gpt-4",
+    repeat: int = 3,
+    on_result: Optional[Callable[[BenchResult], None]] = None
+) -> List[BenchResult]:
+    """Time each pipeline stage on synthetic corpora of each kind and size.
+
+    The split stage times ``TextProcessor.split_text``, the fallback stage
+    ``TextProcessor._fallback_split`` and the format stage
+    ``TaskFormatter.format_as_tasks`` on the chunks of the split stage.
+    The ``paragraphs`` corpus of many short paragraphs shows whether the
+    fallback stage stays linear as the paragraph count grows.
+
+    Args:
+        sizes: Corpus sizes in bytes
+        kinds: Corpus kinds (text, markdown, code, paragraphs)
+        stages: Stages to time (split, fallback, format)
+        chunk_size: Chunk size passed to the text processor
+        model: Tiktoken model name for tokenization
+        repeat: Runs per stage; throughput uses the fastest run
+        on_result: Called with each result as soon as it is measured
+
+    Returns:
+        One result per kind, size and stage
+    """
+    sizes = list(sizes)
+    selected = set(stages)
+    stages = [stage for stage in STAGES if stage in selected]
+    formatter = TaskFormatter()
+    results = []
+
+    for kind in kinds:
+        processor = corpus_processor(kind, chunk_size, model)
+        for size_bytes in sizes:
+            text = generate_corpus(kind, size_bytes)
+            timings = {}
+
+            # Formatting needs chunks, so the text is always split once
+            durations, chunks = _measure(lambda: processor.split_text(text), repeat if "split" in stages else 1)
+            timings["split"] = (durations, len(chunks))
+            if "fallback" in stages:
+                durations, fallback_chunks = _measure(lambda: processor._fallback_split(text), repeat)
+                timings["fallback"] = (durations, len(fallback_chunks))
+                del fallback_chunks
+            if "format" in stages:
+                durations, _ = _measure(lambda: formatter.format_as_tasks(chunks, "bench.txt"), repeat)
+                timings["format"] = (durations, len(chunks))
+
+            for stage in stages:
+                result = _result(kind, size_bytes, stage, *timings[stage])
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+            del text, chunks
+
+    return results
+
+
+def run_scaling_benchmark(
+    worker_counts: Iterable[int] = DEFAULT_WORKER_COUNTS,
+    documents: int = 32,
+    size_bytes: int = 256 * 1024,
+    kind: str = "text",
+    chunk_size: Union[int, Tuple[int, int]] = (300, 500),
+    model: str = "gpt-4",
+    modes: Iterable[str] = SCALING_MODES
+) -> List[ScalingResult]:
+    """Compare splitting a batch serially, on threads and on processes.
+
+    Threads share one splitter; processes each build their own and receive
+    documents by pickling. Pools are warmed up before timing, so results
+    reflect steady-state throughput. Speedups are relative to serial.
+
+    Args:
+        worker_counts: Thread and process counts to try
+        documents: Number of documents in the batch
+        size_bytes: Size of each document
+        kind: Corpus kind (text, markdown, code, paragraphs)
+        chunk_size: Chunk size passed to the text processor
+        model: Tiktoken model name for tokenization
+        modes: Modes to time (serial, thread, process)
+
+    Returns:
+        One result for serial and one per worker count for threads and processes
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    from .splitter import split_with_settings
+
+    selected = set(modes)
+    processor = corpus_processor(kind, chunk_size, model)
+    texts = [generate_corpus(kind, size_bytes, seed=seed) for seed in range(documents)]
+    total_mb = size_bytes * documents / (1024 * 1024)
+    processor.split_text(texts[0])
+
+    def timed(func: Callable[[], Any]) -> float:
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+    serial = timed(lambda: [processor.split_text(text) for text in texts])
+    results = []
+    if "serial" in selected:
+        results.append(ScalingResult("serial", 1, documents, serial, total_mb / serial, 1.0))
+
+    settings = (processor.chunk_size, processor.model, processor.file_type)
+    for workers in worker_counts:
+        if "thread" in selected:
+            with ThreadPoolExecutor(max_workers=workers) as threads:
+                seconds = timed(lambda: list(threads.map(processor.split_text, texts)))
+            results.append(ScalingResult("thread", workers, documents, seconds, total_mb / seconds, serial / seconds))
+        if "process" in selected:
+            with ProcessPoolExecutor(max_workers=workers) as processes:
+                # Start every worker and build its splitter before timing
+                list(processes.map(split_with_settings, *zip(*[settings + ("warm up", processor.language)] * workers)))
+                seconds = timed(lambda: list(processes.map(
+                    split_with_settings,
+                    *zip(*[settings + (text, processor.language) for text in texts])
+                )))
+            results.append(ScalingResult("process", workers, documents, seconds, total_mb / seconds, serial / seconds))
+
+    return results
+
+
+def build_report(results: List[Any]) -> Dict[str, Any]:
+    """Build a JSON-serializable report of benchmark results and environment."""
+    from .splitter import available_cores
+
+    return {
+        "cut_it_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cores": available_cores(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def write_report(results: List[Any], path: Path) -> None:
+    """Write benchmark results as JSON for comparison between releases."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(build_report(results), f, indent=2)
@@ -0,0 +1,187 @@
+"""Content-addressed on-disk cache of chunk lists."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from . import __version__
+
+# Default maximum cache size in megabytes
+DEFAULT_MAX_MB = 512
+
+_READ_BLOCK_SIZE = 1024 * 1024
+
+
+class CacheInfo(NamedTuple):
+    """Size statistics of a chunk cache."""
+
+    entries: int
+    total_bytes: int
+    max_bytes: int
+    directory: Path
+
+
+class ChunkCache:
+    """On-disk cache of chunk lists keyed by file content and split settings.
+
+    Entries are JSON files named by a SHA-256 of the file bytes, model,
+    capacity, file type and cut-it version, so any change to the input or
+    the settings misses the cache. Reading an entry marks it as recently
+    used; once the cache grows past ``max_bytes`` the least recently used
+    entries are evicted.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        """Initialize chunk cache.
+
+        Args:
+            directory: Cache directory (defaults to ~/.cut-it/cache)
+            max_bytes: Size above which least recently used entries are evicted
+        """
+        self.directory = directory or Path.home() / ".cut-it" / "cache"
+        self.max_bytes = max_bytes
+        self._total_bytes: Optional[int] = None
+
+    @staticmethod
+    def make_key(
+        source: Union[bytes, Path],
+        model: str,
+        capacity: Union[int, Tuple[int, int]],
+        file_type: str,
+        overlap: int = 0
+    ) -> str:
+        """Compute the cache key for file content and split settings.
+
+        Args:
+            source: File content, or a path to hash in blocks
+            model: Tiktoken model name for tokenization
+            capacity: Maximum chunk size (int) or range (tuple)
+            file_type: Type of file being processed (text, markdown, code)
+            overlap: Tokens shared by consecutive chunks
+
+        Returns:
+            Hex digest identifying the chunk list
+        """
+        size: Union[int, List[int]] = list(capacity) if isinstance(capacity, (list, tuple)) else capacity
+        # Overlap is only part of the key when set, so existing keys stay valid
+        settings = json.dumps([__version__, model, size, file_type] + ([overlap] if overlap else []))
+
+        digest = hashlib.sha256(settings.encode('utf-8'))
+        digest.update(b"\0")
+        if isinstance(source, bytes):
+            digest.update(source)
+        else:
+            with open(source, 'rb') as f:
+                for block in iter(lambda: f.read(_READ_BLOCK_SIZE), b""):
+                    digest.update(block)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _entries(self) -> Iterator[Tuple[Path, os.stat_result]]:
+        if not self.directory.exists():
+            return
+        for entry_path in self.directory.glob("*/*.json"):
+            try:
+                yield entry_path, entry_path.stat()
+            except FileNotFoundError:
+                continue
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """Get a cached chunk list, or None on a miss."""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                chunks = json.load(f)
+            os.utime(entry_path)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return chunks if isinstance(chunks, list) else None
+
+    def put(self, key: str, chunks: List[str]) -> None:
+        """Store a chunk list, evicting old entries if the cache is full."""
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so concurrent readers never see partial entries
+        fd, temp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(chunks, f, ensure_ascii=False)
+            os.replace(temp_name, entry_path)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+
+        if self._total_bytes is None:
+            self._total_bytes = self.stats().total_bytes
+        else:
+            self._total_bytes += entry_path.stat().st_size
+        if self._total_bytes > self.max_bytes:
+            self.prune()
+
+    def stats(self) -> CacheInfo:
+        """Get the number of entries and total size of the cache."""
+        entries = 0
+        total_bytes = 0
+        for _, stat in self._entries():
+            entries += 1
+            total_bytes += stat.st_size
+        return CacheInfo(entries, total_bytes, self.max_bytes, self.directory)
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """Evict least recently used entries until the cache fits.
+
+        Args:
+            max_bytes: Target size (defaults to the cache's ``max_bytes``)
+
+        Returns:
+            Number of entries removed
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        total_bytes = sum(stat.st_size for _, stat in entries)
+
+        removed = 0
+        for entry_path, stat in entries:
+            if total_bytes <= limit:
+                break
+            try:
+                entry_path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+            total_bytes -= stat.st_size
+
+        self._total_bytes = total_bytes
+        return removed
+
+    def clear(self) -> int:
+        """Remove every entry from the cache.
+
+        Returns:
+            Number of entries removed
+        """
+        return self.prune(max_bytes=0)
+
+
+def store_chunks(cache: ChunkCache, key: str, chunks: Iterable[str]) -> Iterator[str]:
+    """Pass chunks through while collecting them, caching the list once exhausted.
+
+    Args:
+        cache: Cache to store the chunk list in
+        key: Cache key of the source
+        chunks: Chunks produced by splitting the source
+
+    Yields:
+        The chunks, unchanged
+    """
+    collected = []
+    for chunk in chunks:
+        collected.append(chunk)
+        yield chunk
+    cache.put(key, collected)
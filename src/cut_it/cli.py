@@ -1,15 +1,22 @@
 """Command-line interface for cut-it."""
 
+import os
+import sys
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import IO, Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, cast
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from .cache import ChunkCache, store_chunks
 from .config import ConfigManager, Config
-from .splitter import TextProcessor
-from .formatter import TaskFormatter
+from .formatter import TaskDocument, TaskFormatter, replace_file
 from .localization import get_messages
+from .timing import StageTimer
+
+# Modules that load the native splitter, multiprocessing or rich's progress
+# and table renderers are imported inside the commands that need them, so
+# --help, config-cmd, status and cache start without them.
 
 app = typer.Typer(
     name="cut-it",
@@ -17,6 +24,16 @@ app = typer.Typer(
     rich_markup_mode="rich"
 )
 console = Console()
+err_console = Console(stderr=True)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the text processor on first access (PEP 562)."""
+    if name == "TextProcessor":
+        from .splitter import TextProcessor
+        globals()[name] = TextProcessor
+        return TextProcessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_file_type(file_path: Path) -> str:
@@ -43,13 +60,22 @@ def get_file_type(file_path: Path) -> str:
 
 @app.command()
 def process(
-    file_path: str = typer.Argument(..., help="Path to the text file to process"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path (optional)"),
+    file_paths: List[str] = typer.Argument(..., help="Text files, directories or glob patterns to process ('-' reads stdin)"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path ('-' for stdout), or output directory for multiple files (optional)"),
     chunk_size: Optional[Tuple[int, int]] = typer.Option(None, "--size", "-s", help="Chunk size range (min,max)"),
+    overlap: Optional[int] = typer.Option(None, "--overlap", min=0, help="Tokens each chunk shares with the previous one"),
     model: Optional[str] = typer.Option(None, "--model", "-m", help="Tiktoken model to use"),
     force_type: Optional[str] = typer.Option(None, "--type", "-t", help="Force file type (text, markdown, code)"),
+    output_format: str = typer.Option("markdown", "--format", "-f", help="Output format (markdown, jsonl)"),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Number of worker processes for multiple files"),
+    incremental: bool = typer.Option(False, "--incremental", "-i", help="Re-split only changed regions, keeping task status of unchanged chunks"),
+    cache: Optional[bool] = typer.Option(None, "--cache/--no-cache", help="Reuse chunks of unchanged files from the on-disk cache"),
+    timings: bool = typer.Option(False, "--timings", help="Print wall and CPU time spent in each stage"),
+    profile: Optional[str] = typer.Option(None, "--profile", help="Write a cProfile profile of the run to this file"),
+    remote: bool = typer.Option(False, "--remote", help="Forward the work to a running 'cut-it serve' daemon"),
+    server: Optional[str] = typer.Option(None, "--server", help="Daemon socket path or host:port (default: ~/.cut-it/cut-it.sock)"),
 ) -> None:
-    """Process a text file and convert it into organized task chunks."""
+    """Process text files and convert them into organized task chunks."""
     
     # Load configuration
     config_manager = ConfigManager()
@@ -60,68 +86,428 @@ def process(
         config.chunk_size_min, config.chunk_size_max = chunk_size
     if model:
         config.model = model
+    if overlap is not None:
+        config.overlap = overlap
+    use_cache = config.cache_enabled if cache is None else cache
     
     # Get localized messages
     messages = get_messages(config.pt_br)
     
-    # Validate input file
-    input_path = Path(file_path)
-    if not input_path.exists():
-        console.print(f"[red]{messages['file_not_found']}: {file_path}[/red]")
+    from .batch import is_batch_pattern
+    from .jsonl import OUTPUT_FORMATS
+    
+    if output_format not in OUTPUT_FORMATS:
+        console.print(f"[red]{messages['invalid_format']}: {output_format}[/red]")
         raise typer.Exit(1)
+    _check_overlap((config.chunk_size_min, config.chunk_size_max), config.overlap, messages)
+    
+    timer = StageTimer()
+    with _profiling(profile):
+        if remote:
+            if output_format != "markdown":
+                console.print(f"[red]{messages['error']}: {messages['markdown_only']} (--remote)[/red]")
+                raise typer.Exit(1)
+            _process_remote(file_paths, output, config, force_type, server, messages)
+        elif len(file_paths) > 1 or is_batch_pattern(file_paths[0]):
+            cache_dir = config_manager.cache_dir if use_cache else None
+            with timer.stage("batch"):
+                _process_batch(file_paths, output, config, force_type, output_format, jobs, cache_dir, messages)
+        else:
+            _process_file(
+                file_paths[0], output, config, force_type, output_format, incremental,
+                config_manager.cache_dir if use_cache else None, timer, messages
+            )
+    
+    if profile:
+        console.print(f"{messages['profile_saved']} {profile}")
+    if timings:
+        _print_timings(timer, messages)
+
+
+def _check_overlap(chunk_size: Any, overlap: int, messages: dict) -> None:
+    """Exit with an error if the overlap does not fit the chunk size."""
+    from .splitter import validate_overlap
+    
+    try:
+        validate_overlap(chunk_size, overlap)
+    except ValueError as e:
+        console.print(f"[red]{messages['error']}: {e}[/red]")
+        raise typer.Exit(1)
+
+
+@contextmanager
+def _profiling(profile: Optional[str]) -> Iterator[None]:
+    """Run the enclosed block under cProfile, saving stats to ``profile`` if given."""
+    if not profile:
+        yield
+        return
+    
+    import cProfile
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(profile)
+
+
+def _print_timings(timer: StageTimer, messages: dict) -> None:
+    """Print the wall and CPU time of each stage."""
+    from rich.table import Table
+    
+    table = Table(title=messages['stage_timings'])
+    for column in ("Stage", "Wall (s)", "CPU (s)"):
+        table.add_column(column, justify="left" if column == "Stage" else "right")
+    
+    totals = timer.totals()
+    for timing in totals.values():
+        table.add_row(timing.stage, f"{timing.wall_seconds:.4f}", f"{timing.cpu_seconds:.4f}")
+    table.add_row(
+        "total",
+        f"{sum(timing.wall_seconds for timing in totals.values()):.4f}",
+        f"{sum(timing.cpu_seconds for timing in totals.values()):.4f}"
+    )
+    console.print(table)
+
+
+def _process_file(
+    file_path: str,
+    output: Optional[str],
+    config: Config,
+    force_type: Optional[str],
+    output_format: str,
+    incremental: bool,
+    cache_dir: Optional[Path],
+    timer: StageTimer,
+    messages: dict
+) -> None:
+    """Process a single file, or stdin when ``file_path`` is ``-``, into a task list."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from .grammars import language_for_path, splitter_type
+    from .incremental import process_incremental
+    from .jsonl import OUTPUT_SUFFIXES, write_jsonl
+    from .reader import read_stream_windows, read_windows
+    
+    # JSONL records carry offsets and token counts, so they are built from chunk records
+    jsonl = output_format == "jsonl"
+    from_stdin = file_path == "-"
+    # Piped input writes to stdout unless an output file is given
+    to_stdout = output == "-" or (from_stdin and not output)
+    # The task list owns stdout when streaming to it, so status goes to stderr
+    status_console = err_console if to_stdout else console
+    
+    if incremental and (from_stdin or to_stdout):
+        status_console.print(f"[red]{messages['error']}: {messages['incremental_needs_files']}[/red]")
+        raise typer.Exit(1)
+    if incremental and jsonl:
+        status_console.print(f"[red]{messages['error']}: {messages['markdown_only']} (--incremental)[/red]")
+        raise typer.Exit(1)
+    if incremental and config.overlap:
+        status_console.print(f"[red]{messages['error']}: {messages['no_overlap']} (--incremental)[/red]")
+        raise typer.Exit(1)
+    
+    # Validate input file
+    if from_stdin:
+        input_path = None
+        filename = "stdin"
+    else:
+        input_path = Path(file_path)
+        if not input_path.exists():
+            status_console.print(f"[red]{messages['file_not_found']}: {file_path}[/red]")
+            raise typer.Exit(1)
+        filename = input_path.name
     
     # Determine file type
-    file_type = force_type or get_file_type(input_path)
+    file_type = force_type or (get_file_type(input_path) if input_path is not None else 'text')
+    language = language_for_path(input_path) if file_type == 'code' and input_path is not None else None
     
     # Setup output path
-    if output:
+    if to_stdout:
+        output_path = None
+    elif output:
         output_path = Path(output)
     else:
-        output_path = input_path.with_suffix('.tasks.md')
+        # Piped input without an output file goes to stdout, so there is an input path here
+        output_path = cast(Path, input_path).with_suffix(OUTPUT_SUFFIXES[output_format])
     
     # Process file
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console,
+        console=status_console,
         transient=True
     ) as progress:
         
-        # Read file
+        # Read file, memory-mapping large files instead of loading them whole
         task = progress.add_task(messages['reading_file'], total=None)
-        try:
-            text_content = input_path.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            console.print(f"[red]{messages['encoding_error']}[/red]")
-            raise typer.Exit(1)
+        with timer.stage("reading"):
+            # Incremental updates diff the whole text, so they always read it into memory
+            use_mmap = (
+                not incremental
+                and input_path is not None
+                and input_path.stat().st_size > config.mmap_threshold_mb * 1024 * 1024
+            )
+            
+            # Unchanged files with the same settings skip splitting entirely;
+            # cached chunks have no offsets, so JSONL output always re-splits.
+            # Entries are whole chunk lists, so memory-mapped files bypass the
+            # cache to keep their memory bounded
+            chunk_cache = None
+            cached_chunks = None
+            if cache_dir is not None and not incremental and not jsonl and input_path is not None and not use_mmap:
+                chunk_cache = ChunkCache(cache_dir, config.cache_max_mb * 1024 * 1024)
+                cache_key = ChunkCache.make_key(
+                    input_path,
+                    config.model,
+                    (config.chunk_size_min, config.chunk_size_max),
+                    splitter_type(file_type, language),
+                    config.overlap
+                )
+                cached_chunks = chunk_cache.get(cache_key)
+            
+            if input_path is not None and not use_mmap and cached_chunks is None:
+                try:
+                    text_content = input_path.read_text(encoding='utf-8')
+                except UnicodeDecodeError:
+                    status_console.print(f"[red]{messages['encoding_error']}[/red]")
+                    raise typer.Exit(1)
         progress.remove_task(task)
         
         # Split text
         task = progress.add_task(messages['splitting_text'], total=None)
-        processor = TextProcessor(
-            chunk_size=(config.chunk_size_min, config.chunk_size_max),
-            model=config.model,
-            file_type=file_type
-        )
-        chunks = processor.split_text(text_content)
-        progress.remove_task(task)
-        
-        # Format as tasks
-        task = progress.add_task(messages['formatting_tasks'], total=None)
         formatter = TaskFormatter(pt_br=config.pt_br)
-        formatted_output = formatter.format_as_tasks(
-            chunks=chunks,
-            filename=input_path.name
-        )
+        with timer.stage("splitting"):
+            # Looked up on the module so the lazily imported class can be patched
+            processor = getattr(sys.modules[__name__], "TextProcessor")(
+                chunk_size=(config.chunk_size_min, config.chunk_size_max),
+                model=config.model,
+                file_type=file_type,
+                language=language,
+                overlap=config.overlap
+            )
+            if incremental:
+                # Re-split the changed region and rewrite the output in one step
+                result = process_incremental(
+                    processor,
+                    formatter,
+                    text_content,
+                    filename=filename,
+                    # Incremental runs were rejected above unless they write a file
+                    output_path=cast(Path, output_path)
+                )
+                chunk_count = len(result.records)
+            else:
+                if cached_chunks is not None:
+                    chunks = iter(cached_chunks)
+                elif from_stdin or use_mmap:
+                    # Stdin and large files are split window by window so memory stays bounded
+                    if from_stdin:
+                        windows = read_stream_windows(cast(BinaryIO, getattr(sys.stdin, "buffer", sys.stdin)))
+                    else:
+                        windows = read_windows(cast(Path, input_path))
+                    if jsonl:
+                        chunks = processor.iter_window_records(windows)
+                    else:
+                        chunks = processor.iter_window_chunks(windows)
+                elif jsonl:
+                    chunks = processor.iter_records(text_content)
+                else:
+                    chunks = processor.iter_chunks(text_content)
+                if chunk_cache is not None and cached_chunks is None:
+                    chunks = store_chunks(chunk_cache, cache_key, chunks)
+                # Chunks are produced lazily while formatting, so time them as splitting
+                chunks = timer.iterate("splitting", chunks)
         progress.remove_task(task)
         
-        # Save output
-        task = progress.add_task(messages['saving_file'], total=None)
-        output_path.write_text(formatted_output, encoding='utf-8')
-        progress.remove_task(task)
+        if not incremental:
+            # Format as tasks, streaming each task into the output file
+            task = progress.add_task(messages['formatting_tasks'], total=None)
+            try:
+                with timer.stage("formatting"), _open_output(output_path) as output_file:
+                    if jsonl:
+                        chunk_count = write_jsonl(chunks, output_file, source=filename)
+                    else:
+                        chunk_count = formatter.write_tasks(
+                            chunks=chunks,
+                            filename=filename,
+                            fp=output_file
+                        )
+            except UnicodeDecodeError:
+                # Memory-mapped and stdin windows are only decoded while streaming
+                if output_path is not None:
+                    output_path.unlink()
+                status_console.print(f"[red]{messages['encoding_error']}[/red]")
+                raise typer.Exit(1)
+            progress.remove_task(task)
     
-    console.print(f"[green]{messages['success']}[/green] {output_path}")
-    console.print(f"{messages['chunks_created']}: {len(chunks)}")
+    status_console.print(f"[green]{messages['success']}[/green] {output_path if output_path is not None else 'stdout'}")
+    status_console.print(f"{messages['chunks_created']}: {chunk_count}")
+    if incremental:
+        status_console.print(f"{messages['chunks_reused']}: {result.reused}")
+
+
+@contextmanager
+def _open_output(output_path: Optional[Path]) -> Iterator[IO]:
+    """Open the task output file, or stdout's byte stream when no path is given."""
+    if output_path is None:
+        sys.stdout.flush()
+        stream = getattr(sys.stdout, "buffer", sys.stdout)
+        yield stream
+        stream.flush()
+        return
+    
+    with output_path.open('w', encoding='utf-8') as output_file:
+        yield output_file
+
+
+def _process_remote(
+    file_paths: List[str],
+    output: Optional[str],
+    config: Config,
+    force_type: Optional[str],
+    server: Optional[str],
+    messages: dict
+) -> None:
+    """Process a single file or stdin on a running daemon and save its task list."""
+    from .grammars import language_for_path
+    from .server import RemoteClient, ServerError, parse_address
+    
+    if len(file_paths) > 1:
+        console.print(f"[red]{messages['error']}: {messages['remote_single_file']}[/red]")
+        raise typer.Exit(1)
+    
+    from_stdin = file_paths[0] == "-"
+    # Same stdin/stdout conventions as local processing
+    to_stdout = output == "-" or (from_stdin and not output)
+    status_console = err_console if to_stdout else console
+    
+    try:
+        if from_stdin:
+            input_path = None
+            filename = "stdin"
+            # The daemon splits a whole text per request, so stdin is read in full
+            text_content = getattr(sys.stdin, "buffer", sys.stdin).read()
+            if isinstance(text_content, bytes):
+                text_content = text_content.decode('utf-8')
+        else:
+            input_path = Path(file_paths[0])
+            if not input_path.is_file():
+                status_console.print(f"[red]{messages['file_not_found']}: {file_paths[0]}[/red]")
+                raise typer.Exit(1)
+            filename = input_path.name
+            text_content = input_path.read_text(encoding='utf-8')
+    except UnicodeDecodeError:
+        status_console.print(f"[red]{messages['encoding_error']}[/red]")
+        raise typer.Exit(1)
+    
+    if to_stdout:
+        output_path = None
+    elif output:
+        output_path = Path(output)
+    else:
+        output_path = cast(Path, input_path).with_suffix('.tasks.md')
+    
+    address = parse_address(server)
+    file_type = force_type or (get_file_type(input_path) if input_path is not None else 'text')
+    language = language_for_path(input_path) if file_type == "code" and input_path is not None else None
+    try:
+        with RemoteClient(address) as client:
+            result = client.process(
+                text_content,
+                filename,
+                file_type=file_type,
+                language=language,
+                chunk_size=[config.chunk_size_min, config.chunk_size_max],
+                overlap=config.overlap,
+                model=config.model,
+                pt_br=config.pt_br
+            )
+    except (OSError, ServerError) as e:
+        status_console.print(f"[red]{messages['server_unavailable']}: {e}[/red]")
+        raise typer.Exit(1)
+    
+    with _open_output(output_path) as output_file:
+        # Stdout is written as UTF-8 bytes, like local processing
+        output_file.write(result["content"] if output_path is not None else result["content"].encode('utf-8'))
+    status_console.print(f"[green]{messages['success']}[/green] {output_path if output_path is not None else 'stdout'}")
+    status_console.print(f"{messages['chunks_created']}: {result['chunks']}")
+
+
+def _process_batch(
+    file_paths: List[str],
+    output: Optional[str],
+    config: Config,
+    force_type: Optional[str],
+    output_format: str,
+    jobs: int,
+    cache_dir: Optional[Path],
+    messages: dict
+) -> None:
+    """Process many files, reporting per-file failures without aborting."""
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+    from .batch import BatchItem, BatchSettings, expand_inputs, plan_outputs, run_batch
+    from .jsonl import OUTPUT_SUFFIXES
+    
+    inputs = expand_inputs(file_paths)
+    missing = [path for path in inputs if not path.is_file()]
+    for path in missing:
+        console.print(f"[red]{messages['file_not_found']}: {path}[/red]")
+    inputs = [path for path in inputs if path.is_file()]
+    if not inputs:
+        console.print(f"[red]{messages['no_input_files']}[/red]")
+        raise typer.Exit(1)
+    
+    try:
+        pairs = plan_outputs(inputs, Path(output) if output else None, OUTPUT_SUFFIXES[output_format])
+    except ValueError as e:
+        console.print(f"[red]{messages['error']}: {e}[/red]")
+        raise typer.Exit(1)
+    
+    items = [
+        BatchItem(input_path, output_path, force_type or get_file_type(input_path))
+        for input_path, output_path in pairs
+    ]
+    settings = BatchSettings(
+        chunk_size_min=config.chunk_size_min,
+        chunk_size_max=config.chunk_size_max,
+        overlap=config.overlap,
+        model=config.model,
+        pt_br=config.pt_br,
+        cache_dir=cache_dir,
+        cache_max_mb=config.cache_max_mb,
+        output_format=output_format
+    )
+    
+    failures = len(missing)
+    total_chunks = 0
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+        transient=True
+    ) as progress:
+        task = progress.add_task(messages['processing_files'], total=len(items))
+        for result in run_batch(items, settings, jobs=jobs):
+            if result.ok:
+                total_chunks += result.chunks
+                console.print(f"[green]✓[/green] {result.output_path} ({result.chunks})")
+            else:
+                failures += 1
+                console.print(f"[red]✗ {result.input_path}: {result.error}[/red]")
+            progress.advance(task)
+    
+    console.print(
+        messages['batch_summary'].format(
+            processed=len(items) + len(missing) - failures,
+            failed=failures,
+            chunks=total_chunks
+        )
+    )
+    if failures:
+        raise typer.Exit(1)
 
 
 @app.command()
@@ -131,6 +517,10 @@ def config_cmd(
     cli: Optional[bool] = typer.Option(None, "--cli", help="Enable/disable CLI mode"),
     model: Optional[str] = typer.Option(None, "--model", help="Set default tiktoken model"),
     size: Optional[Tuple[int, int]] = typer.Option(None, "--size", help="Set default chunk size range"),
+    overlap: Optional[int] = typer.Option(None, "--overlap", min=0, help="Set default chunk overlap in tokens"),
+    mmap_threshold: Optional[int] = typer.Option(None, "--mmap-threshold", min=0, help="Memory-map input files larger than this many MB"),
+    cache: Optional[bool] = typer.Option(None, "--cache/--no-cache", help="Enable/disable the on-disk chunk cache by default"),
+    cache_max_mb: Optional[int] = typer.Option(None, "--cache-max-size", min=0, help="Maximum chunk cache size in MB"),
 ) -> None:
     """Manage cut-it configuration settings."""
     
@@ -140,13 +530,16 @@ def config_cmd(
         config = config_manager.load()
         console.print("\n[bold]Current Configuration:[/bold]")
         console.print(f"Chunk size: {config.chunk_size_min}-{config.chunk_size_max}")
+        console.print(f"Chunk overlap: {config.overlap} tokens")
         console.print(f"Model: {config.model}")
         console.print(f"Portuguese (BR): {'enabled' if config.pt_br else 'disabled'}")
         console.print(f"CLI mode: {'enabled' if config.cli_mode else 'disabled'}")
+        console.print(f"Memory-map threshold: {config.mmap_threshold_mb} MB")
+        console.print(f"Chunk cache: {'enabled' if config.cache_enabled else 'disabled'} ({config.cache_max_mb} MB)")
         return
     
     # Update configuration
-    updates = {}
+    updates: Dict[str, Any] = {}
     if pt_br is not None:
         updates['pt_br'] = pt_br
     if cli is not None:
@@ -155,6 +548,14 @@ def config_cmd(
         updates['model'] = model
     if size is not None:
         updates['chunk_size_min'], updates['chunk_size_max'] = size
+    if overlap is not None:
+        updates['overlap'] = overlap
+    if mmap_threshold is not None:
+        updates['mmap_threshold_mb'] = mmap_threshold
+    if cache is not None:
+        updates['cache_enabled'] = cache
+    if cache_max_mb is not None:
+        updates['cache_max_mb'] = cache_max_mb
     
     if updates:
         config = config_manager.update(**updates)
@@ -164,6 +565,583 @@ def config_cmd(
         console.print("[yellow]No configuration changes specified. Use --show to view current settings.[/yellow]")
 
 
+def parse_task_numbers(spec: str) -> List[int]:
+    """Parse a task selection such as ``3-40,55`` into task numbers.
+    
+    Args:
+        spec: Comma-separated task numbers and inclusive ranges
+        
+    Returns:
+        Selected task numbers in ascending order
+        
+    Raises:
+        ValueError: If the selection is malformed
+    """
+    numbers: Set[int] = set()
+    for part in spec.split(','):
+        part = part.strip()
+        first, dash, last = part.partition('-')
+        if not first.strip().isdigit() or (dash and not last.strip().isdigit()):
+            raise ValueError(f"invalid task selection '{part}'")
+        start = int(first)
+        end = int(last) if last else start
+        if start < 1 or end < start:
+            raise ValueError(f"invalid task range '{part}'")
+        numbers.update(range(start, end + 1))
+    return sorted(numbers)
+
+
+def _load_task_document(content: str, pt_br: bool) -> TaskDocument:
+    """Parse a task file, falling back to the other language's labels."""
+    document = TaskFormatter(pt_br=pt_br).parse(content)
+    if not len(document):
+        other = TaskFormatter(pt_br=not pt_br).parse(content)
+        if len(other):
+            return other
+    return document
+
+
+@app.command()
+def status(
+    file_path: str = typer.Argument(..., help="Task file (.tasks.md) to inspect or update"),
+    tasks: Optional[str] = typer.Argument(None, help="Task numbers and ranges, e.g. 3-40,55 (default: all tasks)"),
+    set_status: Optional[str] = typer.Option(None, "--set", help="New status for the selected tasks (pending, started, completed)"),
+) -> None:
+    """Show or update the status of tasks in a task file."""
+    config = ConfigManager().load()
+    messages = get_messages(config.pt_br)
+    
+    path = Path(file_path)
+    if not path.exists():
+        console.print(f"[red]{messages['file_not_found']}: {file_path}[/red]")
+        raise typer.Exit(1)
+    
+    if set_status is not None and set_status.lower() not in ("pending", "started", "completed"):
+        console.print(f"[red]{messages['invalid_status']}: {set_status}[/red]")
+        raise typer.Exit(1)
+    
+    try:
+        selected = parse_task_numbers(tasks) if tasks else None
+    except ValueError as e:
+        console.print(f"[red]{messages['error']}: {e}[/red]")
+        raise typer.Exit(1)
+    
+    with path.open('r', encoding='utf-8', newline='') as f:
+        document = _load_task_document(f.read(), config.pt_br)
+    if selected is None:
+        selected = document.task_numbers
+    
+    missing = [number for number in selected if number not in document]
+    if missing:
+        console.print(f"[yellow]{messages['tasks_not_found']}: {', '.join(map(str, missing))}[/yellow]")
+    
+    if set_status is None:
+        for number in selected:
+            if number in document:
+                console.print(f"{number}: {document.get_status(number) or '-'}")
+        return
+    
+    document.update_statuses({number: set_status for number in selected})
+    replace_file(path, document.to_string())
+    console.print(f"[green]{messages['tasks_updated']}: {len(selected) - len(missing)}[/green]")
+
+
+@app.command()
+def bench(
+    sizes: str = typer.Option("1KB,100KB,1MB", "--sizes", help="Comma-separated corpus sizes, e.g. 1KB,10MB,500MB"),
+    kinds: str = typer.Option("text,markdown,code", "--kinds", help="Comma-separated corpus kinds (text, markdown, code, paragraphs)"),
+    stages: str = typer.Option("split,fallback,format", "--stages", help="Comma-separated stages to time (split, fallback, format)"),
+    repeat: int = typer.Option(3, "--repeat", "-r", min=1, help="Runs per stage; throughput uses the fastest run"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Write results as JSON to this file"),
+    chunk_size: Optional[Tuple[int, int]] = typer.Option(None, "--size", "-s", help="Chunk size range (min,max)"),
+    model: Optional[str] = typer.Option(None, "--model", "-m", help="Tiktoken model to use"),
+    scaling: bool = typer.Option(False, "--scaling", help="Compare serial, thread and process splitting of a batch instead"),
+    workers: str = typer.Option("1,2,4,8,16,32", "--workers", help="Comma-separated worker counts for --scaling"),
+    documents: int = typer.Option(32, "--documents", min=1, help="Number of documents in the --scaling batch"),
+    document_size: str = typer.Option("256KB", "--document-size", help="Size of each document in the --scaling batch"),
+) -> None:
+    """Benchmark splitting and formatting on synthetic corpora."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+    from .bench import CORPUS_KINDS, STAGES, format_size, parse_size, run_benchmarks, write_report
+    
+    config = ConfigManager().load()
+    messages = get_messages(config.pt_br)
+    
+    kind_list = [kind.strip() for kind in kinds.split(',') if kind.strip()]
+    stage_list = [stage.strip() for stage in stages.split(',') if stage.strip()]
+    try:
+        size_list = [parse_size(size) for size in sizes.split(',') if size.strip()]
+        for name, allowed in ((kind_list, CORPUS_KINDS), (stage_list, STAGES)):
+            unknown = [value for value in name if value not in allowed]
+            if unknown:
+                raise ValueError(f"unknown value '{unknown[0]}', expected one of {', '.join(allowed)}")
+        worker_list = [int(count) for count in workers.split(',') if count.strip()]
+        if any(count < 1 for count in worker_list):
+            raise ValueError("worker counts must be positive")
+        size_per_document = parse_size(document_size)
+    except ValueError as e:
+        console.print(f"[red]{messages['error']}: {e}[/red]")
+        raise typer.Exit(1)
+    
+    chunk_size = chunk_size or (config.chunk_size_min, config.chunk_size_max)
+    model = model or config.model
+    if scaling:
+        _bench_scaling(
+            worker_list, documents, size_per_document, kind_list[0] if kind_list else "text",
+            chunk_size, model, output, messages
+        )
+        return
+    
+    table = Table(title=messages['bench_title'])
+    for column in ("Kind", "Size", "Stage", "Best (s)", "Mean (s)", "Chunks", "MB/s", "Chunks/s", "Process peak RSS (MB)"):
+        table.add_column(column, justify="left" if column in ("Kind", "Stage") else "right")
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True
+    ) as progress:
+        task = progress.add_task(messages['running_benchmarks'], total=None)
+        results = run_benchmarks(
+            size_list,
+            kinds=kind_list,
+            stages=stage_list,
+            chunk_size=chunk_size,
+            model=model,
+            repeat=repeat
+        )
+        progress.remove_task(task)
+    
+    for result in results:
+        table.add_row(
+            result.kind,
+            format_size(result.size_bytes),
+            result.stage,
+            f"{result.best_seconds:.4f}",
+            f"{result.mean_seconds:.4f}",
+            str(result.chunks),
+            f"{result.mb_per_s:.2f}",
+            f"{result.chunks_per_s:.0f}",
+            f"{result.peak_rss_mb:.0f}" if result.peak_rss_mb is not None else "-"
+        )
+    console.print(table)
+    
+    if output:
+        write_report(results, Path(output))
+        console.print(f"[green]{messages['bench_saved']}[/green] {output}")
+
+
+@app.command()
+def stats(
+    file_paths: List[str] = typer.Argument(..., help="Text files, directories or glob patterns to summarize"),
+    chunk_size: Optional[Tuple[int, int]] = typer.Option(None, "--size", "-s", help="Chunk size range (min,max)"),
+    overlap: Optional[int] = typer.Option(None, "--overlap", min=0, help="Tokens each chunk shares with the previous one"),
+    model: Optional[str] = typer.Option(None, "--model", "-m", help="Tiktoken model to use"),
+    force_type: Optional[str] = typer.Option(None, "--type", "-t", help="Force file type (text, markdown, code)"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Write the corpus report as JSON to this file"),
+    engine: str = typer.Option("auto", "--engine", help="Statistics engine (auto, numpy, python)"),
+) -> None:
+    """Report chunk size and token statistics across a corpus of files."""
+    import json
+    from rich.markup import escape
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+    from .batch import expand_inputs
+    from .grammars import language_for_path
+    from .splitter import TextProcessor
+    from .stats import ENGINES, CorpusStats
+    
+    config = ConfigManager().load()
+    messages = get_messages(config.pt_br)
+    chunk_size = chunk_size or (config.chunk_size_min, config.chunk_size_max)
+    overlap = config.overlap if overlap is None else overlap
+    _check_overlap(chunk_size, overlap, messages)
+    if engine not in ENGINES:
+        console.print(f"[red]{messages['error']}: unknown engine '{engine}', expected one of {', '.join(ENGINES)}[/red]")
+        raise typer.Exit(1)
+    
+    inputs = [path for path in expand_inputs(file_paths) if path.is_file()]
+    if not inputs:
+        console.print(f"[red]{messages['no_input_files']}[/red]")
+        raise typer.Exit(1)
+    
+    processors: Dict[Tuple[str, Optional[str]], TextProcessor] = {}
+    corpus = CorpusStats()
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+        transient=True
+    ) as progress:
+        task = progress.add_task(messages['processing_files'], total=len(inputs))
+        for path in inputs:
+            file_type = force_type or get_file_type(path)
+            language = language_for_path(path) if file_type == "code" else None
+            processor = processors.get((file_type, language))
+            if processor is None:
+                processor = processors[(file_type, language)] = TextProcessor(
+                    chunk_size=chunk_size,
+                    model=model or config.model,
+                    file_type=file_type,
+                    language=language,
+                    overlap=overlap
+                )
+            try:
+                text_content = path.read_text(encoding='utf-8')
+            except UnicodeDecodeError:
+                console.print(f"[red]✗ {path}: {messages['encoding_error']}[/red]")
+            else:
+                corpus.add_records(processor.iter_records(text_content), source=str(path))
+            progress.advance(task)
+    
+    try:
+        report = corpus.report(engine=engine)
+    except ImportError as e:
+        console.print(f"[red]{messages['error']}: {e}[/red]")
+        raise typer.Exit(1)
+    
+    table = Table(title=messages['corpus_stats'])
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    for key in ("files", "total_chunks", "total_characters", "average_chunk_size", "min_chunk_size", "max_chunk_size"):
+        table.add_row(key, str(report[key]))
+    for name, value in report["chunk_size_percentiles"].items():
+        table.add_row(f"chunk_size_{name}", f"{value:.1f}")
+    tokens = report["tokens"]
+    if tokens is not None:
+        for key in ("total_tokens", "min_tokens", "max_tokens"):
+            table.add_row(key, str(tokens[key]))
+        table.add_row("mean_tokens", f"{tokens['mean_tokens']:.1f}")
+        for name, value in tokens["percentiles"].items():
+            table.add_row(f"tokens_{name}", f"{value:.1f}")
+    console.print(table)
+    if tokens is None:
+        console.print(f"[yellow]{escape(messages['tokens_unavailable'])}[/yellow]")
+    
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        console.print(f"[green]{messages['bench_saved']}[/green] {output}")
+
+
+@app.command()
+def ingest(
+    directory: Path = typer.Argument(..., help="Source tree to walk and chunk"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Directory mirroring the tree for the outputs, or the JSONL file with --combined ('-' for stdout)"),
+    combined: bool = typer.Option(False, "--combined", help="Write every chunk to a single JSONL output instead of one output per file"),
+    output_format: str = typer.Option("markdown", "--format", "-f", help="Format of per-file outputs (markdown, jsonl)"),
+    extensions: Optional[List[str]] = typer.Option(None, "--ext", "-e", help="Only ingest files with these extensions, e.g. py,md (repeatable)"),
+    max_size: Optional[str] = typer.Option(None, "--max-size", help="Skip files larger than this, e.g. 512KB or 1MB"),
+    gitignore: bool = typer.Option(True, "--gitignore/--no-gitignore", help="Skip files matched by .gitignore"),
+    chunk_size: Optional[Tuple[int, int]] = typer.Option(None, "--size", "-s", help="Chunk size range (min,max)"),
+    overlap: Optional[int] = typer.Option(None, "--overlap", min=0, help="Tokens each chunk shares with the previous one"),
+    model: Optional[str] = typer.Option(None, "--model", "-m", help="Tiktoken model to use"),
+    force_type: Optional[str] = typer.Option(None, "--type", "-t", help="Force file type (text, markdown, code)"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", min=1, help="Number of worker processes (default: one per CPU)"),
+    cache: Optional[bool] = typer.Option(None, "--cache/--no-cache", help="Reuse chunks of unchanged files from the on-disk cache"),
+) -> None:
+    """Walk a source tree and chunk every file in parallel."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from .batch import BatchItem, BatchSettings, run_stream
+    from .bench import parse_size
+    from .ingest import Throughput, output_path
+    from .walk import walk_files
+    from .jsonl import OUTPUT_FORMATS, OUTPUT_SUFFIXES, write_jsonl
+    
+    config_manager = ConfigManager()
+    config = config_manager.load()
+    if chunk_size:
+        config.chunk_size_min, config.chunk_size_max = chunk_size
+    if model:
+        config.model = model
+    if overlap is not None:
+        config.overlap = overlap
+    use_cache = config.cache_enabled if cache is None else cache
+    messages = get_messages(config.pt_br)
+    
+    if output_format not in OUTPUT_FORMATS:
+        console.print(f"[red]{messages['invalid_format']}: {output_format}[/red]")
+        raise typer.Exit(1)
+    _check_overlap((config.chunk_size_min, config.chunk_size_max), config.overlap, messages)
+    if not directory.is_dir():
+        console.print(f"[red]{messages['file_not_found']}: {directory}[/red]")
+        raise typer.Exit(1)
+    try:
+        max_bytes = parse_size(max_size) if max_size else None
+    except ValueError as e:
+        console.print(f"[red]{messages['error']}: {e}[/red]")
+        raise typer.Exit(1)
+    
+    root = Path(os.path.abspath(directory))
+    suffixes = [suffix.strip() for value in extensions or [] for suffix in value.split(",") if suffix.strip()]
+    to_stdout = combined and output in (None, "-")
+    status_console = err_console if to_stdout else console
+    combined_path = Path(output) if combined and output and not to_stdout else None
+    output_dir = Path(output) if output and not combined else None
+    
+    sources = walk_files(
+        root,
+        extensions=suffixes or None,
+        max_size=max_bytes,
+        gitignore=gitignore,
+        exclude=[path for path in (combined_path, output_dir) if path is not None]
+    )
+    suffix = OUTPUT_SUFFIXES[output_format]
+    # Items are built as the walker finds files, so work starts immediately
+    items = (
+        BatchItem(
+            source.path,
+            None if combined else output_path(source, suffix, output_dir),
+            force_type or get_file_type(source.path),
+            source.size
+        )
+        for source in sources
+    )
+    settings = BatchSettings(
+        chunk_size_min=config.chunk_size_min,
+        chunk_size_max=config.chunk_size_max,
+        overlap=config.overlap,
+        model=config.model,
+        pt_br=config.pt_br,
+        cache_dir=config_manager.cache_dir if use_cache else None,
+        cache_max_mb=config.cache_max_mb,
+        output_format="jsonl" if combined else output_format
+    )
+    
+    throughput = Throughput()
+    with ExitStack() as stack:
+        combined_file = stack.enter_context(_open_output(combined_path)) if combined else None
+        progress = stack.enter_context(Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TextColumn("{task.completed} files"),
+            TextColumn("{task.fields[rate]}"),
+            console=status_console,
+            transient=True
+        ))
+        task = progress.add_task(messages['ingesting_files'], total=None, rate="")
+        for result in run_stream(items, settings, jobs=jobs or os.cpu_count() or 1):
+            throughput.add(result.size, result.chunks, result.ok)
+            if not result.ok:
+                status_console.print(f"[red]✗ {result.input_path}: {result.error}[/red]")
+            elif combined_file is not None and result.records is not None:
+                write_jsonl(result.records, combined_file, source=result.input_path.relative_to(root).as_posix())
+            progress.update(task, advance=1, rate=throughput.describe())
+    
+    if not throughput.files:
+        status_console.print(f"[red]{messages['no_input_files']}[/red]")
+        raise typer.Exit(1)
+    status_console.print(
+        messages['ingest_summary'].format(
+            files=throughput.files - throughput.failures,
+            failed=throughput.failures,
+            chunks=throughput.chunks,
+            megabytes=throughput.bytes / (1024 * 1024),
+            seconds=throughput.elapsed,
+            rate=throughput.describe()
+        )
+    )
+    if throughput.failures:
+        raise typer.Exit(1)
+
+
+@app.command()
+def watch(
+    directory: Path = typer.Argument(..., help="Directory to watch recursively"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Directory mirroring the tree for the outputs (default: next to each file)"),
+    extensions: Optional[List[str]] = typer.Option(None, "--ext", "-e", help="Only watch files with these extensions, e.g. md,txt (repeatable)"),
+    gitignore: bool = typer.Option(True, "--gitignore/--no-gitignore", help="Ignore files matched by .gitignore"),
+    debounce: float = typer.Option(0.5, "--debounce", min=0.0, help="Seconds a file must stay unchanged before it is re-chunked"),
+    interval: float = typer.Option(1.0, "--interval", min=0.05, help="Seconds between scans when polling"),
+    polling: bool = typer.Option(False, "--polling", help="Poll for changes even when watchdog is installed"),
+    catch_up: bool = typer.Option(True, "--catch-up/--no-catch-up", help="First re-chunk files whose output is missing or older than the file"),
+    chunk_size: Optional[Tuple[int, int]] = typer.Option(None, "--size", "-s", help="Chunk size range (min,max)"),
+    overlap: Optional[int] = typer.Option(None, "--overlap", min=0, help="Tokens each chunk shares with the previous one"),
+    model: Optional[str] = typer.Option(None, "--model", "-m", help="Tiktoken model to use"),
+    force_type: Optional[str] = typer.Option(None, "--type", "-t", help="Force file type (text, markdown, code)"),
+) -> None:
+    """Re-chunk files into their task lists whenever they change."""
+    from .walk import walk_files
+    from .watch import Refresher, Watcher
+    
+    config = ConfigManager().load()
+    messages = get_messages(config.pt_br)
+    if not directory.is_dir():
+        console.print(f"[red]{messages['file_not_found']}: {directory}[/red]")
+        raise typer.Exit(1)
+    chunk_size = chunk_size or (config.chunk_size_min, config.chunk_size_max)
+    overlap = config.overlap if overlap is None else overlap
+    _check_overlap(chunk_size, overlap, messages)
+    
+    suffixes = [suffix.strip() for value in extensions or [] for suffix in value.split(",") if suffix.strip()]
+    output_dir = Path(output) if output else None
+    exclude = [output_dir] if output_dir else []
+    refresher = Refresher(
+        directory,
+        classify=lambda path: force_type or get_file_type(path),
+        chunk_size=chunk_size,
+        model=model or config.model,
+        pt_br=config.pt_br,
+        output_dir=output_dir,
+        overlap=overlap
+    )
+    watcher = Watcher(
+        directory,
+        extensions=suffixes or None,
+        gitignore=gitignore,
+        debounce=debounce,
+        interval=interval,
+        native=False if polling else None,
+        exclude=exclude
+    )
+    
+    def refresh(paths: Iterable[Path]) -> None:
+        for path in paths:
+            result = refresher.refresh(path)
+            if result.ok:
+                console.print(f"[green]✓[/green] {result.output_path} ({result.chunks}) {messages['refreshed']}")
+            else:
+                console.print(f"[red]✗ {result.input_path}: {result.error}[/red]")
+    
+    try:
+        with watcher:
+            if catch_up:
+                refresh(
+                    source.path
+                    for source in walk_files(directory, suffixes or None, gitignore=gitignore, exclude=exclude)
+                    if refresher.is_stale(source.path)
+                )
+            mode = "native" if watcher.native else "polling"
+            console.print(f"[green]{messages['watching']}[/green] {directory} ({mode})")
+            for paths in watcher.batches():
+                refresh(paths)
+    except KeyboardInterrupt:
+        pass
+    console.print(messages['watch_stopped'])
+
+
+@app.command()
+def serve(
+    socket_path: Optional[str] = typer.Option(None, "--socket", help="Unix socket path to listen on (default: ~/.cut-it/cut-it.sock)"),
+    port: Optional[int] = typer.Option(None, "--port", min=1, max=65535, help="Listen on this localhost TCP port instead of a Unix socket"),
+) -> None:
+    """Keep splitters warm and answer split/format requests on a local socket."""
+    from .server import DEFAULT_HOST, ServerError, format_address, parse_address, serve as serve_forever
+    
+    config = ConfigManager().load()
+    messages = get_messages(config.pt_br)
+    address = (DEFAULT_HOST, port) if port else parse_address(socket_path)
+    
+    console.print(f"[green]{messages['server_listening']}[/green] {format_address(address)}")
+    try:
+        serve_forever(address)
+    except (OSError, ServerError) as e:
+        console.print(f"[red]{messages['error']}: {e}[/red]")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        pass
+    console.print(messages['server_stopped'])
+
+
+def _bench_scaling(
+    worker_counts: List[int],
+    documents: int,
+    size_bytes: int,
+    kind: str,
+    chunk_size: Tuple[int, int],
+    model: str,
+    output: Optional[str],
+    messages: dict
+) -> None:
+    """Run the serial/thread/process scaling benchmark and print its results."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+    from .bench import corpus_processor, run_scaling_benchmark, write_report
+    from .splitter import available_cores, threads_scale
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True
+    ) as progress:
+        task = progress.add_task(messages['running_benchmarks'], total=None)
+        results = run_scaling_benchmark(
+            worker_counts,
+            documents=documents,
+            size_bytes=size_bytes,
+            kind=kind,
+            chunk_size=chunk_size,
+            model=model
+        )
+        progress.remove_task(task)
+    
+    table = Table(title=f"{messages['bench_title']} ({available_cores()} cores)")
+    for column in ("Mode", "Workers", "Seconds", "MB/s", "Speedup"):
+        table.add_column(column, justify="left" if column == "Mode" else "right")
+    for result in results:
+        table.add_row(
+            result.mode,
+            str(result.workers),
+            f"{result.seconds:.4f}",
+            f"{result.mb_per_s:.2f}",
+            f"{result.speedup:.2f}x"
+        )
+    console.print(table)
+    scales = threads_scale(corpus_processor(kind, chunk_size, model).splitter)
+    console.print(f"{messages['threads_scale']}: {'yes' if scales else 'no'}")
+    
+    if output:
+        write_report(results, Path(output))
+        console.print(f"[green]{messages['bench_saved']}[/green] {output}")
+
+
+cache_app = typer.Typer(help="Inspect and manage the on-disk chunk cache")
+app.add_typer(cache_app, name="cache")
+
+
+def _open_cache() -> Tuple[ChunkCache, dict]:
+    """Open the configured chunk cache with localized messages."""
+    config_manager = ConfigManager()
+    config = config_manager.load()
+    cache = ChunkCache(config_manager.cache_dir, config.cache_max_mb * 1024 * 1024)
+    return cache, get_messages(config.pt_br)
+
+
+@cache_app.command("stats")
+def cache_stats() -> None:
+    """Show the number and total size of cached chunk lists."""
+    cache, messages = _open_cache()
+    info = cache.stats()
+    console.print(f"{messages['cache_entries']}: {info.entries}")
+    console.print(
+        f"{messages['cache_size']}: {info.total_bytes / (1024 * 1024):.1f} MB"
+        f" / {info.max_bytes // (1024 * 1024)} MB"
+    )
+    console.print(f"{info.directory}")
+
+
+@cache_app.command("prune")
+def cache_prune(
+    max_size: Optional[int] = typer.Option(None, "--max-size", min=0, help="Target cache size in MB (defaults to the configured maximum)"),
+) -> None:
+    """Evict least recently used entries until the cache fits."""
+    cache, messages = _open_cache()
+    removed = cache.prune(None if max_size is None else max_size * 1024 * 1024)
+    console.print(f"{messages['cache_pruned']}: {removed}")
+
+
+@cache_app.command("clear")
+def cache_clear() -> None:
+    """Remove every cached chunk list."""
+    cache, messages = _open_cache()
+    console.print(f"{messages['cache_pruned']}: {cache.clear()}")
+
+
 @app.command()
 def update() -> None:
     """Update cut-it configuration or check for updates."""
@@ -12,9 +12,13 @@ class Config:
     
     chunk_size_min: int = 300
     chunk_size_max: int = 500
+    overlap: int = 0
     model: str = "gpt-4"
     pt_br: bool = False
     cli_mode: bool = True
+    mmap_threshold_mb: int = 64
+    cache_enabled: bool = False
+    cache_max_mb: int = 512
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
@@ -33,6 +37,11 @@ class ConfigManager:
         self.config_path = config_path or Path.home() / ".cut-it" / "config.json"
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
     
+    @property
+    def cache_dir(self) -> Path:
+        """Directory of the on-disk chunk cache, next to the config file."""
+        return self.config_path.parent / "cache"
+    
     def load(self) -> Config:
         """Load configuration from file or create default."""
         if self.config_path.exists():
@@ -1,6 +1,45 @@
 """Task formatting functionality for converting text chunks into organized task lists."""
 
-from typing import List, Dict, Any
+import io
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Iterable, List, Dict, Any, Optional, Sequence, Union, cast
+
+# Task statuses in progress order
+_STATUSES = ("Pending", "Started", "Completed")
+
+
+def replace_file(path: Path, content: str) -> None:
+    """Atomically replace a file's content via a temporary file and rename.
+    
+    Readers and a crash mid-write see either the old or the new content,
+    never a truncated file.
+    """
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+        if path.exists():
+            os.chmod(temp_name, path.stat().st_mode & 0o777)
+        os.replace(temp_name, path)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
+def is_binary_stream(fp: Any) -> bool:
+    """Check whether a file object is written bytes rather than text.
+    
+    Text-mode wrappers such as ``tempfile.NamedTemporaryFile('w')`` are not
+    ``io.TextIOBase`` instances, so binary streams are recognized instead
+    and any other file object is treated as text.
+    """
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    mode = getattr(fp, 'mode', '')
+    return isinstance(mode, str) and 'b' in mode
 
 
 class TaskFormatter:
@@ -36,53 +75,104 @@ class TaskFormatter:
     
     def format_as_tasks(
         self, 
-        chunks: List[str], 
+        chunks: Iterable[str], 
         filename: str,
         initial_status: str = "Pending"
     ) -> str:
         """Format text chunks as organized task list.
         
         Args:
-            chunks: List of text chunks
+            chunks: Text chunks, either a list or a lazy iterator
             filename: Original filename
             initial_status: Initial status for all tasks
             
         Returns:
             Formatted markdown string
         """
-        if not chunks:
-            return f"# {filename}\n\n---\n\nNo content to process.\n\n---\n"
+        buffer = io.StringIO()
+        self.write_tasks(chunks, filename, buffer, initial_status=initial_status)
+        return buffer.getvalue()
+    
+    def write_tasks(
+        self,
+        chunks: Iterable[str],
+        filename: str,
+        fp: Union[IO[str], IO[bytes]],
+        initial_status: str = "Pending",
+        statuses: Optional[Sequence[str]] = None
+    ) -> int:
+        """Stream text chunks as an organized task list into a file object.
         
-        # Build the formatted output
-        output_lines = [f"# {filename}", ""]
+        Each task block is written as soon as its chunk arrives, so only one
+        chunk is held in memory at a time. The output is identical to
+        ``format_as_tasks``.
         
+        Args:
+            chunks: Text chunks, either a list or a lazy iterator
+            filename: Original filename
+            fp: Text or binary file object to write to (binary is UTF-8 encoded)
+            initial_status: Initial status for all tasks
+            statuses: Per-task statuses overriding ``initial_status``, in task order
+            
+        Returns:
+            Number of tasks written
+        """
+        if not is_binary_stream(fp):
+            write = cast(IO[str], fp).write
+        else:
+            binary = cast(IO[bytes], fp)
+            
+            def write(text: str) -> Any:
+                return binary.write(text.encode('utf-8'))
+        
+        write(f"# {filename}\n\n")
+        
+        task_count = 0
         for i, chunk in enumerate(chunks, 1):
-            # Add divider
-            output_lines.append("---")
-            output_lines.append("")
+            task_count = i
+            status = statuses[i - 1] if statuses is not None and i <= len(statuses) else initial_status
+            write(self._format_task_block(i, chunk, status))
+        
+        if not task_count:
+            write("---\n\nNo content to process.\n\n---\n")
+        else:
+            # Add final divider
+            write("---")
+        
+        return task_count
+    
+    def _format_task_block(self, task_number: int, chunk: str, status: str) -> str:
+        """Format a single task, from its opening divider to its content.
+        
+        Args:
+            task_number: Task number (1-based)
+            chunk: Text chunk of the task
+            status: Task status (Pending, Started, Completed)
             
+        Returns:
+            Task block ending with a blank line
+        """
+        lines = [
+            # Add divider
+            "---",
+            "",
             # Add task header
-            task_title = f"## {self.labels['task']} {i}"
-            output_lines.append(task_title)
-            
+            f"## {self.labels['task']} {task_number}",
             # Add progress status
-            progress_line = f"**{self.labels['progress']}:** {self.labels[initial_status.lower()]}"
-            output_lines.append(progress_line)
-            output_lines.append("")
-            
-            # Add checkboxes for progress tracking
-            checkboxes = self._generate_checkboxes(initial_status)
-            output_lines.extend(checkboxes)
-            output_lines.append("")
-            
-            # Add the actual content
-            output_lines.append(chunk.strip())
-            output_lines.append("")
+            f"**{self.labels['progress']}:** {self.labels[status.lower()]}",
+            "",
+        ]
         
-        # Add final divider
-        output_lines.append("---")
+        # Add checkboxes for progress tracking
+        lines.extend(self._generate_checkboxes(status))
+        lines.append("")
         
-        return "\n".join(output_lines)
+        # Add the actual content
+        lines.append(chunk.strip())
+        lines.append("")
+        lines.append("")
+        
+        return "\n".join(lines)
     
     def _generate_checkboxes(self, current_status: str) -> List[str]:
         """Generate checkbox list showing current progress.
@@ -93,7 +183,7 @@ class TaskFormatter:
         Returns:
             List of checkbox lines
         """
-        status_order = ["pending", "started", "completed"]
+        status_order = [status.lower() for status in _STATUSES]
         current_index = status_order.index(current_status.lower()) if current_status.lower() in status_order else 0
         
         checkboxes = []
@@ -105,6 +195,17 @@ class TaskFormatter:
         
         return checkboxes
     
+    def parse(self, content: str) -> "TaskDocument":
+        """Parse formatted content into an indexed task document.
+        
+        Args:
+            content: Formatted content
+            
+        Returns:
+            Task document for lookups and in-place status updates
+        """
+        return TaskDocument(content, self)
+    
     def update_task_status(
         self, 
         content: str, 
@@ -121,46 +222,32 @@ class TaskFormatter:
         Returns:
             Updated content
         """
-        lines = content.split('\n')
-        updated_lines = []
+        return self.update_statuses(content, {task_number: new_status})
+    
+    def update_statuses(self, content: str, statuses: Dict[int, str]) -> str:
+        """Update the status of many tasks in a single pass.
         
-        task_pattern = f"## {self.labels['task']} {task_number}"
-        in_target_task = False
-        checkbox_section = False
+        Args:
+            content: Existing formatted content
+            statuses: Mapping of task number (1-based) to new status
+            
+        Returns:
+            Updated content
+        """
+        document = self.parse(content)
+        document.update_statuses(statuses)
+        return document.to_string()
+    
+    def get_task_statuses(self, content: str) -> Dict[int, str]:
+        """Get the recorded status of every task in formatted content.
         
-        for line in lines:
-            if line.strip() == task_pattern:
-                in_target_task = True
-                updated_lines.append(line)
-                continue
+        Args:
+            content: Formatted content
             
-            if in_target_task:
-                # Update progress line
-                if line.startswith(f"**{self.labels['progress']}:**"):
-                    updated_lines.append(f"**{self.labels['progress']}:** {self.labels[new_status.lower()]}")
-                    continue
-                
-                # Update checkboxes
-                if line.startswith("- ☐") or line.startswith("- ☑"):
-                    if not checkbox_section:
-                        checkbox_section = True
-                        # Replace all checkboxes for this task
-                        checkboxes = self._generate_checkboxes(new_status)
-                        updated_lines.extend(checkboxes)
-                        # Skip original checkboxes
-                        continue
-                    else:
-                        # Skip remaining original checkboxes
-                        continue
-                
-                # If we hit another task or divider, we're done with this task
-                if line.startswith("## ") or line.strip() == "---":
-                    in_target_task = False
-                    checkbox_section = False
-            
-            updated_lines.append(line)
-        
-        return "\n".join(updated_lines)
+        Returns:
+            Mapping of task number to status (Pending, Started, Completed)
+        """
+        return self.parse(content).statuses()
     
     def get_task_count(self, content: str) -> int:
         """Get the total number of tasks in formatted content.
@@ -171,14 +258,7 @@ class TaskFormatter:
         Returns:
             Number of tasks
         """
-        lines = content.split('\n')
-        task_count = 0
-        
-        for line in lines:
-            if line.startswith(f"## {self.labels['task']} "):
-                task_count += 1
-        
-        return task_count
+        return len(self.parse(content))
     
     def extract_task_content(self, content: str, task_number: int) -> str:
         """Extract content of a specific task.
@@ -190,35 +270,171 @@ class TaskFormatter:
         Returns:
             Task content
         """
-        lines = content.split('\n')
-        task_pattern = f"## {self.labels['task']} {task_number}"
+        return self.parse(content).get_content(task_number)
+
+
+@dataclass
+class _TaskSpan:
+    """Line positions of one task within a task document."""
+    
+    header: int
+    end: int
+    status: Optional[str] = None
+    progress: List[int] = field(default_factory=list)
+    checkboxes: List[int] = field(default_factory=list)
+
+
+class TaskDocument:
+    """Formatted task list parsed once into a task number to line span index.
+    
+    Lookups and status updates touch only the lines of one task, so updating
+    many tasks costs one parse and one serialization instead of a full scan
+    per task. Replaced checkbox lines are kept in their original slots so
+    that line positions of later tasks never shift.
+    """
+    
+    def __init__(self, content: str, formatter: Optional[TaskFormatter] = None):
+        """Parse formatted content.
         
-        in_target_task = False
-        content_started = False
-        task_content = []
+        Args:
+            content: Formatted content
+            formatter: Formatter whose labels the content uses
+        """
+        self.formatter = formatter or TaskFormatter()
+        self._lines: List[Optional[str]] = list(content.split('\n'))
+        self._tasks: Dict[int, _TaskSpan] = {}
+        self._parse()
+    
+    def _parse(self) -> None:
+        """Index the header, progress and checkbox lines of every task."""
+        labels = self.formatter.labels
+        task_prefix = f"## {labels['task']} "
+        progress_prefix = f"**{labels['progress']}:**"
+        status_by_label = {labels[status.lower()]: status for status in _STATUSES}
         
-        for line in lines:
-            if line.strip() == task_pattern:
-                in_target_task = True
+        current = None
+        for index, line in enumerate(self._lines):
+            if line is None:
                 continue
-            
-            if in_target_task:
-                # Skip progress line and checkboxes
-                if (line.startswith(f"**{self.labels['progress']}:**") or 
-                    line.startswith("- ☐") or 
-                    line.startswith("- ☑") or
-                    line.strip() == ""):
-                    if content_started and line.strip() == "":
-                        # Empty line in content
-                        task_content.append(line)
+            if line.startswith(task_prefix):
+                number = line[len(task_prefix):].strip()
+                if number.isdigit():
+                    if current is not None:
+                        current.end = index
+                    current = _TaskSpan(header=index, end=len(self._lines))
+                    # Keep the first occurrence of a duplicated task number
+                    self._tasks.setdefault(int(number), current)
                     continue
-                
-                # End of task
-                if line.strip() == "---" or line.startswith("## "):
-                    break
-                
-                # This is the actual content
-                content_started = True
-                task_content.append(line)
-        
-        return "\n".join(task_content).strip()
\ No newline at end of file
+            
+            if current is None:
+                continue
+            
+            # A divider or any other heading ends the task
+            if line.startswith("## ") or line.strip() == "---":
+                current.end = index
+                current = None
+            elif line.startswith(progress_prefix):
+                if current.status is None:
+                    label = line[len(progress_prefix):].strip()
+                    current.status = status_by_label.get(label, "Pending")
+                current.progress.append(index)
+            elif line.startswith("- ☐") or line.startswith("- ☑"):
+                current.checkboxes.append(index)
+    
+    def __len__(self) -> int:
+        """Number of tasks in the document."""
+        return len(self._tasks)
+    
+    def __contains__(self, task_number: object) -> bool:
+        """Check whether a task number exists in the document."""
+        return task_number in self._tasks
+    
+    @property
+    def task_numbers(self) -> List[int]:
+        """Task numbers in document order."""
+        return sorted(self._tasks, key=lambda number: self._tasks[number].header)
+    
+    def get_status(self, task_number: int) -> Optional[str]:
+        """Get the recorded status of a task, or None if it has none."""
+        span = self._tasks.get(task_number)
+        return span.status if span is not None else None
+    
+    def statuses(self) -> Dict[int, str]:
+        """Get the recorded status of every task that has one."""
+        statuses = {}
+        for number in self.task_numbers:
+            status = self._tasks[number].status
+            if status is not None:
+                statuses[number] = status
+        return statuses
+    
+    def get_content(self, task_number: int) -> str:
+        """Get the text of a task without its progress and checkbox lines.
+        
+        Args:
+            task_number: Task number (1-based)
+            
+        Returns:
+            Task content, or an empty string if the task does not exist
+        """
+        span = self._tasks.get(task_number)
+        if span is None:
+            return ""
+        skipped = set(span.progress) | set(span.checkboxes)
+        lines = (
+            self._lines[index]
+            for index in range(span.header + 1, span.end)
+            if index not in skipped
+        )
+        return "\n".join(line for line in lines if line is not None).strip()
+    
+    def set_status(self, task_number: int, new_status: str) -> bool:
+        """Update the status of a task in place.
+        
+        Args:
+            task_number: Task number to update (1-based)
+            new_status: New status (Pending, Started, Completed)
+            
+        Returns:
+            True if the task exists, False otherwise
+        """
+        span = self._tasks.get(task_number)
+        if span is None:
+            return False
+        
+        labels = self.formatter.labels
+        progress_line = f"**{labels['progress']}:** {labels[new_status.lower()]}"
+        for index in span.progress:
+            self._lines[index] = progress_line
+        
+        # The first checkbox slot holds the whole new list; the rest are dropped
+        if span.checkboxes:
+            self._lines[span.checkboxes[0]] = "\n".join(self.formatter._generate_checkboxes(new_status))
+            for index in span.checkboxes[1:]:
+                self._lines[index] = None
+        
+        if span.progress:
+            span.status = new_status.capitalize()
+        return True
+    
+    def update_statuses(self, statuses: Dict[int, str]) -> List[int]:
+        """Update the status of many tasks in place.
+        
+        Args:
+            statuses: Mapping of task number (1-based) to new status
+            
+        Returns:
+            Task numbers that do not exist in the document
+        """
+        return [
+            task_number
+            for task_number, new_status in statuses.items()
+            if not self.set_status(task_number, new_status)
+        ]
+    
+    def to_string(self) -> str:
+        """Serialize the document back to formatted content."""
+        return "\n".join(line for line in self._lines if line is not None)
+    
+    def __str__(self) -> str:
+        return self.to_string()
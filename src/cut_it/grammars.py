@@ -0,0 +1,100 @@
+"""Tree-sitter grammars for splitting source code on syntax boundaries.
+
+Grammars come from the optional ``tree-sitter-<language>`` packages
+(``pip install cut-it[code]``). Each one is imported the first time a file
+of its language is split and then cached; languages whose package is not
+installed are split as plain text.
+"""
+
+from functools import lru_cache
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Grammar package and the function returning its language, per language
+GRAMMARS: Dict[str, Tuple[str, str]] = {
+    "bash": ("tree_sitter_bash", "language"),
+    "c": ("tree_sitter_c", "language"),
+    "c_sharp": ("tree_sitter_c_sharp", "language"),
+    "cpp": ("tree_sitter_cpp", "language"),
+    "go": ("tree_sitter_go", "language"),
+    "haskell": ("tree_sitter_haskell", "language"),
+    "java": ("tree_sitter_java", "language"),
+    "javascript": ("tree_sitter_javascript", "language"),
+    "lua": ("tree_sitter_lua", "language"),
+    "php": ("tree_sitter_php", "language_php"),
+    "python": ("tree_sitter_python", "language"),
+    "ruby": ("tree_sitter_ruby", "language"),
+    "rust": ("tree_sitter_rust", "language"),
+    "scala": ("tree_sitter_scala", "language"),
+    "tsx": ("tree_sitter_typescript", "language_tsx"),
+    "typescript": ("tree_sitter_typescript", "language_typescript"),
+}
+
+# Language of each code file extension that has a grammar
+EXTENSION_LANGUAGES: Dict[str, str] = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".ts": "typescript",
+    ".tsx": "tsx",
+    ".java": "java",
+    ".c": "c",
+    ".h": "c",
+    ".cpp": "cpp",
+    ".cs": "c_sharp",
+    ".php": "php",
+    ".rb": "ruby",
+    ".go": "go",
+    ".rs": "rust",
+    ".scala": "scala",
+    ".hs": "haskell",
+    ".lua": "lua",
+    ".sh": "bash",
+    ".bash": "bash",
+    ".zsh": "bash",
+}
+
+
+def language_for_path(path: Union[str, Path]) -> Optional[str]:
+    """Get the grammar language of a code file from its extension, if known."""
+    return EXTENSION_LANGUAGES.get(Path(path).suffix.lower())
+
+
+@lru_cache(maxsize=None)
+def load_grammar(language: str) -> Optional[Any]:
+    """Load a tree-sitter language once per process.
+
+    Args:
+        language: Language name, a key of ``GRAMMARS``
+
+    Returns:
+        Tree-sitter language for ``CodeSplitter``, or None when the language
+        is unknown or its grammar package is not installed
+    """
+    grammar = GRAMMARS.get(language)
+    if grammar is None:
+        return None
+    module_name, function_name = grammar
+    try:
+        return getattr(import_module(module_name), function_name)()
+    except (ImportError, AttributeError):
+        return None
+
+
+def splitter_type(file_type: str, language: Optional[str]) -> str:
+    """Identify the splitter used for a file type and language.
+
+    Code with an installed grammar is split by ``CodeSplitter`` and
+    identified as ``code:<language>``; everything else by its file type.
+    Chunk caches and manifests key on this, so installing a grammar
+    invalidates chunks produced without it.
+    """
+    if file_type == "code" and language and load_grammar(language) is not None:
+        return f"code:{language}"
+    return file_type
+
+
+def available_languages() -> List[str]:
+    """List the languages whose grammar packages are installed."""
+    return [language for language in sorted(GRAMMARS) if load_grammar(language) is not None]
@@ -0,0 +1,320 @@
+"""Incremental re-chunking of edited documents against a stored chunk manifest."""
+
+import hashlib
+import io
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .formatter import TaskDocument, TaskFormatter, replace_file
+from .splitter import ChunkRecord, TextProcessor
+
+MANIFEST_VERSION = 1
+
+# Unchanged chunks before an edit that are re-split with it, since the edit
+# can move where their boundary falls
+_PREFIX_MARGIN = 2
+
+# Chunks at the end of a split region that are not trusted as sync points
+_REGION_HOLDBACK = 2
+
+# Initial number of unchanged chunks after an edit re-split to find a sync point
+_RESYNC_LOOKAHEAD = 4
+
+
+def manifest_path_for(output_path: Path) -> Path:
+    """Get the manifest path stored next to a task output file."""
+    name = output_path.name
+    if name.endswith('.md'):
+        name = name[:-len('.md')]
+    return output_path.with_name(f"{name}.manifest.json")
+
+
+def content_hash(text: str) -> str:
+    """Hash chunk content for change detection."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ManifestEntry(NamedTuple):
+    """Offsets and content hash of one chunk in the source text."""
+
+    start: int
+    end: int
+    token_count: Optional[int]
+    hash: str
+
+
+@dataclass
+class ChunkManifest:
+    """Chunk boundaries of a source text and the settings that produced them."""
+
+    file_type: str
+    model: str
+    chunk_size: Any
+    source_length: int
+    chunks: List[ManifestEntry] = field(default_factory=list)
+    overlap: int = 0
+
+    @classmethod
+    def from_records(
+        cls,
+        processor: TextProcessor,
+        text: str,
+        records: List[ChunkRecord]
+    ) -> "ChunkManifest":
+        """Create a manifest from chunk records of a source text."""
+        return cls(
+            file_type=processor.splitter_type,
+            model=processor.model,
+            chunk_size=_normalize_chunk_size(processor.chunk_size),
+            source_length=len(text),
+            chunks=[
+                ManifestEntry(record.start, record.end, record.token_count, content_hash(record.text))
+                for record in records
+            ],
+            overlap=processor.overlap
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChunkManifest":
+        """Create manifest from dictionary."""
+        return cls(
+            file_type=data["file_type"],
+            model=data["model"],
+            chunk_size=_normalize_chunk_size(data["chunk_size"]),
+            source_length=data["source_length"],
+            chunks=[ManifestEntry(*entry) for entry in data["chunks"]],
+            overlap=data.get("overlap", 0)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert manifest to dictionary."""
+        return {
+            "version": MANIFEST_VERSION,
+            "file_type": self.file_type,
+            "model": self.model,
+            "chunk_size": self.chunk_size,
+            "source_length": self.source_length,
+            "overlap": self.overlap,
+            "chunks": [list(entry) for entry in self.chunks]
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["ChunkManifest"]:
+        """Load a manifest, returning None if it is missing or unreadable."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return None
+            return cls.from_dict(data)
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    def save(self, path: Path) -> None:
+        """Save manifest to file, atomically replacing any previous one."""
+        replace_file(path, json.dumps(self.to_dict()))
+
+    def matches(self, processor: TextProcessor) -> bool:
+        """Check whether the manifest was produced with the processor's settings."""
+        return (
+            self.file_type == processor.splitter_type
+            and self.model == processor.model
+            and self.chunk_size == _normalize_chunk_size(processor.chunk_size)
+            and self.overlap == processor.overlap
+        )
+
+
+@dataclass
+class RechunkResult:
+    """Chunks of an edited text and where each one came from."""
+
+    records: List[ChunkRecord]
+    # Index of the previous chunk each record was carried over from, or None if re-split
+    previous: List[Optional[int]]
+
+    @property
+    def reused(self) -> int:
+        """Number of chunks carried over unchanged."""
+        return sum(index is not None for index in self.previous)
+
+
+def _normalize_chunk_size(chunk_size: Any) -> Any:
+    """Normalize a chunk size so tuples and JSON lists compare equal."""
+    return list(chunk_size) if isinstance(chunk_size, (list, tuple)) else chunk_size
+
+
+def _is_stable(entry: ManifestEntry, text: str, shift: int) -> bool:
+    """Check whether a previous chunk appears unchanged at a shifted position."""
+    start, end = entry.start + shift, entry.end + shift
+    return 0 <= start and end <= len(text) and content_hash(text[start:end]) == entry.hash
+
+
+def rechunk(
+    processor: TextProcessor,
+    text: str,
+    manifest: Optional[ChunkManifest]
+) -> RechunkResult:
+    """Re-split only the region of a text that changed since the manifest.
+
+    Chunks matching the manifest from the start of the text are kept, except
+    the last few before the edit whose boundaries the edit may move. The
+    changed region is then re-split until one of its chunks ends exactly
+    where a previous chunk (shifted by the change in length) ended; from
+    that sync point on, the remaining previous chunks are carried over.
+
+    Args:
+        processor: Text processor used to split the changed region
+        text: New source text
+        manifest: Manifest of the previous version, if any
+
+    Returns:
+        Chunks of the new text with their origin in the previous version
+    """
+    # Overlapping chunks reach back across every boundary, so they are never re-split piecewise
+    if manifest is None or not manifest.matches(processor) or processor.overlap:
+        records = processor.split_with_offsets(text)
+        return RechunkResult(records, [None] * len(records))
+
+    old = manifest.chunks
+    shift = len(text) - manifest.source_length
+
+    prefix = 0
+    while prefix < len(old) and _is_stable(old[prefix], text, 0):
+        prefix += 1
+
+    if prefix == len(old) and shift == 0:
+        records = [_carry_over(entry, text, 0) for entry in old]
+        return RechunkResult(records, list(range(len(old))))
+
+    suffix = 0
+    while suffix < len(old) - prefix and _is_stable(old[len(old) - 1 - suffix], text, shift):
+        suffix += 1
+
+    prefix = max(prefix - _PREFIX_MARGIN, 0)
+    first_suffix = len(old) - suffix
+    region_start = old[prefix - 1].end if prefix else 0
+    sync_points = {old[index].end + shift: index for index in range(first_suffix, len(old))}
+
+    records = [_carry_over(old[index], text, 0) for index in range(prefix)]
+    previous: List[Optional[int]] = list(range(prefix))
+
+    lookahead = _RESYNC_LOOKAHEAD
+    while True:
+        stop = first_suffix + lookahead
+        region_end = old[stop - 1].end + shift if stop < len(old) else len(text)
+        region = [
+            record._replace(start=record.start + region_start, end=record.end + region_start)
+            for record in processor.split_with_offsets(text[region_start:region_end])
+        ]
+
+        if region_end == len(text):
+            records.extend(region)
+            previous.extend([None] * len(region))
+            return RechunkResult(records, previous)
+
+        for position, record in enumerate(region[:-_REGION_HOLDBACK]):
+            index = sync_points.get(record.end)
+            if index is not None:
+                records.extend(region[:position + 1])
+                previous.extend([None] * (position + 1))
+                records.extend(_carry_over(old[i], text, shift) for i in range(index + 1, len(old)))
+                previous.extend(range(index + 1, len(old)))
+                return RechunkResult(records, previous)
+
+        lookahead *= 2
+
+
+def _carry_over(entry: ManifestEntry, text: str, shift: int) -> ChunkRecord:
+    """Build the record of a previous chunk carried over into the new text."""
+    start, end = entry.start + shift, entry.end + shift
+    return ChunkRecord(start, end, entry.token_count, text[start:end])
+
+
+def _carry_statuses(
+    formatter: TaskFormatter,
+    document: Optional[TaskDocument],
+    manifest: Optional[ChunkManifest],
+    result: RechunkResult
+) -> List[str]:
+    """Get the status of each new chunk from the previous task output.
+
+    Statuses follow the chunks carried over from the manifest only when the
+    manifest describes the existing output, with one chunk per task and
+    the same contents. Otherwise, such as for an output written by a plain
+    ``process`` run or regenerated after the manifest, each new chunk takes
+    the status of an unused previous task with identical content.
+    """
+    if document is None:
+        return ["Pending"] * len(result.records)
+
+    old_statuses = document.statuses()
+    numbers = document.task_numbers
+    hashes = [content_hash(document.get_content(number)) for number in numbers]
+    if manifest is not None and [entry.hash for entry in manifest.chunks] == hashes:
+        return [
+            old_statuses.get(numbers[index], "Pending") if index is not None else "Pending"
+            for index in result.previous
+        ]
+
+    # Compare tasks as they read back from an output, since parsing can trim a chunk
+    unused: Dict[str, List[int]] = {}
+    for number, digest in zip(numbers, hashes):
+        unused.setdefault(digest, []).append(number)
+    rendered = formatter.parse(formatter.format_as_tasks([record.text for record in result.records], ""))
+    statuses = []
+    for number in rendered.task_numbers:
+        matches = unused.get(content_hash(rendered.get_content(number)))
+        statuses.append(old_statuses.get(matches.pop(0), "Pending") if matches else "Pending")
+    return statuses
+
+
+def process_incremental(
+    processor: TextProcessor,
+    formatter: TaskFormatter,
+    text: str,
+    filename: str,
+    output_path: Path
+) -> RechunkResult:
+    """Update a task output file after its source text was edited.
+
+    Task statuses recorded in the existing output are kept for chunks that
+    did not change; re-split chunks start as Pending. The manifest next to
+    the output is rewritten for the next run. Outputs without a manifest,
+    or whose manifest no longer describes them, keep the statuses of tasks
+    whose content is unchanged.
+
+    Args:
+        processor: Text processor for the document
+        formatter: Task formatter matching the existing output's language
+        text: New source text
+        filename: Original filename
+        output_path: Task output file to update
+
+    Returns:
+        Chunks of the new text with their origin in the previous version
+    """
+    manifest_path = manifest_path_for(output_path)
+    manifest = None
+    document = None
+    if output_path.exists():
+        manifest = ChunkManifest.load(manifest_path)
+        document = formatter.parse(output_path.read_text(encoding='utf-8'))
+
+    result = rechunk(processor, text, manifest)
+    statuses = _carry_statuses(formatter, document, manifest, result)
+
+    # Both files are replaced atomically, the manifest only once the output is,
+    # so an interrupted run never loses statuses or leaves a newer manifest
+    output = io.StringIO()
+    formatter.write_tasks(
+        chunks=(record.text for record in result.records),
+        filename=filename,
+        fp=output,
+        statuses=statuses
+    )
+    replace_file(output_path, output.getvalue())
+    ChunkManifest.from_records(processor, text, result.records).save(manifest_path)
+
+    return result
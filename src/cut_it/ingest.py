@@ -0,0 +1,70 @@
+"""Throughput tracking and output naming for ``cut-it ingest``.
+
+Source trees are walked by ``walk.walk_files``, which yields files as it
+finds them so ingesting a huge monorepo starts producing output
+immediately.
+"""
+
+import time
+from pathlib import Path
+from typing import Optional
+
+from .walk import SourceFile
+
+
+class Throughput:
+    """Running file, byte and chunk counts of an ingest with their rates."""
+
+    def __init__(self) -> None:
+        """Start measuring."""
+        self.files = 0
+        self.bytes = 0
+        self.chunks = 0
+        self.failures = 0
+        self._start = time.perf_counter()
+
+    def add(self, size: int, chunks: int = 0, ok: bool = True) -> None:
+        """Record one finished file."""
+        self.files += 1
+        self.bytes += size
+        self.chunks += chunks
+        if not ok:
+            self.failures += 1
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since measuring started."""
+        return max(time.perf_counter() - self._start, 1e-9)
+
+    @property
+    def files_per_second(self) -> float:
+        """Files finished per second."""
+        return self.files / self.elapsed
+
+    @property
+    def mb_per_second(self) -> float:
+        """Input megabytes finished per second."""
+        return self.bytes / (1024 * 1024) / self.elapsed
+
+    def describe(self) -> str:
+        """Format the rates for a progress display."""
+        return f"{self.files_per_second:.1f} files/s, {self.mb_per_second:.2f} MB/s"
+
+
+def output_path(source: SourceFile, suffix: str, output_dir: Optional[Path] = None) -> Path:
+    """Get the output file of an ingested file.
+
+    The suffix is appended to the full file name, so ``app.py`` and
+    ``app.md`` in one directory never write to the same output.
+
+    Args:
+        source: Ingested file
+        suffix: Output suffix such as ``.tasks.md``
+        output_dir: Directory mirroring the source tree (default: next to each file)
+
+    Returns:
+        Output file path
+    """
+    if output_dir is None:
+        return source.path.with_name(source.path.name + suffix)
+    return output_dir.joinpath(*source.relative.split('/')).with_name(source.path.name + suffix)
@@ -0,0 +1,133 @@
+"""Machine-readable JSON Lines output of chunks, one record per line.
+
+Each line is a JSON object describing one chunk::
+
+    {"index": 1, "status": "Pending", "text": "...", "token_count": 412,
+     "start": 0, "end": 1873, "source": "guide.md"}
+
+``index`` is the 1-based task number, ``start`` and ``end`` are character
+offsets of the chunk in the source, and ``token_count`` is null when
+tiktoken is unavailable. Offsets are null for chunks whose position is
+unknown.
+"""
+
+import json
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterable, Iterator, NamedTuple, Optional, Union, cast
+
+from .formatter import is_binary_stream
+
+if TYPE_CHECKING:
+    from .splitter import ChunkRecord
+
+OUTPUT_FORMATS = ("markdown", "jsonl")
+
+# Default output file suffix of each format
+OUTPUT_SUFFIXES: Dict[str, str] = {
+    "markdown": ".tasks.md",
+    "jsonl": ".tasks.jsonl",
+}
+
+# Compact separators keep lines short; non-ASCII text is written as UTF-8
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+class JsonlRecord(NamedTuple):
+    """One chunk read back from a JSONL file."""
+
+    index: int  # type: ignore[assignment]  # named after the JSON field, shadowing tuple.index
+    status: str
+    text: str
+    token_count: Optional[int]
+    start: Optional[int]
+    end: Optional[int]
+    source: Optional[str] = None
+
+
+def write_jsonl(
+    records: Iterable[Union["ChunkRecord", str]],
+    fp: Union[IO[str], IO[bytes]],
+    source: Optional[str] = None,
+    status: str = "Pending"
+) -> int:
+    """Stream chunks into a file object as JSON Lines.
+
+    Each record is written as soon as it arrives, so only one chunk is held
+    in memory at a time.
+
+    Args:
+        records: Chunk records, or plain chunks whose offsets are unknown
+        fp: Text or binary file object to write to (binary is UTF-8 encoded)
+        source: Source filename stored in every record (omitted if None)
+        status: Status of every record
+
+    Returns:
+        Number of records written
+    """
+    if not is_binary_stream(fp):
+        write = cast(IO[str], fp).write
+    else:
+        binary = cast(IO[bytes], fp)
+
+        def write(text: str) -> Any:
+            return binary.write(text.encode('utf-8'))
+
+    count = 0
+    for count, record in enumerate(records, 1):
+        if isinstance(record, str):
+            start, end, token_count, text = None, None, None, record
+        else:
+            start, end, token_count, text = record
+        data = {
+            "index": count,
+            "status": status,
+            "text": text,
+            "token_count": token_count,
+            "start": start,
+            "end": end,
+        }
+        if source is not None:
+            data["source"] = source
+        write(_encode(data) + "\n")
+
+    return count
+
+
+def read_jsonl(source: Union[str, Path, IO[bytes]]) -> Iterator[JsonlRecord]:
+    """Lazily read chunk records from a JSON Lines file.
+
+    Lines are decoded one at a time without any markdown parsing, so
+    arbitrarily large files are read in constant memory. Blank lines are
+    skipped.
+
+    Args:
+        source: Path of a JSONL file, or a binary file object
+
+    Yields:
+        Records in file order
+
+    Raises:
+        ValueError: If a line is not a JSON object with ``index`` and ``text``
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as f:
+            yield from read_jsonl(f)
+        return
+
+    for line_number, line in enumerate(source, 1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+            record = JsonlRecord(
+                data["index"],
+                data.get("status", "Pending"),
+                data["text"],
+                data.get("token_count"),
+                data.get("start"),
+                data.get("end"),
+                data.get("source"),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"invalid JSONL record on line {line_number}: {e}") from e
+        yield record
@@ -24,15 +24,46 @@ def get_messages(pt_br: bool = False) -> Dict[str, str]:
             # Processing
             "splitting_text": "Dividindo texto em blocos semânticos...",
             "formatting_tasks": "Formatando como lista de tarefas...",
+            "processing_files": "Processando arquivos...",
             
             # Results
             "success": "✅ Processamento concluído com sucesso!",
             "chunks_created": "Blocos de tarefa criados",
+            "chunks_reused": "Blocos inalterados reaproveitados",
+            "batch_summary": "{processed} arquivo(s) processado(s), {failed} com falha, {chunks} blocos de tarefa criados",
+            "no_input_files": "Nenhum arquivo de entrada encontrado",
             
             # Configuration
             "config_updated": "Configuração atualizada com sucesso",
             "checking_updates": "Verificando atualizações...",
             "up_to_date": "cut-it está atualizado",
+            "cache_entries": "Entradas em cache",
+            "cache_size": "Tamanho do cache",
+            "cache_pruned": "Entradas removidas do cache",
+            "tasks_updated": "Tarefas atualizadas",
+            "tasks_not_found": "Tarefas não encontradas",
+            "invalid_status": "Status inválido",
+            "bench_title": "Benchmark do cut-it",
+            "running_benchmarks": "Executando benchmarks...",
+            "bench_saved": "Resultados salvos em",
+            "threads_scale": "split_many usa threads",
+            "corpus_stats": "Estatísticas do corpus",
+            "tokens_unavailable": "Contagem de tokens requer tiktoken (pip install cut-it[tokens])",
+            "incremental_needs_files": "--incremental precisa de arquivos de entrada e saída",
+            "invalid_format": "Formato de saída inválido",
+            "markdown_only": "opção disponível apenas com --format markdown",
+            "no_overlap": "opção indisponível com --overlap",
+            "stage_timings": "Tempo por etapa",
+            "profile_saved": "Perfil salvo em",
+            "server_listening": "Servidor aguardando requisições em",
+            "server_stopped": "Servidor encerrado",
+            "server_unavailable": "Não foi possível usar o servidor",
+            "remote_single_file": "--remote processa um arquivo por vez",
+            "ingesting_files": "Ingerindo arquivos...",
+            "ingest_summary": "{files} arquivo(s) ingerido(s), {failed} com falha, {chunks} blocos de tarefa criados ({megabytes:.1f} MB em {seconds:.1f}s, {rate})",
+            "watching": "Observando",
+            "watch_stopped": "Observação encerrada",
+            "refreshed": "atualizado",
             
             # Errors
             "error": "Erro",
@@ -55,11 +86,14 @@ def get_messages(pt_br: bool = False) -> Dict[str, str]:
             "help_size": "Faixa de tamanho do bloco (min,max)",
             "help_model": "Modelo tiktoken a ser usado",
             "help_type": "Forçar tipo de arquivo (text, markdown, code)",
+            "help_jobs": "Número de processos para vários arquivos",
             "help_config_show": "Mostrar configuração atual",
             "help_config_ptbr": "Ativar/desativar localização em Português (Brasil)",
             "help_config_cli": "Ativar/desativar modo CLI",
             "help_config_model": "Definir modelo tiktoken padrão",
-            "help_config_size": "Definir faixa de tamanho de bloco padrão"
+            "help_config_size": "Definir faixa de tamanho de bloco padrão",
+            "help_config_mmap": "Mapear em memória arquivos maiores que este tamanho em MB",
+            "help_cache": "Reaproveitar blocos de arquivos inalterados do cache em disco"
         }
     
     else:
@@ -73,15 +107,46 @@ def get_messages(pt_br: bool = False) -> Dict[str, str]:
             # Processing
             "splitting_text": "Splitting text into semantic chunks...",
             "formatting_tasks": "Formatting as task list...",
+            "processing_files": "Processing files...",
             
             # Results
             "success": "✅ Processing completed successfully!",
             "chunks_created": "Task chunks created",
+            "chunks_reused": "Unchanged chunks reused",
+            "batch_summary": "{processed} file(s) processed, {failed} failed, {chunks} task chunks created",
+            "no_input_files": "No input files found",
             
             # Configuration
             "config_updated": "Configuration updated successfully",
             "checking_updates": "Checking for updates...",
             "up_to_date": "cut-it is up to date",
+            "cache_entries": "Cached entries",
+            "cache_size": "Cache size",
+            "cache_pruned": "Cache entries removed",
+            "tasks_updated": "Tasks updated",
+            "tasks_not_found": "Tasks not found",
+            "invalid_status": "Invalid status",
+            "bench_title": "cut-it benchmark",
+            "running_benchmarks": "Running benchmarks...",
+            "bench_saved": "Results saved to",
+            "threads_scale": "split_many uses threads",
+            "corpus_stats": "Corpus statistics",
+            "tokens_unavailable": "Token counts need tiktoken (pip install cut-it[tokens])",
+            "incremental_needs_files": "--incremental needs input and output files",
+            "invalid_format": "Invalid output format",
+            "markdown_only": "option only available with --format markdown",
+            "no_overlap": "option not available with --overlap",
+            "stage_timings": "Stage timings",
+            "profile_saved": "Profile saved to",
+            "server_listening": "Server listening on",
+            "server_stopped": "Server stopped",
+            "server_unavailable": "Could not use the server",
+            "remote_single_file": "--remote processes one file at a time",
+            "ingesting_files": "Ingesting files...",
+            "ingest_summary": "{files} file(s) ingested, {failed} failed, {chunks} task chunks created ({megabytes:.1f} MB in {seconds:.1f}s, {rate})",
+            "watching": "Watching",
+            "watch_stopped": "Stopped watching",
+            "refreshed": "refreshed",
             
             # Errors
             "error": "Error",
@@ -104,9 +169,12 @@ def get_messages(pt_br: bool = False) -> Dict[str, str]:
             "help_size": "Chunk size range (min,max)",
             "help_model": "Tiktoken model to use",
             "help_type": "Force file type (text, markdown, code)",
+            "help_jobs": "Number of worker processes for multiple files",
             "help_config_show": "Show current configuration",
             "help_config_ptbr": "Enable/disable Portuguese (Brazil) localization",
             "help_config_cli": "Enable/disable CLI mode",
             "help_config_model": "Set default tiktoken model",
-            "help_config_size": "Set default chunk size range"
+            "help_config_size": "Set default chunk size range",
+            "help_config_mmap": "Memory-map input files larger than this many MB",
+            "help_cache": "Reuse chunks of unchanged files from the on-disk cache"
         }
\ No newline at end of file
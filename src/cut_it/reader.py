@@ -0,0 +1,123 @@
+"""Memory-mapped reading of large input files in bounded text windows."""
+
+import mmap
+from pathlib import Path
+from typing import BinaryIO, Iterator, Union
+
+# Default size of each decoded window in bytes
+DEFAULT_WINDOW_SIZE = 4 * 1024 * 1024
+
+
+def _is_continuation_byte(byte: int) -> bool:
+    """Check whether a byte continues a multi-byte UTF-8 sequence."""
+    return byte & 0xC0 == 0x80
+
+
+def _find_cut(data: Union[mmap.mmap, bytes], start: int, end: int) -> int:
+    """Find where to end a window that starts at ``start`` and may reach ``end``.
+
+    Prefers the last paragraph break or markdown heading in the window, then
+    the last line break, and finally the last UTF-8 character boundary.
+
+    Args:
+        data: Memory-mapped or buffered file contents
+        start: Window start offset in bytes
+        end: Maximum window end offset in bytes
+
+    Returns:
+        Window end offset in bytes, always greater than ``start``
+    """
+    paragraph = data.rfind(b"\n\n", start, end)
+    heading = data.rfind(b"\n#", start, end)
+    cut = max(
+        paragraph + 2 if paragraph != -1 else -1,
+        heading + 1 if heading != -1 else -1
+    )
+    if cut > start:
+        return cut
+
+    line = data.rfind(b"\n", start, end)
+    if line != -1 and line + 1 > start:
+        return line + 1
+
+    # No line break at all: back off to a character boundary, keeping CRLF together
+    cut = end
+    while cut > start + 1 and (_is_continuation_byte(data[cut]) or data[cut - 1] == 0x0D):
+        cut -= 1
+    return cut
+
+
+def read_windows(
+    path: Union[str, Path],
+    window_size: int = DEFAULT_WINDOW_SIZE
+) -> Iterator[str]:
+    """Decode a UTF-8 file window by window through a memory map.
+
+    Windows are cut at paragraph or heading boundaries where possible, so
+    only about one window of decoded text is held in memory at a time.
+    Newlines are normalized the same way ``Path.read_text`` does.
+
+    Args:
+        path: File to read
+        window_size: Maximum size of each window in bytes
+
+    Yields:
+        Decoded text windows in file order
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8
+    """
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+        if size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            while start < size:
+                end = min(start + window_size, size)
+                if end < size:
+                    end = _find_cut(data, start, end)
+                yield _decode_window(data[start:end])
+                start = end
+
+
+def read_stream_windows(
+    stream: BinaryIO,
+    window_size: int = DEFAULT_WINDOW_SIZE
+) -> Iterator[str]:
+    """Decode a UTF-8 byte stream, such as stdin, window by window.
+
+    Windows are cut like ``read_windows``, so at most about two windows of
+    input are buffered regardless of the stream's length.
+
+    Args:
+        stream: Binary stream to read until end of file
+        window_size: Maximum size of each window in bytes
+
+    Yields:
+        Decoded text windows in stream order
+
+    Raises:
+        UnicodeDecodeError: If the stream is not valid UTF-8
+    """
+    buffer = b""
+    while True:
+        block = stream.read(window_size)
+        buffer += block
+        while len(buffer) > window_size:
+            cut = _find_cut(buffer, 0, window_size)
+            yield _decode_window(buffer[:cut])
+            buffer = buffer[cut:]
+        if not block:
+            if buffer:
+                yield _decode_window(buffer)
+            return
+
+
+def _decode_window(data: bytes) -> str:
+    """Decode a window, normalizing newlines the same way ``Path.read_text`` does."""
+    window = data.decode('utf-8')
+    if '\r' in window:
+        window = window.replace('\r\n', '\n').replace('\r', '\n')
+    return window
@@ -0,0 +1,355 @@
+"""Long-running chunking daemon answering JSON-lines requests on a local socket.
+
+Each request is one JSON object per line with an ``op`` field and an
+optional ``id`` echoed back in the response. Responses are one JSON object
+per line: ``{"id": ..., "ok": true, "result": {...}}`` on success or
+``{"id": ..., "ok": false, "error": "..."}`` on failure. Supported
+operations:
+
+* ``ping``: returns ``{"version": ...}``
+* ``split``: ``text`` plus optional ``file_type``, ``language``,
+  ``chunk_size``, ``overlap`` and ``model``; returns ``{"chunks": [...]}``
+* ``format``: ``chunks`` and ``filename`` plus optional ``pt_br`` and
+  ``initial_status``; returns ``{"content": ...}``
+* ``process``: ``text`` and ``filename`` plus the options of ``split`` and
+  ``format``; returns ``{"content": ..., "chunks": n}``
+* ``stats``: returns request and splitter cache counters
+* ``shutdown``: stops the server after answering
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
+
+from . import __version__
+from .formatter import TaskFormatter
+
+if TYPE_CHECKING:
+    from .splitter import TextProcessor
+
+Address = Union[str, Tuple[str, int]]
+
+DEFAULT_HOST = "127.0.0.1"
+
+# Warm processors kept by a service; settings come from clients, so the
+# least recently used ones are dropped instead of growing without bound
+DEFAULT_MAX_PROCESSORS = 16
+
+
+class ServerError(Exception):
+    """Error reported by the daemon or raised while talking to it."""
+
+
+def default_address() -> Address:
+    """Default daemon address: a Unix socket in ~/.cut-it, or localhost TCP without AF_UNIX."""
+    if hasattr(socket, "AF_UNIX"):
+        return str(Path.home() / ".cut-it" / "cut-it.sock")
+    return (DEFAULT_HOST, 8765)
+
+
+def parse_address(address: Optional[str]) -> Address:
+    """Parse ``host:port`` or ``:port`` as TCP and anything else as a socket path.
+
+    Args:
+        address: Address string, or None for the default address
+
+    Returns:
+        Socket path or (host, port) tuple
+    """
+    if not address:
+        return default_address()
+    host, sep, port = address.rpartition(":")
+    if sep and port.isdigit():
+        return (host or DEFAULT_HOST, int(port))
+    return address
+
+
+def format_address(address: Address) -> str:
+    """Format an address for display."""
+    return address if isinstance(address, str) else f"{address[0]}:{address[1]}"
+
+
+def _chunk_size(value: Any) -> Union[int, Tuple[int, int]]:
+    """Convert a JSON chunk size (int or two-item list) into processor form."""
+    if isinstance(value, (list, tuple)):
+        if len(value) != 2:
+            raise ValueError("chunk_size must be an integer or a [min, max] pair")
+        return (int(value[0]), int(value[1]))
+    return int(value)
+
+
+class ChunkingService:
+    """Request dispatcher holding warm text processors and formatters.
+
+    Processors are kept in an LRU of ``max_processors`` entries, and their
+    splitters come from the bounded process-wide ``splitter_cache``, so
+    clients sending many distinct settings cannot grow the daemon's memory
+    without limit.
+    """
+
+    def __init__(self, max_processors: int = DEFAULT_MAX_PROCESSORS):
+        """Initialize chunking service.
+
+        Args:
+            max_processors: Maximum number of processors kept warm
+        """
+        self.max_processors = max_processors
+        self._processors: "OrderedDict[Tuple[str, str, Any, Optional[str], int], TextProcessor]" = OrderedDict()
+        self._formatters: Dict[bool, TaskFormatter] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    def get_processor(
+        self,
+        file_type: str = "text",
+        chunk_size: Any = (300, 500),
+        model: str = "gpt-4",
+        language: Optional[str] = None,
+        overlap: int = 0
+    ) -> "TextProcessor":
+        """Get a processor for the settings, creating it on first use."""
+        from .splitter import TextProcessor
+
+        chunk_size = _chunk_size(chunk_size)
+        key = (file_type, model, chunk_size, language, overlap)
+        with self._lock:
+            processor = self._processors.get(key)
+            if processor is not None:
+                self._processors.move_to_end(key)
+                return processor
+            processor = TextProcessor(
+                chunk_size=chunk_size, model=model, file_type=file_type, language=language, overlap=overlap
+            )
+            self._processors[key] = processor
+            if len(self._processors) > self.max_processors:
+                self._processors.popitem(last=False)
+            return processor
+
+    def get_formatter(self, pt_br: bool = False) -> TaskFormatter:
+        """Get a formatter for the language."""
+        with self._lock:
+            formatter = self._formatters.get(bool(pt_br))
+            if formatter is None:
+                formatter = self._formatters[bool(pt_br)] = TaskFormatter(pt_br=bool(pt_br))
+            return formatter
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one request, converting failures into error responses."""
+        response: Dict[str, Any] = {"id": request.get("id")} if isinstance(request, dict) else {"id": None}
+        with self._lock:
+            self.requests += 1
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            response["result"] = self._dispatch(request)
+            response["ok"] = True
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            response["ok"] = False
+            response["error"] = f"{type(e).__name__}: {e}"
+        return response
+
+    def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        op = request.get("op")
+        if op == "ping":
+            return {"version": __version__}
+        if op == "split":
+            return {"chunks": self._split(request)}
+        if op == "format":
+            return {"content": self._format(request, request["chunks"])}
+        if op == "process":
+            chunks = self._split(request)
+            return {"content": self._format(request, chunks), "chunks": len(chunks)}
+        if op == "stats":
+            from .splitter import splitter_cache
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "processors": len(self._processors),
+                "splitter_cache": splitter_cache.stats()._asdict(),
+            }
+        if op == "shutdown":
+            return {}
+        raise ValueError(f"unknown op {op!r}")
+
+    def _split(self, request: Dict[str, Any]) -> List[str]:
+        processor = self.get_processor(
+            request.get("file_type", "text"),
+            request.get("chunk_size", (300, 500)),
+            request.get("model", "gpt-4"),
+            request.get("language"),
+            request.get("overlap", 0)
+        )
+        return processor.split_text(request["text"])
+
+    def _format(self, request: Dict[str, Any], chunks: list) -> str:
+        formatter = self.get_formatter(request.get("pt_br", False))
+        return formatter.format_as_tasks(
+            chunks,
+            request.get("filename", "document.txt"),
+            request.get("initial_status", "Pending")
+        )
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers JSON-lines requests on one connection until it closes."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                response = {"id": None, "ok": False, "error": f"invalid JSON: {e}"}
+            else:
+                response = cast(_ServiceServer, self.server).service.handle(request)
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+            self.wfile.flush()
+
+            if response["ok"] and isinstance(request, dict) and request.get("op") == "shutdown":
+                # shutdown() blocks until serve_forever returns, so call it from another thread
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class _ServiceServer(socketserver.ThreadingMixIn):
+    """Threaded server answering requests with a chunking service."""
+
+    daemon_threads = True
+    service: ChunkingService
+
+
+class _TCPServer(_ServiceServer, socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+    class _UnixServer(_ServiceServer, socketserver.UnixStreamServer):
+        pass
+
+
+def create_server(address: Address, service: Optional[ChunkingService] = None) -> socketserver.BaseServer:
+    """Bind a threaded daemon to a Unix socket path or a (host, port) pair.
+
+    A stale socket file left by a previous server is replaced; a socket
+    that still accepts connections raises ServerError instead.
+
+    Args:
+        address: Socket path or (host, port) tuple
+        service: Dispatcher to answer requests with (a new one by default)
+
+    Returns:
+        Bound server; call ``serve_forever`` to start answering requests
+    """
+    server: Union["_UnixServer", _TCPServer]
+    if isinstance(address, str):
+        path = Path(address)
+        if path.exists():
+            try:
+                with RemoteClient(address, timeout=1.0) as client:
+                    client.ping()
+            except (OSError, ServerError):
+                path.unlink()
+            else:
+                raise ServerError(f"a server is already listening on {address}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        server = _UnixServer(address, _RequestHandler)
+        os.chmod(address, 0o600)
+    else:
+        server = _TCPServer(address, _RequestHandler)
+    server.service = service or ChunkingService()
+    return server
+
+
+def serve(address: Address, service: Optional[ChunkingService] = None) -> None:
+    """Answer requests until a shutdown request or KeyboardInterrupt, then clean up.
+
+    Args:
+        address: Socket path or (host, port) tuple
+        service: Dispatcher to answer requests with (a new one by default)
+    """
+    server = create_server(address, service)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if isinstance(address, str) and os.path.exists(address):
+            os.unlink(address)
+
+
+class RemoteClient:
+    """Thin client sending requests to a running daemon over one connection."""
+
+    def __init__(self, address: Optional[Address] = None, timeout: Optional[float] = None):
+        """Connect to a daemon.
+
+        Args:
+            address: Socket path or (host, port) tuple (defaults to the default address)
+            timeout: Socket timeout in seconds
+        """
+        self.address = address or default_address()
+        if isinstance(self.address, str):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(self.address)
+        except OSError:
+            self._socket.close()
+            raise
+        self._file = self._socket.makefile('rwb')
+        self._next_id = 0
+
+    def request(self, op: str, **params: Any) -> Dict[str, Any]:
+        """Send a request and wait for its result.
+
+        Raises:
+            ServerError: If the daemon reports an error or closes the connection
+        """
+        self._next_id += 1
+        message = {"id": self._next_id, "op": op, **params}
+        self._file.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b"\n")
+        self._file.flush()
+
+        line = self._file.readline()
+        if not line:
+            raise ServerError("connection closed by server")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise ServerError(response.get("error", "unknown error"))
+        result: Dict[str, Any] = response["result"]
+        return result
+
+    def ping(self) -> str:
+        """Check the daemon is alive, returning its version."""
+        version: str = self.request("ping")["version"]
+        return version
+
+    def split(self, text: str, **options: Any) -> List[str]:
+        """Split text on the daemon; options are file_type, language, chunk_size, overlap and model."""
+        chunks: List[str] = self.request("split", text=text, **options)["chunks"]
+        return chunks
+
+    def process(self, text: str, filename: str, **options: Any) -> Dict[str, Any]:
+        """Split and format text on the daemon, returning content and chunk count."""
+        return self.request("process", text=text, filename=filename, **options)
+
+    def close(self) -> None:
+        """Close the connection."""
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self) -> "RemoteClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
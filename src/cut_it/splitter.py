@@ -1,7 +1,384 @@
 """Text processing and splitting functionality using semantic-text-splitter."""
 
-from typing import List, Tuple, Union
-from semantic_text_splitter import TextSplitter, MarkdownSplitter
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+from semantic_text_splitter import CodeSplitter, TextSplitter, MarkdownSplitter
+
+from .grammars import load_grammar, splitter_type
+from .stats import DEFAULT_PERCENTILES, TokenStats, chunk_info, token_stats
+
+
+class ChunkRecord(NamedTuple):
+    """A chunk together with its position in the source text.
+    
+    ``start`` and ``end`` delimit the stripped chunk in the source, so
+    ``source[start:end] == text`` when offsets are in characters.
+    """
+    
+    start: int
+    end: int
+    token_count: Optional[int]
+    text: str
+
+
+class ChunkView:
+    """A chunk as an offset view into its source text.
+    
+    Views hold a reference to the source and two offsets instead of a copy
+    of the chunk, so overlapping chunks cost a few dozen bytes each and a
+    list of views stays about the size of the source however much chunks
+    overlap. The text is sliced on demand by ``str(view)`` or ``view.text``.
+    """
+    
+    __slots__ = ("source", "start", "end")
+    
+    def __init__(self, source: str, start: int, end: int):
+        """Initialize a view of ``source[start:end]``."""
+        self.source = source
+        self.start = start
+        self.end = end
+    
+    @property
+    def text(self) -> str:
+        """Text of the chunk, sliced from the source."""
+        return self.source[self.start:self.end]
+    
+    def __str__(self) -> str:
+        return self.source[self.start:self.end]
+    
+    def __len__(self) -> int:
+        return self.end - self.start
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ChunkView):
+            other = other.text
+        return self.text == other if isinstance(other, str) else NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(self.text)
+    
+    def __repr__(self) -> str:
+        return f"ChunkView(start={self.start}, end={self.end}, text={self.text[:40]!r})"
+
+
+# Seconds before retrying a tokenizer encoding that failed to load, e.g.
+# because tiktoken could not download it
+_TOKEN_COUNTER_RETRY = 60.0
+
+logger = logging.getLogger(__name__)
+
+_token_counters: Dict[str, Callable[[str], int]] = {}
+_token_counter_failures: Dict[str, float] = {}
+
+
+@lru_cache(maxsize=None)
+def _load_tiktoken() -> Any:
+    """Import tiktoken once, or return None when it is not installed."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken
+
+
+def _get_token_counter(model: str) -> Optional[Callable[[str], int]]:
+    """Get a token counting function for a tiktoken model.
+    
+    Token counts need the optional ``tiktoken`` package (``pip install
+    cut-it[tokens]``); None is returned when it or its encoding is unavailable.
+    Only loaded encodings are remembered: an encoding that fails to load is
+    logged and tried again after ``_TOKEN_COUNTER_RETRY`` seconds, so a
+    transient failure does not disable token counts for the whole process.
+    """
+    counter = _token_counters.get(model)
+    if counter is not None:
+        return counter
+    
+    tiktoken = _load_tiktoken()
+    if tiktoken is None:
+        return None
+    failed_at = _token_counter_failures.get(model)
+    if failed_at is not None and time.monotonic() - failed_at < _TOKEN_COUNTER_RETRY:
+        return None
+    
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except Exception as e:
+        _token_counter_failures[model] = time.monotonic()
+        logger.warning("Token counts for %s are unavailable: %s: %s", model, type(e).__name__, e)
+        return None
+    _token_counter_failures.pop(model, None)
+    
+    def count_tokens(text: str) -> int:
+        return len(encoding.encode(text, disallowed_special=()))
+    
+    _token_counters[model] = count_tokens
+    return count_tokens
+
+
+Splitter = Union[TextSplitter, MarkdownSplitter, CodeSplitter]
+
+
+def _build_splitter(
+    file_type: str,
+    model: str,
+    capacity: Union[int, Tuple[int, int]],
+    language: Optional[str] = None,
+    overlap: int = 0
+) -> Splitter:
+    """Build a new splitter for the given file type, model, capacity, language and overlap."""
+    
+    # Use tiktoken tokenizer for accurate token counting
+    if file_type == "markdown":
+        return MarkdownSplitter.from_tiktoken_model(model, capacity=capacity, overlap=overlap)
+    
+    # Code is split on syntax boundaries when its grammar is installed
+    if file_type == "code" and language:
+        grammar = load_grammar(language)
+        if grammar is not None:
+            return CodeSplitter.from_tiktoken_model(grammar, model, capacity=capacity, overlap=overlap)
+    
+    # Use TextSplitter for text and for code without a grammar
+    return TextSplitter.from_tiktoken_model(model, capacity=capacity, overlap=overlap)
+
+
+def validate_overlap(capacity: Union[int, Tuple[int, int]], overlap: int) -> None:
+    """Check that an overlap fits the chunk size.
+    
+    Args:
+        capacity: Maximum chunk size (int) or range (tuple)
+        overlap: Tokens shared by consecutive chunks
+        
+    Raises:
+        ValueError: If the overlap is negative or not smaller than the
+            (minimum) chunk size
+    """
+    desired = capacity[0] if isinstance(capacity, (tuple, list)) else capacity
+    if overlap < 0:
+        raise ValueError(f"overlap must not be negative, got {overlap}")
+    if overlap >= desired:
+        raise ValueError(f"overlap ({overlap}) must be smaller than the minimum chunk size ({desired})")
+
+
+class CacheStats(NamedTuple):
+    """Hit/miss statistics of a splitter cache."""
+    
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class SplitterCache:
+    """Thread-safe LRU cache of built splitters shared across processors.
+    
+    Building a splitter with ``from_tiktoken_model`` loads the tokenizer's
+    BPE tables, so processors created with the same settings reuse one
+    splitter instead of rebuilding it.
+    """
+    
+    def __init__(self, maxsize: int = 16):
+        """Initialize splitter cache.
+        
+        Args:
+            maxsize: Maximum number of splitters kept in the cache
+        """
+        self.maxsize = maxsize
+        self._splitters: "OrderedDict[Hashable, Splitter]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    def get(
+        self,
+        file_type: str,
+        model: str,
+        capacity: Union[int, Tuple[int, int]],
+        language: Optional[str] = None,
+        overlap: int = 0
+    ) -> Splitter:
+        """Get a cached splitter, building it on first use.
+        
+        Args:
+            file_type: Type of file being processed (text, markdown, code)
+            model: Tiktoken model name for tokenization
+            capacity: Maximum chunk size (int) or range (tuple)
+            language: Grammar language of code files (ignored for other types)
+            overlap: Tokens shared by consecutive chunks
+            
+        Returns:
+            Splitter configured for the given settings
+        """
+        if isinstance(capacity, list):
+            capacity = tuple(capacity)
+        if file_type != "code":
+            language = None
+        key = (file_type, model, capacity, language, overlap)
+        
+        with self._lock:
+            splitter = self._splitters.get(key)
+            if splitter is not None:
+                self._hits += 1
+                self._splitters.move_to_end(key)
+                return splitter
+            self._misses += 1
+            
+            # Build under the lock so concurrent callers never build twice
+            splitter = _build_splitter(file_type, model, capacity, language, overlap)
+            self._splitters[key] = splitter
+            if len(self._splitters) > self.maxsize:
+                self._splitters.popitem(last=False)
+            return splitter
+    
+    def stats(self) -> CacheStats:
+        """Get hit/miss statistics for the cache."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._splitters), self.maxsize)
+    
+    def clear(self) -> None:
+        """Remove all cached splitters and reset statistics."""
+        with self._lock:
+            self._splitters.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+# Process-wide cache shared by every TextProcessor
+splitter_cache = SplitterCache()
+
+# Minimum speedup of two threads over serial splitting for split_many to use threads
+_THREAD_SPEEDUP_THRESHOLD = 1.3
+
+
+
+def available_cores() -> int:
+    """Number of CPU cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@lru_cache(maxsize=16)
+def threads_scale(splitter: Splitter) -> bool:
+    """Check once per splitter whether splitting from threads runs in parallel.
+    
+    The native splitter can release the GIL, but whether two threads split
+    faster than one depends on the splitter, the build and the machine. A
+    short probe compares splitting sample documents serially and on two
+    threads with the splitter that will do the work.
+    
+    Args:
+        splitter: Splitter to probe, e.g. a processor's ``splitter``
+        
+    Returns:
+        True if two threads split the samples clearly faster than one
+    """
+    if available_cores() < 2:
+        return False
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    sentence = "The quick brown fox jumps over the lazy dog near the river bank. "
+    samples = [(sentence * 40 + "\n\n") * 12 for _ in range(4)]
+    splitter.chunks(samples[0])  # warm up the tokenizer
+    
+    start = time.perf_counter()
+    for sample in samples:
+        splitter.chunks(sample)
+    serial = time.perf_counter() - start
+    
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        start = time.perf_counter()
+        list(executor.map(splitter.chunks, samples))
+        threaded = time.perf_counter() - start
+    
+    return serial / threaded >= _THREAD_SPEEDUP_THRESHOLD if threaded else False
+
+
+def split_with_settings(
+    chunk_size: Union[int, Tuple[int, int]],
+    model: str,
+    file_type: str,
+    text: str,
+    language: Optional[str] = None,
+    overlap: int = 0
+) -> List[str]:
+    """Split text with a processor built from picklable settings.
+    
+    Used as the task of process pools; each worker process reuses its own
+    cached splitter.
+    """
+    processor = TextProcessor(
+        chunk_size=chunk_size, model=model, file_type=file_type, language=language, overlap=overlap
+    )
+    return processor.split_text(text)
+
+
+# Sentence breaks and words, used to split paragraphs that do not fit a chunk
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+|\s*\n\s*')
+_WORD = re.compile(r'\S+')
+
+
+def _sentence_units(
+    paragraph: str,
+    measure: Callable[[str], int],
+    max_size: int
+) -> List[Tuple[int, int, int]]:
+    """Split a paragraph into (start, end, size) sentence units no larger than ``max_size``.
+    
+    Sentences that are too large are replaced by their word units.
+    """
+    units = []
+    position = 0
+    
+    for match in [*_SENTENCE_BREAK.finditer(paragraph), None]:
+        start, end = position, match.start() if match else len(paragraph)
+        position = match.end() if match else len(paragraph)
+        if end <= start:
+            continue
+        size = measure(paragraph[start:end])
+        if size <= max_size:
+            units.append((start, end, size))
+        else:
+            units.extend(_word_units(paragraph, start, end, measure, max_size))
+    
+    return units
+
+
+def _word_units(
+    paragraph: str,
+    start: int,
+    end: int,
+    measure: Callable[[str], int],
+    max_size: int
+) -> List[Tuple[int, int, int]]:
+    """Split ``paragraph[start:end]`` into word units, slicing words larger than ``max_size``."""
+    units = []
+    
+    for word in _WORD.finditer(paragraph, start, end):
+        word_start, word_end = word.span()
+        size = measure(paragraph[word_start:word_end])
+        if size <= max_size:
+            units.append((word_start, word_end, size))
+            continue
+        
+        # A single word longer than a chunk is cut into slices
+        while word_start < word_end:
+            slice_end = min(word_start + max(max_size, 1), word_end)
+            size = measure(paragraph[word_start:slice_end])
+            while size > max_size and slice_end - word_start > 1:
+                slice_end = word_start + (slice_end - word_start) // 2
+                size = measure(paragraph[word_start:slice_end])
+            units.append((word_start, slice_end, size))
+            word_start = slice_end
+    
+    return units
 
 
 class TextProcessor:
@@ -11,7 +388,9 @@ class TextProcessor:
         self,
         chunk_size: Union[int, Tuple[int, int]] = (300, 500),
         model: str = "gpt-4",
-        file_type: str = "text"
+        file_type: str = "text",
+        language: Optional[str] = None,
+        overlap: int = 0
     ):
         """Initialize text processor.
         
@@ -19,39 +398,40 @@ class TextProcessor:
             chunk_size: Maximum chunk size (int) or range (tuple)
             model: Tiktoken model name for tokenization
             file_type: Type of file being processed (text, markdown, code)
+            language: Tree-sitter grammar language of code, e.g. ``python``
+            overlap: Tokens each chunk shares with the end of the previous one
+            
+        Raises:
+            ValueError: If the overlap is not smaller than the minimum chunk size
         """
+        validate_overlap(chunk_size, overlap)
         self.chunk_size = chunk_size
         self.model = model
         self.file_type = file_type
+        self.language = language
+        self.overlap = overlap
         self.splitter = self._create_splitter()
     
-    def _create_splitter(self) -> Union[TextSplitter, MarkdownSplitter]:
-        """Create appropriate splitter based on file type."""
+    def _create_splitter(self) -> Splitter:
+        """Get an appropriate splitter from the shared splitter cache."""
+        return splitter_cache.get(self.file_type, self.model, self.chunk_size, self.language, self.overlap)
+    
+    @property
+    def splitter_type(self) -> str:
+        """Identify the splitter in use: the file type, or ``code:<language>`` with a grammar."""
+        return splitter_type(self.file_type, self.language)
+    
+    def count_tokens(self, text: str) -> Optional[int]:
+        """Count the tokens of a chunk.
         
-        # Use tiktoken tokenizer for accurate token counting
-        if self.file_type == "markdown":
-            if isinstance(self.chunk_size, tuple):
-                return MarkdownSplitter.from_tiktoken_model(
-                    self.model, 
-                    capacity=self.chunk_size
-                )
-            else:
-                return MarkdownSplitter.from_tiktoken_model(
-                    self.model, 
-                    capacity=self.chunk_size
-                )
-        else:
-            # Use TextSplitter for both text and code files
-            if isinstance(self.chunk_size, tuple):
-                return TextSplitter.from_tiktoken_model(
-                    self.model, 
-                    capacity=self.chunk_size
-                )
-            else:
-                return TextSplitter.from_tiktoken_model(
-                    self.model, 
-                    capacity=self.chunk_size
-                )
+        Args:
+            text: Chunk to count
+            
+        Returns:
+            Token count, or None when tiktoken is unavailable
+        """
+        count_tokens = _get_token_counter(self.model)
+        return count_tokens(text) if count_tokens else None
     
     def split_text(self, text: str) -> List[str]:
         """Split text into semantic chunks.
@@ -62,70 +442,423 @@ class TextProcessor:
         Returns:
             List of text chunks
         """
-        if not text.strip():
-            return []
+        return list(self.iter_chunks(text))
+    
+    def iter_chunks(self, text: str) -> Iterator[str]:
+        """Lazily yield stripped, non-empty semantic chunks of text.
+        
+        Args:
+            text: Input text to split
+            
+        Yields:
+            Text chunks in document order
+        """
+        if not text or text.isspace():
+            return
         
         try:
             chunks = self.splitter.chunks(text)
-            # Filter out empty chunks
-            return [chunk.strip() for chunk in chunks if chunk.strip()]
-        except Exception as e:
+        except Exception:
             # Fallback: simple text splitting if semantic splitting fails
-            return self._fallback_split(text)
+            chunks = self._fallback_split(text)
+        
+        for chunk in chunks:
+            # Filter out empty chunks
+            chunk = chunk.strip()
+            if chunk:
+                yield chunk
+    
+    def split_many(self, texts: Iterable[str], workers: Optional[int] = None) -> List[List[str]]:
+        """Split many texts, sharing this processor's splitter across threads.
+        
+        Threads avoid the pickling costs of a process pool, but only help
+        when the native splitter runs in parallel; when a one-time probe
+        finds that threads do not scale, texts are split serially.
+        
+        Args:
+            texts: Input texts to split
+            workers: Number of threads (defaults to the available cores)
+            
+        Returns:
+            Chunks of each text, in input order
+        """
+        texts = list(texts)
+        workers = min(workers or available_cores(), len(texts))
+        if workers <= 1 or not threads_scale(self.splitter):
+            return [self.split_text(text) for text in texts]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cut-it") as executor:
+            return list(executor.map(self.split_text, texts))
+    
+    def split_views(self, text: str) -> List[ChunkView]:
+        """Split text into chunks represented as views into the text.
+        
+        Prefer this to ``split_text`` when keeping the chunks of large texts
+        with a large ``overlap``: the views share the source instead of
+        copying every overlapping chunk. Splitting itself peaks at the same
+        memory as ``split_text``; only what is kept afterwards shrinks.
+        
+        Args:
+            text: Input text to split
+            
+        Returns:
+            List of views of stripped, non-empty chunks in document order
+        """
+        return list(self.iter_views(text))
+    
+    def iter_views(self, text: str) -> Iterator[ChunkView]:
+        """Lazily yield chunks as views into the text.
+        
+        The splitter still returns every chunk string at once, so peak
+        memory while splitting is the same as ``split_text``; the strings
+        are only used to find the bounds of their stripped text and are
+        dropped as views are produced, so only the views are kept afterwards.
+        
+        Args:
+            text: Input text to split
+            
+        Yields:
+            Views of stripped, non-empty chunks in document order
+        """
+        if not text or text.isspace():
+            return
+        
+        try:
+            indexed_chunks = self.splitter.chunk_indices(text)
+        except Exception:
+            indexed_chunks = self._locate_chunks(text, self._fallback_split(text))
+        
+        indexed_chunks.reverse()
+        while indexed_chunks:
+            start, chunk = indexed_chunks.pop()
+            stripped = len(chunk.strip())
+            if stripped:
+                start += len(chunk) - len(chunk.lstrip())
+                yield ChunkView(text, start, start + stripped)
+    
+    def split_with_offsets(self, text: str, byte_offsets: bool = False) -> List[ChunkRecord]:
+        """Split text into semantic chunks with their source offsets.
+        
+        Args:
+            text: Input text to split
+            byte_offsets: Report UTF-8 byte offsets instead of character offsets
+            
+        Returns:
+            List of chunk records in document order
+        """
+        return list(self.iter_records(text, byte_offsets=byte_offsets))
+    
+    def iter_records(self, text: str, byte_offsets: bool = False) -> Iterator[ChunkRecord]:
+        """Lazily yield chunk records with source offsets and token counts.
+        
+        Args:
+            text: Input text to split
+            byte_offsets: Report UTF-8 byte offsets instead of character offsets
+            
+        Yields:
+            Chunk records in document order
+        """
+        if not text or text.isspace():
+            return
+        
+        try:
+            indexed_chunks = self.splitter.chunk_indices(text)
+        except Exception:
+            # Fallback chunks carry no offsets, so locate them in the source
+            indexed_chunks = self._locate_chunks(text, self._fallback_split(text))
+        
+        yield from self._records_from_indices(text, indexed_chunks, byte_offsets)
+    
+    def _records_from_indices(
+        self,
+        text: str,
+        indexed_chunks: Iterable[Tuple[int, str]],
+        byte_offsets: bool = False
+    ) -> Iterator[ChunkRecord]:
+        """Turn (offset, chunk) pairs into records of stripped, non-empty chunks."""
+        # Byte offsets are tracked incrementally; ASCII text needs no conversion
+        convert = byte_offsets and not text.isascii()
+        char_position = byte_position = 0
+        
+        for start, chunk in indexed_chunks:
+            stripped = chunk.strip()
+            if not stripped:
+                continue
+            start += len(chunk) - len(chunk.lstrip())
+            end = start + len(stripped)
+            
+            if convert:
+                byte_position += len(text[char_position:start].encode('utf-8'))
+                char_position = start
+                start = byte_position
+                end = start + len(stripped.encode('utf-8'))
+            
+            yield ChunkRecord(start, end, self.count_tokens(stripped), stripped)
+    
+    @staticmethod
+    def _locate_chunks(text: str, chunks: List[str]) -> List[Tuple[int, str]]:
+        """Find the character offset of each chunk in the source text.
+        
+        Chunks that are not verbatim substrings (such as re-joined paragraphs)
+        are located by their first paragraph and widened to the source span
+        ending at their last paragraph.
+        """
+        located = []
+        cursor = 0
+        
+        for chunk in chunks:
+            start = text.find(chunk, cursor)
+            if start != -1:
+                located.append((start, chunk))
+                cursor = start + len(chunk)
+                continue
+            
+            paragraphs = chunk.split("\n\n")
+            start = text.find(paragraphs[0], cursor)
+            if start == -1:
+                start = cursor
+            end = text.find(paragraphs[-1], start)
+            end = end + len(paragraphs[-1]) if end != -1 else start + len(chunk)
+            located.append((start, text[start:end]))
+            cursor = end
+        
+        return located
+    
+    def _iter_window_splits(
+        self,
+        windows: Iterable[str]
+    ) -> Iterator[Tuple[str, Optional[List[Tuple[int, str]]], int]]:
+        """Split consecutive windows into settled chunks.
+        
+        The end of a window cuts the text short, which can change where the
+        splitter breaks well before it (the markdown splitter picks its
+        level by looking ahead), and a split starting mid-paragraph can
+        differ from one starting at the paragraph. Text is therefore
+        re-split with the next window until both splits start a chunk at the
+        same offset right after a blank line, and only the chunks before
+        that shared boundary are settled. Text without blank lines settles
+        at any shared boundary, which keeps memory bounded but may not match
+        splitting the whole text exactly.
+        
+        Args:
+            windows: Consecutive pieces of the input text
+            
+        Yields:
+            ``(text, indexed_chunks, consumed)`` tuples: the settled chunks
+            of ``text`` with their offsets (None when the splitter failed and
+            ``text`` must be split by the fallback), and the number of
+            characters of ``text`` they cover
+        """
+        pending = ""
+        # Chunk starts of the previous split of ``pending``, relative to it
+        previous: Set[int] = set()
+        
+        for window in windows:
+            text = pending + window
+            if not text or text.isspace():
+                pending = text
+                continue
+            
+            try:
+                indexed_chunks = self.splitter.chunk_indices(text)
+            except Exception:
+                # Fallback splitting has no offsets to carry, so flush the window
+                yield text, None, len(text)
+                pending, previous = "", set()
+                continue
+            
+            agreed = [index for index in range(1, len(indexed_chunks)) if indexed_chunks[index][0] in previous]
+            paragraphs = [index for index in agreed if text.endswith("\n\n", 0, indexed_chunks[index][0])]
+            sync = (paragraphs or agreed or [0])[-1]
+            consumed = indexed_chunks[sync][0] if sync else 0
+            if sync:
+                yield text, indexed_chunks[:sync], consumed
+            pending = text[consumed:]
+            previous = {start - consumed for start, _ in indexed_chunks[sync + 1:]}
+        
+        if pending and not pending.isspace():
+            try:
+                yield pending, self.splitter.chunk_indices(pending), len(pending)
+            except Exception:
+                yield pending, None, len(pending)
+    
+    def iter_window_chunks(self, windows: Iterable[str]) -> Iterator[str]:
+        """Lazily yield semantic chunks of text supplied as consecutive windows.
+        
+        The end of each window is re-split together with the next window
+        until the two splits agree on a chunk boundary at a paragraph, so
+        chunks match splitting the whole text at once while only about a
+        window of text is held in memory.
+        
+        Args:
+            windows: Consecutive pieces of the input text
+            
+        Yields:
+            Text chunks in document order
+        """
+        for text, indexed_chunks, _ in self._iter_window_splits(windows):
+            if indexed_chunks is None:
+                yield from self.iter_chunks(text)
+                continue
+            for _, chunk in indexed_chunks:
+                chunk = chunk.strip()
+                if chunk:
+                    yield chunk
+    
+    def iter_window_records(self, windows: Iterable[str]) -> Iterator[ChunkRecord]:
+        """Lazily yield chunk records of text supplied as consecutive windows.
+        
+        Windows are split like ``iter_window_chunks``; offsets are character
+        offsets into the concatenated windows.
+        
+        Args:
+            windows: Consecutive pieces of the input text
+            
+        Yields:
+            Chunk records in document order
+        """
+        # Character offset of the settled text in the whole text
+        base = 0
+        
+        for text, indexed_chunks, consumed in self._iter_window_splits(windows):
+            if indexed_chunks is None:
+                records = self.iter_records(text)
+            else:
+                records = self._records_from_indices(text, indexed_chunks)
+            for record in records:
+                yield record._replace(start=record.start + base, end=record.end + base)
+            base += consumed
     
     def _fallback_split(self, text: str) -> List[str]:
-        """Fallback splitting method when semantic splitting fails."""
-        # Simple paragraph-based splitting
-        paragraphs = text.split('\n\n')
-        chunks = []
-        current_chunk = ""
-        max_size = self.chunk_size[1] if isinstance(self.chunk_size, tuple) else self.chunk_size
-        
-        for paragraph in paragraphs:
+        """Fallback splitting method when semantic splitting fails.
+        
+        Paragraphs are packed into chunks of at most the maximum size, in
+        tokens when tiktoken is available and in characters otherwise. When
+        a paragraph does not fit, the chunk is closed if it has reached the
+        minimum size; otherwise, or when the paragraph alone exceeds the
+        maximum, the paragraph is split into sentences, then words, then
+        character slices. Each paragraph is measured once and each chunk is
+        joined once, so splitting takes linear time.
+        """
+        if isinstance(self.chunk_size, (tuple, list)):
+            min_size, max_size = self.chunk_size
+        else:
+            min_size, max_size = 0, self.chunk_size
+        measure = _get_token_counter(self.model) or len
+        separator_size = measure("\n\n")
+        
+        chunks: List[str] = []
+        # Pieces of the current chunk as [paragraph index, start, end] slices
+        segments: List[List[int]] = []
+        size = 0
+        paragraphs: List[str] = []
+        
+        def flush() -> None:
+            chunks.append("\n\n".join(paragraphs[index][start:end] for index, start, end in segments))
+            segments.clear()
+        
+        for paragraph in text.split('\n\n'):
             paragraph = paragraph.strip()
             if not paragraph:
                 continue
-                
-            # If adding this paragraph would exceed chunk size, save current chunk
-            if current_chunk and len(current_chunk) + len(paragraph) + 2 > max_size:
-                chunks.append(current_chunk.strip())
-                current_chunk = paragraph
-            else:
-                if current_chunk:
-                    current_chunk += "\n\n" + paragraph
+            index = len(paragraphs)
+            paragraphs.append(paragraph)
+            
+            paragraph_size = measure(paragraph)
+            if paragraph_size <= max_size:
+                cost = paragraph_size + (separator_size if segments else 0)
+                if size + cost <= max_size:
+                    segments.append([index, 0, len(paragraph)])
+                    size += cost
+                    continue
+                if size >= min_size:
+                    flush()
+                    segments.append([index, 0, len(paragraph)])
+                    size = paragraph_size
+                    continue
+            
+            # Too large for the chunk: fill it from the paragraph's sentences
+            units = deque(_sentence_units(paragraph, measure, max_size))
+            while units:
+                start, end, unit_size = units.popleft()
+                same_paragraph = bool(segments) and segments[-1][0] == index
+                if same_paragraph:
+                    cost = unit_size + measure(paragraph[segments[-1][2]:start])
                 else:
-                    current_chunk = paragraph
+                    cost = unit_size + (separator_size if segments else 0)
+                if segments and size + cost > max_size:
+                    if size < min_size:
+                        # Still below the minimum: continue with the sentence's words
+                        words = _word_units(paragraph, start, end, measure, max_size)
+                        if len(words) > 1:
+                            units.extendleft(reversed(words))
+                            continue
+                    flush()
+                    same_paragraph = False
+                    size, cost = 0, unit_size
+                if same_paragraph:
+                    segments[-1][2] = end
+                else:
+                    segments.append([index, start, end])
+                size += cost
         
-        # Add the last chunk if it exists
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        if segments:
+            flush()
         
         return chunks if chunks else [text.strip()]
     
-    def get_chunk_info(self, chunks: List[str]) -> dict:
+    def get_token_stats(
+        self,
+        chunks: Iterable[Union[str, ChunkRecord]],
+        percentiles: Iterable[int] = DEFAULT_PERCENTILES,
+        engine: str = "auto"
+    ) -> Optional[TokenStats]:
+        """Get per-chunk token counts and their distribution.
+        
+        Records keep the token counts taken while splitting, so pass records
+        (``split_with_offsets`` or ``iter_records``) to avoid tokenizing the
+        chunks again; plain chunks are tokenized here.
+        
+        Args:
+            chunks: Text chunks or chunk records
+            percentiles: Percentiles to compute (0-100)
+            engine: Statistics engine (auto, numpy, python)
+            
+        Returns:
+            Token statistics, or None when tiktoken is unavailable
+        """
+        count_tokens = _get_token_counter(self.model)
+        if count_tokens is None:
+            return None
+        
+        counts: List[int] = []
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                counts.append(count_tokens(chunk))
+            elif chunk.token_count is not None:
+                counts.append(chunk.token_count)
+            else:
+                counts.append(count_tokens(chunk.text))
+        return token_stats(counts, percentiles, engine)
+    
+    def get_chunk_info(
+        self,
+        chunks: List[str],
+        percentiles: Optional[Iterable[int]] = None,
+        engine: str = "auto"
+    ) -> dict:
         """Get information about the chunks.
         
+        Large chunk lists are summarized with NumPy when it is installed.
+        
         Args:
             chunks: List of text chunks
+            percentiles: Chunk size percentiles to add under ``chunk_size_percentiles``
+            engine: Statistics engine (auto, numpy, python)
             
         Returns:
             Dictionary with chunk statistics
         """
-        if not chunks:
-            return {
-                "total_chunks": 0,
-                "total_characters": 0,
-                "average_chunk_size": 0,
-                "min_chunk_size": 0,
-                "max_chunk_size": 0
-            }
-        
-        chunk_sizes = [len(chunk) for chunk in chunks]
-        
-        return {
-            "total_chunks": len(chunks),
-            "total_characters": sum(chunk_sizes),
-            "average_chunk_size": sum(chunk_sizes) // len(chunks),
-            "min_chunk_size": min(chunk_sizes),
-            "max_chunk_size": max(chunk_sizes)
-        }
\ No newline at end of file
+        return chunk_info(chunks, percentiles, engine)
@@ -0,0 +1,336 @@
+"""Summary statistics of chunk sizes and token counts.
+
+Statistics are computed with NumPy when it is installed (``pip install
+cut-it[stats]``) and the input is large enough to benefit, and in pure
+Python otherwise; both engines give identical results.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+# Percentiles reported by default
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
+ENGINES = ("auto", "numpy", "python")
+
+# Below this many values the "auto" engine stays in pure Python, where
+# NumPy's conversion and call overhead outweighs its speed
+_NUMPY_MIN_SIZE = 1024
+
+
+@lru_cache(maxsize=None)
+def _load_numpy() -> Any:
+    """Import NumPy, or return None when it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _select_numpy(engine: str, size: int) -> Any:
+    """Get the NumPy module if ``engine`` should use it for ``size`` values."""
+    if engine not in ENGINES:
+        raise ValueError(f"unknown statistics engine '{engine}', expected one of {', '.join(ENGINES)}")
+    if engine == "python":
+        return None
+    numpy = _load_numpy()
+    if engine == "numpy":
+        if numpy is None:
+            raise ImportError("the numpy engine needs NumPy (pip install cut-it[stats])")
+        return numpy
+    return numpy if size >= _NUMPY_MIN_SIZE else None
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Get a percentile of sorted values, interpolating linearly between ranks.
+
+    Matches NumPy's default (linear) percentile method.
+
+    Args:
+        sorted_values: Values in ascending order
+        q: Percentile between 0 and 100
+
+    Returns:
+        The percentile, or 0.0 for no values
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return float(sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction)
+
+
+class Summary(NamedTuple):
+    """Count, total, extremes and percentiles of a set of integers."""
+
+    count: int  # type: ignore[assignment]
+    total: int
+    min: int
+    max: int
+    percentiles: Dict[int, float]
+
+
+def summarize(
+    values: Sequence[int],
+    percentiles: Iterable[int] = DEFAULT_PERCENTILES,
+    engine: str = "auto"
+) -> Summary:
+    """Summarize integers such as chunk lengths or token counts.
+
+    Args:
+        values: Values to summarize (a list, ``array('q')`` or NumPy array)
+        percentiles: Percentiles to compute (0-100)
+        engine: ``numpy``, ``python``, or ``auto`` to use NumPy for large inputs
+
+    Returns:
+        Summary of the values; all zero for no values
+    """
+    percentiles = tuple(percentiles)
+    if not len(values):
+        return Summary(0, 0, 0, 0, {q: 0.0 for q in percentiles})
+
+    numpy = _select_numpy(engine, len(values))
+    if numpy is not None:
+        data = _as_array(numpy, values)
+        points = numpy.percentile(data, percentiles).tolist() if percentiles else []
+        return Summary(
+            len(data),
+            int(data.sum()),
+            int(data.min()),
+            int(data.max()),
+            dict(zip(percentiles, points)),
+        )
+
+    ordered = sorted(values)
+    return Summary(
+        len(ordered),
+        sum(ordered),
+        ordered[0],
+        ordered[-1],
+        {q: percentile(ordered, q) for q in percentiles},
+    )
+
+
+def _as_array(numpy: Any, values: Sequence[int]) -> Any:
+    """View or copy values as an int64 NumPy array."""
+    if isinstance(values, numpy.ndarray):
+        return values
+    if isinstance(values, array) and values.typecode == 'q':
+        # Shares the array's buffer instead of copying it
+        return numpy.frombuffer(values, dtype=numpy.int64)
+    return numpy.fromiter(values, dtype=numpy.int64, count=len(values))
+
+
+def chunk_lengths(chunks: Sequence[str], engine: str = "auto") -> Sequence[int]:
+    """Get the length of each chunk, as a NumPy array when the engine uses NumPy."""
+    numpy = _select_numpy(engine, len(chunks))
+    if numpy is not None:
+        lengths: Sequence[int] = numpy.fromiter(map(len, chunks), dtype=numpy.int64, count=len(chunks))
+        return lengths
+    return [len(chunk) for chunk in chunks]
+
+
+def _percentile_keys(percentiles: Dict[int, float]) -> Dict[str, float]:
+    return {f"p{q}": value for q, value in percentiles.items()}
+
+
+@dataclass
+class TokenStats:
+    """Token counts of a set of chunks and their distribution."""
+
+    token_counts: List[int]
+    total_tokens: int
+    min_tokens: int
+    max_tokens: int
+    mean_tokens: float
+    percentiles: Dict[int, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary, without per-chunk counts."""
+        return {
+            "total_tokens": self.total_tokens,
+            "min_tokens": self.min_tokens,
+            "max_tokens": self.max_tokens,
+            "mean_tokens": self.mean_tokens,
+            "percentiles": _percentile_keys(self.percentiles),
+        }
+
+
+def token_stats(
+    token_counts: Iterable[int],
+    percentiles: Iterable[int] = DEFAULT_PERCENTILES,
+    engine: str = "auto"
+) -> TokenStats:
+    """Summarize per-chunk token counts.
+
+    Args:
+        token_counts: Token count of each chunk, in chunk order
+        percentiles: Percentiles to compute (0-100)
+        engine: Statistics engine (auto, numpy, python)
+
+    Returns:
+        Token statistics; all zero for no chunks
+    """
+    counts = list(token_counts)
+    summary = summarize(counts, percentiles, engine)
+    return TokenStats(
+        token_counts=counts,
+        total_tokens=summary.total,
+        min_tokens=summary.min,
+        max_tokens=summary.max,
+        mean_tokens=summary.total / summary.count if summary.count else 0.0,
+        percentiles=summary.percentiles,
+    )
+
+
+class CorpusStats:
+    """Chunk statistics accumulated file by file into a corpus-level report.
+
+    Lengths and token counts are kept in compact integer arrays, so corpora
+    of millions of chunks can be summarized, including exact percentiles,
+    without holding any chunk text.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty corpus statistics."""
+        self.files: List[Dict[str, Any]] = []
+        self._lengths = array('q')
+        self._token_counts = array('q')
+        # Token statistics are only reported when every chunk was counted
+        self._tokens_complete = True
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(
+        self,
+        lengths: Iterable[int],
+        token_counts: Optional[Iterable[Optional[int]]] = None,
+        source: Optional[str] = None
+    ) -> None:
+        """Add the chunks of one file.
+
+        Args:
+            lengths: Character length of each chunk
+            token_counts: Token count of each chunk (None when unavailable)
+            source: File name recorded in the per-file summary
+        """
+        lengths = array('q', lengths)
+        counts = None
+        if token_counts is not None:
+            token_counts = list(token_counts)
+            known = [count for count in token_counts if count is not None]
+            if len(known) == len(token_counts) == len(lengths):
+                counts = array('q', known)
+
+        self._lengths.extend(lengths)
+        if counts is None:
+            self._tokens_complete = False
+            self._token_counts = array('q')
+        elif self._tokens_complete:
+            self._token_counts.extend(counts)
+
+        self.files.append({
+            "source": source,
+            "chunks": len(lengths),
+            "characters": sum(lengths),
+            "tokens": sum(counts) if counts is not None else None,
+        })
+
+    def add_chunks(self, chunks: Iterable[str], source: Optional[str] = None) -> None:
+        """Add the plain text chunks of one file, without token counts."""
+        self.add(map(len, chunks), source=source)
+
+    def add_records(self, records: Iterable[Any], source: Optional[str] = None) -> None:
+        """Add the chunk records of one file, using their token counts."""
+        lengths: List[int] = []
+        token_counts: List[Optional[int]] = []
+        for record in records:
+            lengths.append(len(record.text))
+            token_counts.append(record.token_count)
+        self.add(lengths, token_counts, source=source)
+
+    def merge(self, other: "CorpusStats") -> None:
+        """Add every file of another accumulator, e.g. one filled by a worker."""
+        self.files.extend(other.files)
+        self._lengths.extend(other._lengths)
+        if self._tokens_complete and other._tokens_complete:
+            self._token_counts.extend(other._token_counts)
+        else:
+            self._tokens_complete = False
+            self._token_counts = array('q')
+
+    def report(
+        self,
+        percentiles: Iterable[int] = DEFAULT_PERCENTILES,
+        engine: str = "auto",
+        include_files: bool = True
+    ) -> Dict[str, Any]:
+        """Build a JSON-serializable report of the whole corpus.
+
+        Args:
+            percentiles: Percentiles to compute (0-100)
+            engine: Statistics engine (auto, numpy, python)
+            include_files: Include a summary of every file
+
+        Returns:
+            Report with chunk size statistics, token statistics (None unless
+            every chunk has a token count) and optionally per-file summaries
+        """
+        percentiles = tuple(percentiles)
+        sizes = summarize(self._lengths, percentiles, engine)
+        report: Dict[str, Any] = {
+            "files": len(self.files),
+            "total_chunks": sizes.count,
+            "total_characters": sizes.total,
+            "average_chunk_size": sizes.total // sizes.count if sizes.count else 0,
+            "min_chunk_size": sizes.min,
+            "max_chunk_size": sizes.max,
+            "chunk_size_percentiles": _percentile_keys(sizes.percentiles),
+            "tokens": None,
+        }
+        if self._tokens_complete and self.files:
+            tokens = summarize(self._token_counts, percentiles, engine)
+            report["tokens"] = {
+                "total_tokens": tokens.total,
+                "min_tokens": tokens.min,
+                "max_tokens": tokens.max,
+                "mean_tokens": tokens.total / tokens.count if tokens.count else 0.0,
+                "percentiles": _percentile_keys(tokens.percentiles),
+            }
+        if include_files:
+            report["per_file"] = list(self.files)
+        return report
+
+
+def chunk_info(
+    chunks: Sequence[str],
+    percentiles: Optional[Iterable[int]] = None,
+    engine: str = "auto"
+) -> Dict[str, Any]:
+    """Compute ``get_chunk_info`` statistics in one pass over the chunk lengths.
+
+    Args:
+        chunks: Text chunks
+        percentiles: Percentiles of chunk size to add under ``chunk_size_percentiles``
+        engine: Statistics engine (auto, numpy, python)
+
+    Returns:
+        Dictionary with chunk statistics
+    """
+    summary = summarize(chunk_lengths(chunks, engine), percentiles or (), engine)
+    info: Dict[str, Any] = {
+        "total_chunks": summary.count,
+        "total_characters": summary.total,
+        "average_chunk_size": summary.total // summary.count if summary.count else 0,
+        "min_chunk_size": summary.min,
+        "max_chunk_size": summary.max,
+    }
+    if percentiles is not None:
+        info["chunk_size_percentiles"] = _percentile_keys(summary.percentiles)
+    return info
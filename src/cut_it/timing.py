@@ -0,0 +1,133 @@
+"""Per-stage wall and CPU timing with hooks for exporting measurements."""
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class StageTiming(NamedTuple):
+    """Wall-clock and CPU time spent in one pipeline stage."""
+
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float
+
+
+StageHook = Callable[[StageTiming], None]
+
+# Hooks called with every stage timing recorded by any StageTimer
+_stage_hooks: List[StageHook] = []
+
+
+def register_stage_hook(hook: StageHook) -> StageHook:
+    """Register a function called with every recorded stage timing.
+
+    Hooks can forward timings to a metrics system. The hook is returned so
+    this can be used as a decorator.
+
+    Args:
+        hook: Function receiving each StageTiming
+
+    Returns:
+        The registered hook
+    """
+    _stage_hooks.append(hook)
+    return hook
+
+
+def unregister_stage_hook(hook: StageHook) -> None:
+    """Remove a previously registered stage hook."""
+    if hook in _stage_hooks:
+        _stage_hooks.remove(hook)
+
+
+class StageTimer:
+    """Records wall and CPU time per named stage.
+
+    Stages may nest: time measured by an inner stage or by a timed iterator
+    is attributed to it and excluded from the enclosing stage, so lazily
+    produced chunks count as splitting even while they are being formatted.
+    """
+
+    def __init__(self, hooks: Optional[Iterable[StageHook]] = None):
+        """Initialize stage timer.
+
+        Args:
+            hooks: Hooks called with this timer's timings, in addition to registered ones
+        """
+        self.hooks = list(hooks or [])
+        self.timings: List[StageTiming] = []
+        # Own time of every measurement so far, subtracted from enclosing stages
+        self._inner_wall = 0.0
+        self._inner_cpu = 0.0
+
+    def record(self, stage: str, wall_seconds: float, cpu_seconds: float) -> StageTiming:
+        """Record a stage timing and pass it to every hook."""
+        timing = StageTiming(stage, wall_seconds, cpu_seconds)
+        self.timings.append(timing)
+        self._inner_wall += wall_seconds
+        self._inner_cpu += cpu_seconds
+        for hook in [*_stage_hooks, *self.hooks]:
+            hook(timing)
+        return timing
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one stage.
+
+        Args:
+            name: Stage name
+        """
+        inner_wall, inner_cpu = self._inner_wall, self._inner_cpu
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start - (self._inner_wall - inner_wall)
+            cpu = time.process_time() - cpu_start - (self._inner_cpu - inner_cpu)
+            self.record(name, max(wall, 0.0), max(cpu, 0.0))
+
+    def iterate(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        """Pass items through, timing how long producing them takes.
+
+        The total is recorded as one stage once the items are exhausted or
+        the iterator is closed.
+
+        Args:
+            name: Stage name
+            items: Iterable whose production is timed
+
+        Yields:
+            The items, unchanged
+        """
+        wall = cpu = 0.0
+        iterator = iter(items)
+        try:
+            while True:
+                wall_start, cpu_start = time.perf_counter(), time.process_time()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    wall += time.perf_counter() - wall_start
+                    cpu += time.process_time() - cpu_start
+                yield item
+        finally:
+            self.record(name, wall, cpu)
+
+    def totals(self) -> Dict[str, StageTiming]:
+        """Sum the timings of each stage, in order of first appearance."""
+        totals: Dict[str, StageTiming] = {}
+        for timing in self.timings:
+            previous = totals.get(timing.stage)
+            if previous is not None:
+                timing = StageTiming(
+                    timing.stage,
+                    previous.wall_seconds + timing.wall_seconds,
+                    previous.cpu_seconds + timing.cpu_seconds
+                )
+            totals[timing.stage] = timing
+        return totals
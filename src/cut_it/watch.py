@@ -0,0 +1,333 @@
+"""Watching a directory and re-chunking files as they change.
+
+Changes come from watchdog's native observers (inotify on Linux) when it
+is installed (``pip install cut-it[watch]``), and from polling file
+modification times otherwise. Bursts of writes to a file are debounced
+into a single refresh, and each refresh re-runs the incremental
+``process`` pipeline so task statuses of unchanged chunks are kept.
+"""
+
+import os
+import queue
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .batch import FileResult
+from .formatter import TaskFormatter
+from .grammars import language_for_path
+from .incremental import process_incremental
+from .splitter import TextProcessor
+from .walk import GENERATED_SUFFIXES, IgnoreTree, is_binary, suffix_set, walk_files
+
+# Seconds a file must stay unchanged before it is refreshed
+DEFAULT_DEBOUNCE = 0.5
+
+# Seconds between scans of the tree when polling
+DEFAULT_INTERVAL = 1.0
+
+# Watchdog event types that may change a file's contents
+_CHANGE_EVENTS = ("created", "modified", "moved", "closed")
+
+
+@lru_cache(maxsize=None)
+def _load_observer() -> Any:
+    """Get watchdog's native observer class, or None when it is not installed."""
+    try:
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+    return Observer
+
+
+def snapshot(
+    root: Union[str, Path],
+    extensions: Optional[Iterable[str]] = None,
+    gitignore: bool = True,
+    exclude: Iterable[Union[str, Path]] = ()
+) -> Dict[Path, Tuple[int, int]]:
+    """Record the modification time and size of every file a watcher follows.
+
+    Binary files are not sniffed here, to keep repeated scans cheap; they
+    are skipped when a change is reported.
+
+    Returns:
+        Mapping of each file to its (mtime in nanoseconds, size)
+    """
+    files = {}
+    for source in walk_files(root, extensions, gitignore=gitignore, skip_binary=False, exclude=exclude):
+        try:
+            stat = source.path.stat()
+        except OSError:
+            continue
+        files[source.path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def changed_files(
+    before: Dict[Path, Tuple[int, int]],
+    after: Dict[Path, Tuple[int, int]]
+) -> List[Path]:
+    """List files created or modified between two snapshots, in path order."""
+    return sorted(path for path, signature in after.items() if before.get(path) != signature)
+
+
+class _EventHandler:
+    """Forwards watchdog events about files the watcher follows."""
+
+    def __init__(self, watcher: "Watcher"):
+        self.watcher = watcher
+
+    def dispatch(self, event: Any) -> None:
+        if event.is_directory or event.event_type not in _CHANGE_EVENTS:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            if path:
+                self.watcher.notify(Path(os.fsdecode(path)))
+
+
+class Watcher:
+    """Reports files of a tree that changed, once their writes have settled.
+
+    Follows the same files as ``cut-it ingest``: ``.gitignore`` is honoured,
+    and task outputs and manifests are never reported, so writing outputs
+    inside the watched tree does not trigger further refreshes.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        extensions: Optional[Iterable[str]] = None,
+        gitignore: bool = True,
+        debounce: float = DEFAULT_DEBOUNCE,
+        interval: float = DEFAULT_INTERVAL,
+        native: Optional[bool] = None,
+        exclude: Iterable[Union[str, Path]] = ()
+    ):
+        """Initialize a watcher; call ``start`` (or use it as a context manager) to begin.
+
+        Args:
+            root: Directory to watch recursively
+            extensions: File suffixes to follow, e.g. ``.md`` (default: all)
+            gitignore: Ignore files matched by ``.gitignore``
+            debounce: Seconds a file must stay unchanged before it is reported
+            interval: Seconds between scans when polling
+            native: Use watchdog (True), polling (False), or watchdog when
+                installed (None)
+            exclude: Files or directories never to report
+
+        Raises:
+            ImportError: If ``native`` is True and watchdog is not installed
+        """
+        self.root = Path(os.path.abspath(root))
+        self.extensions = extensions
+        self.gitignore = gitignore
+        self.debounce = debounce
+        self.interval = interval
+        self.exclude = [os.path.abspath(path) for path in exclude]
+
+        observer = _load_observer()
+        if native and observer is None:
+            raise ImportError("native file watching needs watchdog (pip install cut-it[watch])")
+        self.native = observer is not None if native is None else native
+
+        self._suffixes = suffix_set(extensions)
+        self._ignore = IgnoreTree(self.root) if gitignore else None
+        self._events: "queue.Queue[Path]" = queue.Queue()
+        self._stopped = threading.Event()
+        self._observer: Any = None
+        self._poller: Optional[threading.Thread] = None
+
+    def accepts(self, path: Path) -> bool:
+        """Check whether a changed path is a file this watcher follows."""
+        name = path.name
+        if name.endswith(GENERATED_SUFFIXES):
+            return False
+        if name == ".gitignore" and self._ignore is not None:
+            self._ignore.forget()
+        if self._suffixes is not None and path.suffix.lower() not in self._suffixes:
+            return False
+        absolute = os.path.abspath(path)
+        if any(absolute == excluded or absolute.startswith(excluded + os.sep) for excluded in self.exclude):
+            return False
+        if self._ignore is not None:
+            return not self._ignore.is_ignored(absolute)
+        return '.git' not in Path(os.path.relpath(absolute, self.root)).parts
+
+    def notify(self, path: Path) -> None:
+        """Report a possibly changed path, e.g. from a file system event."""
+        if self.accepts(path):
+            self._events.put(path)
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        return snapshot(self.root, self.extensions, self.gitignore, self.exclude)
+
+    def _poll(self, files: Dict[Path, Tuple[int, int]]) -> None:
+        """Scan the tree every ``interval`` seconds, reporting changed files."""
+        while not self._stopped.wait(self.interval):
+            current = self._scan()
+            for path in changed_files(files, current):
+                self._events.put(path)
+            files = current
+
+    def start(self) -> "Watcher":
+        """Start watching in the background."""
+        self._stopped.clear()
+        if self.native:
+            self._observer = _load_observer()()
+            self._observer.schedule(_EventHandler(self), str(self.root), recursive=True)
+            self._observer.start()
+        else:
+            self._poller = threading.Thread(target=self._poll, args=(self._scan(),), daemon=True)
+            self._poller.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop watching; ``batches`` returns once it notices."""
+        self._stopped.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._poller is not None:
+            self._poller.join()
+            self._poller = None
+
+    def __enter__(self) -> "Watcher":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def batches(self) -> Iterator[List[Path]]:
+        """Yield changed files whose writes have settled, until stopped.
+
+        A file is reported once no change to it was seen for ``debounce``
+        seconds, so an editor's save or a burst of writes produces a single
+        refresh. Files deleted or found to be binary in the meantime are
+        dropped.
+
+        Yields:
+            Changed files in path order
+        """
+        pending: Dict[Path, float] = {}
+        while not self._stopped.is_set():
+            timeout = self.interval
+            if pending:
+                timeout = max(0.0, min(pending.values()) + self.debounce - time.monotonic())
+            try:
+                path = self._events.get(timeout=min(timeout, 0.25))
+            except queue.Empty:
+                pass
+            else:
+                pending[path] = time.monotonic()
+
+            now = time.monotonic()
+            settled = sorted(path for path, seen in pending.items() if now - seen >= self.debounce)
+            for path in settled:
+                del pending[path]
+            ready = [path for path in settled if path.is_file() and not is_binary(path)]
+            if ready:
+                yield ready
+
+
+class Refresher:
+    """Re-chunks changed files into their ``.tasks.md`` outputs with warm processors.
+
+    Processors are created once per file type and language and reused for
+    every refresh, so their splitters stay loaded between changes. Outputs
+    are named the way ``process`` names them, so files that differ only in
+    their extension (``app.py`` and ``app.md``) share one output: the first
+    one refreshed keeps it and the others are refused.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        classify: Callable[[Path], str],
+        chunk_size: Union[int, Tuple[int, int]] = (300, 500),
+        model: str = "gpt-4",
+        pt_br: bool = False,
+        output_dir: Optional[Path] = None,
+        overlap: int = 0
+    ):
+        """Initialize a refresher.
+
+        Args:
+            root: Watched directory
+            classify: Function giving the file type (text, markdown, code) of a path
+            chunk_size: Maximum chunk size (int) or range (tuple)
+            model: Tiktoken model name for tokenization
+            pt_br: Write outputs in Portuguese (Brazil)
+            output_dir: Directory mirroring the tree for outputs (default: next to each file)
+            overlap: Tokens each chunk shares with the previous one
+        """
+        self.root = Path(os.path.abspath(root))
+        self.classify = classify
+        self.chunk_size = chunk_size
+        self.model = model
+        self.output_dir = output_dir
+        self.overlap = overlap
+        self.formatter = TaskFormatter(pt_br=pt_br)
+        self._processors: Dict[Tuple[str, Optional[str], int], TextProcessor] = {}
+        # Source file refreshed into each output, to refuse name clashes
+        self._sources: Dict[Path, Path] = {}
+
+    def output_for(self, path: Path) -> Path:
+        """Get the task output of a file, named the way ``process`` names it."""
+        output_path = path.with_suffix(".tasks.md")
+        if self.output_dir is None:
+            return output_path
+        return self.output_dir / Path(os.path.abspath(path)).relative_to(self.root).parent / output_path.name
+
+    def is_stale(self, path: Path) -> bool:
+        """Check whether a file's output is missing or older than the file."""
+        try:
+            return self.output_for(path).stat().st_mtime_ns < path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return True
+
+    def _get_processor(self, file_type: str, language: Optional[str]) -> TextProcessor:
+        key = (file_type, language, self.overlap)
+        processor = self._processors.get(key)
+        if processor is None:
+            processor = self._processors[key] = TextProcessor(
+                chunk_size=self.chunk_size,
+                model=self.model,
+                file_type=file_type,
+                language=language,
+                overlap=self.overlap
+            )
+        return processor
+
+    def refresh(self, path: Path) -> FileResult:
+        """Re-chunk one file, keeping the task statuses of unchanged chunks.
+
+        Args:
+            path: Changed file
+
+        Returns:
+            Result of the refresh; failures are captured in ``error``
+        """
+        output_file = self.output_for(path)
+        result = FileResult(input_path=path, output_path=output_file)
+        owner = self._sources.setdefault(output_file, path)
+        if owner != path and owner.exists():
+            result.error = f"{owner} and {path} both write to {output_file}"
+            return result
+        self._sources[output_file] = path
+        try:
+            file_type = self.classify(path)
+            language = language_for_path(path) if file_type == "code" else None
+            result.size = path.stat().st_size
+            text = path.read_text(encoding='utf-8')
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            rechunked = process_incremental(
+                self._get_processor(file_type, language), self.formatter, text, path.name, output_file
+            )
+            result.chunks = len(rechunked.records)
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        return result
@@ -1,13 +1,22 @@
 """Pytest configuration and shared fixtures."""
 
 import pytest
+import random
 import tempfile
 import shutil
 from pathlib import Path
 from unittest.mock import Mock
 from cut_it.config import Config, ConfigManager
 from cut_it.formatter import TaskFormatter
-from cut_it.splitter import TextProcessor
+from cut_it.splitter import TextProcessor, splitter_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_splitter_cache():
+    """Start every test with an empty process-wide splitter cache."""
+    splitter_cache.clear()
+    yield
+    splitter_cache.clear()
 
 
 @pytest.fixture
@@ -170,6 +179,22 @@ if __name__ == "__main__":
     '''.strip()
 
 
+@pytest.fixture
+def document_factory():
+    """Factory for reproducible documents with varied paragraph lengths."""
+    def generate_document(paragraphs=300, markdown=False, seed=7):
+        rng = random.Random(seed)
+        words = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod".split()
+        parts = []
+        for i in range(paragraphs):
+            if markdown and rng.random() < 0.15:
+                parts.append("#" * rng.randint(1, 3) + f" Heading {i}")
+            parts.append(" ".join(rng.choice(words) for _ in range(rng.randint(5, 120))) + ".")
+        return "\n\n".join(parts)
+    
+    return generate_document
+
+
 @pytest.fixture
 def mock_splitter():
     """Create a mock splitter for testing."""
@@ -216,6 +241,33 @@ def temp_code_file(temp_dir, sample_code):
     return file_path
 
 
+@pytest.fixture
+def source_tree(temp_dir):
+    """Create a small repository with gitignore files at two levels."""
+    files = {
+        ".gitignore": "build/\n*.log\n/top.txt\n",
+        "README.md": "# Project\n\nIntroduction.",
+        "top.txt": "Ignored at the root only.",
+        "debug.log": "Ignored everywhere.",
+        "src/app.py": "def main():\n    return 0\n",
+        "src/top.txt": "Not anchored here, so kept.",
+        "src/.gitignore": "generated_*.py\n!generated_keep.py\n",
+        "src/generated_parser.py": "x = 1\n",
+        "src/generated_keep.py": "y = 2\n",
+        "build/out.txt": "Build output.",
+        "docs/guide.md": "# Guide\n\nUsage.",
+        "docs/old.tasks.md": "# generated",
+    }
+    for name, content in files.items():
+        path = temp_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+    (temp_dir / ".git").mkdir()
+    (temp_dir / ".git" / "HEAD").write_text("ref: refs/heads/main\n", encoding='utf-8')
+    (temp_dir / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR")
+    return temp_dir
+
+
 @pytest.fixture
 def formatted_tasks():
     """Sample formatted task output."""
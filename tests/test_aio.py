@@ -0,0 +1,140 @@
+"""Tests for the asyncio text processing module."""
+
+import asyncio
+import threading
+import time
+import pytest
+from cut_it.aio import AsyncTextProcessor
+from cut_it.splitter import TextProcessor
+
+
+class SlowSplit:
+    """Blocking split stand-in that records how many calls overlap."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.finished = []
+
+    def __call__(self, text):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+            self.finished.append(text)
+        return [text]
+
+
+class TestAsyncTextProcessor:
+    """Test cases for AsyncTextProcessor."""
+
+    def test_matches_sync(self, document_factory):
+        """Test async results equal splitting synchronously, in input order."""
+        texts = [document_factory(paragraphs=30, seed=seed) for seed in range(6)]
+        expected = [TextProcessor().split_text(text) for text in texts]
+        
+        async def main():
+            async with AsyncTextProcessor(max_concurrency=3) as processor:
+                single = await processor.split_text(texts[0])
+                many = await processor.split_many(texts)
+            return single, many
+        
+        single, many = asyncio.run(main())
+        assert single == expected[0]
+        assert many == expected
+
+    def test_event_loop_keeps_running(self):
+        """Test other coroutines run while a split is in progress."""
+        ticks = []
+        
+        async def ticker(stop):
+            while not stop.is_set():
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.005)
+        
+        async def main():
+            processor = AsyncTextProcessor()
+            processor.processor.split_text = SlowSplit(delay=0.2)
+            stop = asyncio.Event()
+            tick_task = asyncio.ensure_future(ticker(stop))
+            await processor.split_text("text")
+            stop.set()
+            await tick_task
+            processor.close()
+        
+        asyncio.run(main())
+        assert len(ticks) > 5
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency splits run at once."""
+        slow = SlowSplit()
+        
+        async def main():
+            async with AsyncTextProcessor(max_concurrency=2) as processor:
+                processor.processor.split_text = slow
+                return await processor.split_many([str(i) for i in range(8)])
+        
+        assert asyncio.run(main()) == [[str(i)] for i in range(8)]
+        assert slow.peak == 2
+
+    def test_cancellation(self):
+        """Test cancelled calls drop queued work and keep running work bounded."""
+        slow = SlowSplit(delay=0.1)
+        
+        async def main():
+            processor = AsyncTextProcessor(max_concurrency=1)
+            processor.processor.split_text = slow
+            running = asyncio.ensure_future(processor.split_text("running"))
+            queued = asyncio.ensure_future(processor.split_text("queued"))
+            await asyncio.sleep(0.02)
+            running.cancel()
+            queued.cancel()
+            
+            # The running split still holds the only slot until it finishes
+            start = time.perf_counter()
+            assert await processor.split_text("after") == ["after"]
+            waited = time.perf_counter() - start
+            processor.close()
+            return running, queued, waited
+        
+        running, queued, waited = asyncio.run(main())
+        assert running.cancelled() and queued.cancelled()
+        assert slow.finished == ["running", "after"]
+        assert slow.peak == 1
+        assert waited >= 0.05
+
+    def test_split_many_error_cancels_rest(self):
+        """Test a failing split cancels the others and raises."""
+        def split(text):
+            if text == "bad":
+                raise RuntimeError("boom")
+            time.sleep(0.05)
+            return [text]
+        
+        async def main():
+            async with AsyncTextProcessor(max_concurrency=1) as processor:
+                processor.processor.split_text = split
+                await processor.split_many(["bad", "a", "b", "c"])
+        
+        with pytest.raises(RuntimeError):
+            asyncio.run(main())
+
+    def test_process_pool(self):
+        """Test splitting in worker processes."""
+        async def main():
+            async with AsyncTextProcessor(max_concurrency=2, use_processes=True) as processor:
+                return await processor.split_many(["First.\n\nSecond.", "Third."])
+        
+        assert asyncio.run(main()) == [
+            TextProcessor().split_text("First.\n\nSecond."),
+            TextProcessor().split_text("Third."),
+        ]
+
+    def test_invalid_concurrency(self):
+        """Test max_concurrency must be positive."""
+        with pytest.raises(ValueError):
+            AsyncTextProcessor(max_concurrency=0)
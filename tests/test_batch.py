@@ -0,0 +1,126 @@
+"""Tests for the batch processing module."""
+
+import pytest
+from pathlib import Path
+from typer.testing import CliRunner
+from cut_it.batch import (
+    BatchItem,
+    BatchSettings,
+    expand_inputs,
+    is_batch_pattern,
+    plan_outputs,
+    run_batch,
+)
+from cut_it.cli import app
+from cut_it.config import ConfigManager
+
+
+@pytest.fixture
+def corpus_dir(temp_dir):
+    """Create a directory tree with a few input files."""
+    (temp_dir / "a.txt").write_text("First file.\n\nWith two paragraphs.", encoding='utf-8')
+    (temp_dir / "b.md").write_text("# Title\n\nSome markdown.", encoding='utf-8')
+    (temp_dir / "nested").mkdir()
+    (temp_dir / "nested" / "c.txt").write_text("Nested file.", encoding='utf-8')
+    (temp_dir / "old.tasks.md").write_text("# generated", encoding='utf-8')
+    return temp_dir
+
+
+class TestExpandInputs:
+    """Test cases for input expansion."""
+
+    def test_is_batch_pattern(self, corpus_dir):
+        """Test detection of directory and glob arguments."""
+        assert is_batch_pattern(str(corpus_dir))
+        assert is_batch_pattern("*.txt")
+        assert not is_batch_pattern(str(corpus_dir / "a.txt"))
+
+    def test_expand_directory(self, corpus_dir):
+        """Test directories are walked recursively, skipping outputs."""
+        paths = expand_inputs([str(corpus_dir)])
+        names = [path.name for path in paths]
+        assert names == ["a.txt", "b.md", "c.txt"]
+
+    def test_expand_directory_skips_ignored_files(self, corpus_dir):
+        """Test directory walks skip git metadata, ignored and binary files."""
+        (corpus_dir / ".git" / "hooks").mkdir(parents=True)
+        (corpus_dir / ".git" / "HEAD").write_text("ref: refs/heads/main", encoding='utf-8')
+        (corpus_dir / ".git" / "hooks" / "pre-commit.sample").write_text("#!/bin/sh", encoding='utf-8')
+        (corpus_dir / ".gitignore").write_text("node_modules/\n", encoding='utf-8')
+        (corpus_dir / "node_modules").mkdir()
+        (corpus_dir / "node_modules" / "junk.js").write_text("junk()", encoding='utf-8')
+        (corpus_dir / "image.png").write_bytes(b"\x89PNG\x00\x00")
+
+        paths = expand_inputs([str(corpus_dir)])
+
+        assert [path.name for path in paths] == [".gitignore", "a.txt", "b.md", "c.txt"]
+        assert paths[1] == corpus_dir / "a.txt"
+
+    def test_expand_glob(self, corpus_dir):
+        """Test glob patterns are expanded in sorted order."""
+        paths = expand_inputs([str(corpus_dir / "**" / "*.txt")])
+        assert [path.name for path in paths] == ["a.txt", "c.txt"]
+
+    def test_expand_deduplicates(self, corpus_dir):
+        """Test repeated inputs are only processed once."""
+        file_path = str(corpus_dir / "a.txt")
+        paths = expand_inputs([file_path, str(corpus_dir / "*.txt"), file_path])
+        assert paths == [Path(file_path)]
+
+    def test_plan_outputs_default(self, corpus_dir):
+        """Test outputs are placed next to inputs by default."""
+        pairs = plan_outputs([corpus_dir / "a.txt"])
+        assert pairs == [(corpus_dir / "a.txt", corpus_dir / "a.tasks.md")]
+
+    def test_plan_outputs_collision(self, corpus_dir):
+        """Test colliding output names in an output directory are rejected."""
+        inputs = [corpus_dir / "a.txt", corpus_dir / "nested" / "a.txt"]
+        with pytest.raises(ValueError):
+            plan_outputs(inputs, corpus_dir / "out")
+
+
+class TestRunBatch:
+    """Test cases for running a batch."""
+
+    def _items(self, directory):
+        names = ["a.txt", "bad.txt", "b.md", "nested/c.txt"]
+        (directory / "bad.txt").write_bytes(b"\xff\xfe invalid utf-8")
+        return [
+            BatchItem(
+                directory / name,
+                directory / "out" / Path(name).with_suffix(".tasks.md").name,
+                "markdown" if name.endswith(".md") else "text"
+            )
+            for name in names
+        ]
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_order_and_failures(self, corpus_dir, jobs):
+        """Test results keep input order and failures do not abort the run."""
+        items = self._items(corpus_dir)
+        results = list(run_batch(items, BatchSettings(), jobs=jobs))
+
+        assert [result.input_path for result in results] == [item.input_path for item in items]
+        assert [result.ok for result in results] == [True, False, True, True]
+        assert "UnicodeDecodeError" in results[1].error
+        for result in results:
+            if result.ok:
+                assert result.chunks >= 1
+                assert result.output_path.read_text(encoding='utf-8').startswith(
+                    f"# {result.input_path.name}"
+                )
+
+    def test_cli_batch(self, corpus_dir, temp_config_file, monkeypatch):
+        """Test the process command with a directory and several jobs."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_config_file))
+        output_dir = corpus_dir / "out"
+
+        result = CliRunner().invoke(app, [
+            "process", str(corpus_dir), "--jobs", "2", "--output", str(output_dir)
+        ])
+
+        assert result.exit_code == 0, result.stdout
+        assert sorted(path.name for path in output_dir.iterdir()) == [
+            "a.tasks.md", "b.tasks.md", "c.tasks.md"
+        ]
+        assert "3 file(s) processed, 0 failed" in result.stdout
@@ -0,0 +1,128 @@
+"""Tests for the benchmark module."""
+
+import json
+import pytest
+from typer.testing import CliRunner
+from cut_it.bench import (
+    CORPUS_KINDS,
+    STAGES,
+    format_size,
+    generate_corpus,
+    parse_size,
+    run_benchmarks,
+    run_scaling_benchmark,
+    write_report,
+)
+from cut_it.cli import app
+from cut_it.config import ConfigManager
+
+
+class TestCorpus:
+    """Test cases for synthetic corpus generation."""
+
+    def test_parse_size(self):
+        """Test sizes with and without units."""
+        assert parse_size("1KB") == 1024
+        assert parse_size("500mb") == 500 * 1024 * 1024
+        assert parse_size("1.5KB") == 1536
+        assert parse_size("77") == 77
+        for size in ("", "MB", "-1KB", "ten"):
+            with pytest.raises(ValueError):
+                parse_size(size)
+
+    def test_format_size(self):
+        """Test sizes are labelled with the largest whole unit."""
+        assert format_size(1024) == "1KB"
+        assert format_size(500 * 1024 * 1024) == "500MB"
+        assert format_size(1536) == "1536B"
+
+    @pytest.mark.parametrize("kind", CORPUS_KINDS)
+    def test_exact_size_and_reproducible(self, kind):
+        """Test corpora have the requested size and do not change between runs."""
+        corpus = generate_corpus(kind, 5000)
+        
+        assert len(corpus.encode('utf-8')) == 5000
+        assert corpus == generate_corpus(kind, 5000)
+        assert corpus != generate_corpus(kind, 5000, seed=1)
+
+    def test_markdown_has_headings(self):
+        """Test markdown corpora contain headings for the markdown splitter."""
+        assert "\n# " in generate_corpus("markdown", 20000) or "\n## " in generate_corpus("markdown", 20000)
+
+    def test_unknown_kind(self):
+        """Test unknown corpus kinds are rejected."""
+        with pytest.raises(ValueError):
+            generate_corpus("latex", 100)
+
+
+class TestRunBenchmarks:
+    """Test cases for running benchmarks."""
+
+    def test_results_for_every_stage(self):
+        """Test one result is reported per kind, size and stage."""
+        seen = []
+        results = run_benchmarks([1024, 4096], kinds=["text", "code"], repeat=1, on_result=seen.append)
+        
+        assert len(results) == 2 * 2 * len(STAGES)
+        assert seen == results
+        for result in results:
+            assert result.best_seconds <= result.mean_seconds
+            assert result.chunks > 0
+            assert result.mb_per_s > 0
+
+    def test_stage_selection(self):
+        """Test only the selected stages are reported."""
+        results = run_benchmarks([1024], kinds=["markdown"], stages=["format"], repeat=1)
+        assert [result.stage for result in results] == ["format"]
+
+    def test_write_report(self, temp_dir):
+        """Test results are written as JSON with environment details."""
+        path = temp_dir / "bench.json"
+        write_report(run_benchmarks([1024], kinds=["text"], repeat=1), path)
+        
+        report = json.loads(path.read_text(encoding='utf-8'))
+        assert "cut_it_version" in report
+        assert [result["stage"] for result in report["results"]] == list(STAGES)
+
+    def test_cli_bench(self, temp_dir, monkeypatch):
+        """Test the bench command prints a table and saves JSON."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_dir / "config.json"))
+        path = temp_dir / "bench.json"
+        
+        result = CliRunner().invoke(app, [
+            "bench", "--sizes", "1KB,2KB", "--kinds", "text", "--repeat", "1", "-o", str(path)
+        ])
+        
+        assert result.exit_code == 0, result.stdout
+        assert "split" in result.stdout
+        assert len(json.loads(path.read_text(encoding='utf-8'))["results"]) == 2 * len(STAGES)
+
+    def test_cli_bench_invalid_kind(self, temp_dir, monkeypatch):
+        """Test unknown kinds are reported."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_dir / "config.json"))
+        result = CliRunner().invoke(app, ["bench", "--kinds", "latex"])
+        assert result.exit_code == 1
+
+    def test_scaling_benchmark(self):
+        """Test serial, thread and process modes are compared."""
+        results = run_scaling_benchmark([1, 2], documents=4, size_bytes=2048)
+        
+        assert [(result.mode, result.workers) for result in results] == [
+            ("serial", 1), ("thread", 1), ("process", 1), ("thread", 2), ("process", 2)
+        ]
+        assert results[0].speedup == 1.0
+        assert all(result.seconds > 0 and result.documents == 4 for result in results)
+
+    def test_cli_bench_scaling(self, temp_dir, monkeypatch):
+        """Test the scaling benchmark from the command line."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_dir / "config.json"))
+        path = temp_dir / "scaling.json"
+        
+        result = CliRunner().invoke(app, [
+            "bench", "--scaling", "--workers", "1,2", "--documents", "2", "--document-size", "1KB", "-o", str(path)
+        ])
+        
+        assert result.exit_code == 0, result.stdout
+        report = json.loads(path.read_text(encoding='utf-8'))
+        assert report["cores"] >= 1
+        assert {entry["mode"] for entry in report["results"]} == {"serial", "thread", "process"}
@@ -0,0 +1,204 @@
+"""Tests for the on-disk chunk cache module."""
+
+import os
+import pytest
+from typer.testing import CliRunner
+from cut_it.batch import BatchItem, BatchSettings, run_batch
+from cut_it.cache import ChunkCache, store_chunks
+from cut_it.cli import app
+from cut_it.config import Config, ConfigManager
+from cut_it.splitter import TextProcessor
+
+
+@pytest.fixture
+def cache(temp_dir):
+    """A chunk cache in a temporary directory."""
+    return ChunkCache(temp_dir / "cache")
+
+
+def age(cache, key, seconds):
+    """Mark a cache entry as last used ``seconds`` ago."""
+    path = cache._entry_path(key)
+    stat = path.stat()
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+class TestChunkCache:
+    """Test cases for ChunkCache."""
+
+    def test_key_depends_on_content_and_settings(self):
+        """Test the key changes with any input to splitting."""
+        base = ChunkCache.make_key(b"text", "gpt-4", (300, 500), "text")
+
+        assert ChunkCache.make_key(b"text", "gpt-4", [300, 500], "text") == base
+        assert ChunkCache.make_key(b"text!", "gpt-4", (300, 500), "text") != base
+        assert ChunkCache.make_key(b"text", "gpt-3.5-turbo", (300, 500), "text") != base
+        assert ChunkCache.make_key(b"text", "gpt-4", (300, 600), "text") != base
+        assert ChunkCache.make_key(b"text", "gpt-4", (300, 500), "markdown") != base
+        assert ChunkCache.make_key(b"text", "gpt-4", (300, 500), "text", overlap=0) == base
+        assert ChunkCache.make_key(b"text", "gpt-4", (300, 500), "text", overlap=50) != base
+
+    def test_key_from_path(self, temp_dir):
+        """Test hashing a file matches hashing its bytes."""
+        path = temp_dir / "doc.txt"
+        path.write_bytes(b"x" * 3_000_000)
+
+        assert ChunkCache.make_key(path, "gpt-4", 500, "text") == ChunkCache.make_key(
+            b"x" * 3_000_000, "gpt-4", 500, "text"
+        )
+
+    def test_round_trip(self, cache):
+        """Test stored chunk lists are returned unchanged."""
+        chunks = ["first chunk", "ação çã 日本語"]
+        cache.put("ab" * 32, chunks)
+
+        assert cache.get("ab" * 32) == chunks
+        assert cache.get("cd" * 32) is None
+
+    def test_corrupt_entry_is_a_miss(self, cache):
+        """Test unreadable entries are treated as misses."""
+        cache.put("ab" * 32, ["chunk"])
+        cache._entry_path("ab" * 32).write_text("{not json", encoding='utf-8')
+
+        assert cache.get("ab" * 32) is None
+
+    def test_stats(self, cache):
+        """Test stats count entries and bytes."""
+        assert cache.stats().entries == 0
+
+        cache.put("ab" * 32, ["chunk"])
+        cache.put("cd" * 32, ["other chunk"])
+
+        info = cache.stats()
+        assert info.entries == 2
+        assert info.total_bytes > 0
+
+    def test_prune_evicts_least_recently_used(self, cache):
+        """Test pruning removes the oldest entries first."""
+        keys = ["a" * 64, "b" * 64, "c" * 64]
+        for seconds, key in zip((300, 200, 100), keys):
+            cache.put(key, ["x" * 100])
+            age(cache, key, seconds)
+        cache.get(keys[0])
+        entry_size = cache._entry_path(keys[0]).stat().st_size
+
+        removed = cache.prune(max_bytes=entry_size * 2)
+
+        assert removed == 1
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+
+    def test_put_enforces_max_bytes(self, temp_dir):
+        """Test the cache stays within its size limit as entries are added."""
+        cache = ChunkCache(temp_dir / "cache", max_bytes=1000)
+        for index in range(20):
+            cache.put(f"{index:064x}", ["x" * 100])
+
+        assert cache.stats().total_bytes <= 1000
+        assert cache.get(f"{19:064x}") is not None
+
+    def test_clear(self, cache):
+        """Test clearing removes every entry."""
+        cache.put("ab" * 32, ["chunk"])
+        cache.put("cd" * 32, ["chunk"])
+
+        assert cache.clear() == 2
+        assert cache.stats().entries == 0
+
+    def test_store_chunks(self, cache):
+        """Test chunks are passed through and stored once exhausted."""
+        stored = store_chunks(cache, "ab" * 32, iter(["one", "two"]))
+
+        assert next(stored) == "one"
+        assert cache.get("ab" * 32) is None
+        assert list(stored) == ["two"]
+        assert cache.get("ab" * 32) == ["one", "two"]
+
+
+class TestCacheIntegration:
+    """Test cases for using the cache when processing files."""
+
+    @pytest.fixture
+    def config_manager(self, temp_dir, monkeypatch):
+        """A config manager with the cache enabled."""
+        config_manager = ConfigManager(temp_dir / "config" / "config.json")
+        config_manager.save(Config(cache_enabled=True))
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: config_manager)
+        return config_manager
+
+    def test_cli_cache_hit_skips_splitting(self, config_manager, document_factory, temp_dir, monkeypatch):
+        """Test a second run of an unchanged file reuses cached chunks."""
+        source = temp_dir / "doc.md"
+        source.write_text(document_factory(markdown=True), encoding='utf-8')
+        runner = CliRunner()
+
+        first = runner.invoke(app, ["process", str(source), "-o", str(temp_dir / "first.md")])
+
+        def fail(self, text):
+            raise AssertionError("splitting should be skipped")
+
+        monkeypatch.setattr(TextProcessor, "iter_chunks", fail)
+        second = runner.invoke(app, ["process", str(source), "-o", str(temp_dir / "second.md")])
+
+        assert first.exit_code == 0, first.stdout
+        assert second.exit_code == 0, second.stdout
+        assert (temp_dir / "first.md").read_text(encoding='utf-8') == (temp_dir / "second.md").read_text(encoding='utf-8')
+        assert ChunkCache(config_manager.cache_dir).stats().entries == 1
+
+    def test_cli_mmap_bypasses_cache(self, config_manager, document_factory, temp_dir, monkeypatch):
+        """Test memory-mapped inputs stream their chunks instead of collecting them for the cache."""
+        config_manager.save(Config(cache_enabled=True, mmap_threshold_mb=0))
+        source = temp_dir / "doc.md"
+        source.write_text(document_factory(markdown=True), encoding='utf-8')
+
+        def collect(cache, key, chunks):
+            raise AssertionError("windowed chunks should not be collected")
+
+        monkeypatch.setattr("cut_it.cli.store_chunks", collect)
+        result = CliRunner().invoke(app, ["process", str(source)])
+
+        assert result.exit_code == 0, result.stdout
+        assert (temp_dir / "doc.tasks.md").exists()
+        assert ChunkCache(config_manager.cache_dir).stats().entries == 0
+
+    def test_cli_no_cache(self, config_manager, temp_dir):
+        """Test --no-cache leaves the cache untouched."""
+        source = temp_dir / "doc.txt"
+        source.write_text("Some text to split.", encoding='utf-8')
+
+        result = CliRunner().invoke(app, ["process", str(source), "--no-cache"])
+
+        assert result.exit_code == 0, result.stdout
+        assert ChunkCache(config_manager.cache_dir).stats().entries == 0
+
+    def test_batch_uses_cache(self, temp_dir):
+        """Test batch workers store and reuse cached chunks."""
+        source = temp_dir / "doc.txt"
+        source.write_text("First paragraph.\n\nSecond paragraph.", encoding='utf-8')
+        settings = BatchSettings(cache_dir=temp_dir / "cache")
+        items = [BatchItem(source, temp_dir / "doc.tasks.md", "text")]
+
+        first = list(run_batch(items, settings, jobs=1))
+        second = list(run_batch(items, settings, jobs=1))
+
+        assert first[0].ok and second[0].ok
+        assert first[0].chunks == second[0].chunks
+        assert ChunkCache(settings.cache_dir).stats().entries == 1
+
+    def test_cache_commands(self, config_manager, temp_dir):
+        """Test the cache stats, prune and clear commands."""
+        cache = ChunkCache(config_manager.cache_dir)
+        cache.put("ab" * 32, ["chunk"])
+        cache.put("cd" * 32, ["chunk"])
+        runner = CliRunner()
+
+        stats = runner.invoke(app, ["cache", "stats"])
+        prune = runner.invoke(app, ["cache", "prune"])
+        clear = runner.invoke(app, ["cache", "clear"])
+
+        assert stats.exit_code == 0, stats.stdout
+        assert "Cached entries: 2" in stats.stdout
+        assert "Cache entries removed: 0" in prune.stdout
+        assert "Cache entries removed: 2" in clear.stdout
+        assert cache.stats().entries == 0
@@ -4,7 +4,9 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from typer.testing import CliRunner
-from cut_it.cli import app, get_file_type
+from cut_it.cli import app, get_file_type, parse_task_numbers
+from cut_it.config import ConfigManager
+from cut_it.formatter import TaskFormatter
 
 
 class TestFileTypeDetection:
@@ -54,6 +56,9 @@ class TestCLICommands:
         mock_config.chunk_size_max = 500
         mock_config.model = "gpt-4"
         mock_config.pt_br = False
+        mock_config.mmap_threshold_mb = 64
+        mock_config.overlap = 0
+        mock_config.cache_enabled = False
         
         mock_config_manager_instance = Mock()
         mock_config_manager_instance.load.return_value = mock_config
@@ -61,20 +66,20 @@ class TestCLICommands:
         
         mock_input_path = Mock()
         mock_input_path.exists.return_value = True
+        mock_input_path.stat.return_value.st_size = 1024
         mock_input_path.read_text.return_value = "Test content"
         mock_input_path.name = "test.txt"
-        mock_input_path.with_suffix.return_value = Path("test.tasks.md")
-        
-        mock_output_path = Mock()
+        mock_output_path = MagicMock()
+        mock_input_path.with_suffix.return_value = mock_output_path
         
         mock_path.side_effect = lambda x: mock_input_path if "test.txt" in str(x) else mock_output_path
         
         mock_processor_instance = Mock()
-        mock_processor_instance.split_text.return_value = ["chunk1", "chunk2"]
+        mock_processor_instance.iter_chunks.return_value = iter(["chunk1", "chunk2"])
         mock_processor.return_value = mock_processor_instance
         
         mock_formatter_instance = Mock()
-        mock_formatter_instance.format_as_tasks.return_value = "formatted output"
+        mock_formatter_instance.write_tasks.return_value = 2
         mock_formatter.return_value = mock_formatter_instance
         
         # Run command
@@ -82,9 +87,9 @@ class TestCLICommands:
         
         # Assertions
         assert result.exit_code == 0
-        mock_processor_instance.split_text.assert_called_once_with("Test content")
-        mock_formatter_instance.format_as_tasks.assert_called_once()
-        mock_output_path.write_text.assert_called_once_with("formatted output", encoding='utf-8')
+        mock_processor_instance.iter_chunks.assert_called_once_with("Test content")
+        mock_formatter_instance.write_tasks.assert_called_once()
+        mock_output_path.open.assert_called_once_with('w', encoding='utf-8')
 
     def test_process_command_file_not_found(self):
         """Test process command with non-existent file."""
@@ -99,12 +104,16 @@ class TestCLICommands:
         # Setup mocks
         mock_config = Mock()
         mock_config.pt_br = False
+        mock_config.mmap_threshold_mb = 64
+        mock_config.overlap = 0
+        mock_config.cache_enabled = False
         mock_config_manager_instance = Mock()
         mock_config_manager_instance.load.return_value = mock_config
         mock_config_manager.return_value = mock_config_manager_instance
         
         mock_input_path = Mock()
         mock_input_path.exists.return_value = True
+        mock_input_path.stat.return_value.st_size = 1024
         mock_input_path.read_text.side_effect = UnicodeDecodeError('utf-8', b'', 0, 1, 'invalid')
         
         mock_path.return_value = mock_input_path
@@ -126,7 +135,7 @@ class TestCLICommands:
         mock_config_manager_instance.load.return_value = mock_config
         mock_config_manager.return_value = mock_config_manager_instance
         
-        result = self.runner.invoke(app, ["config", "--show"])
+        result = self.runner.invoke(app, ["config-cmd", "--show"])
         
         assert result.exit_code == 0
         assert "Current Configuration" in result.stdout
@@ -217,6 +226,9 @@ class TestCLICommands:
         # Setup mocks similar to basic test but with custom parameters
         mock_config = Mock()
         mock_config.pt_br = False
+        mock_config.mmap_threshold_mb = 64
+        mock_config.overlap = 0
+        mock_config.cache_enabled = False
         
         mock_config_manager_instance = Mock()
         mock_config_manager_instance.load.return_value = mock_config
@@ -224,10 +236,11 @@ class TestCLICommands:
         
         mock_input_path = Mock()
         mock_input_path.exists.return_value = True
+        mock_input_path.stat.return_value.st_size = 1024
         mock_input_path.read_text.return_value = "Test content"
         mock_input_path.name = "test.md"
         
-        mock_output_path = Mock()
+        mock_output_path = MagicMock()
         
         def path_side_effect(x):
             if "test.md" in str(x):
@@ -239,11 +252,11 @@ class TestCLICommands:
         mock_path.side_effect = path_side_effect
         
         mock_processor_instance = Mock()
-        mock_processor_instance.split_text.return_value = ["chunk1"]
+        mock_processor_instance.iter_chunks.return_value = iter(["chunk1"])
         mock_processor.return_value = mock_processor_instance
         
         mock_formatter_instance = Mock()
-        mock_formatter_instance.format_as_tasks.return_value = "formatted output"
+        mock_formatter_instance.write_tasks.return_value = 1
         mock_formatter.return_value = mock_formatter_instance
         
         # Run command with custom options
@@ -262,4 +275,115 @@ class TestCLICommands:
         call_args = mock_processor.call_args
         assert call_args[1]['chunk_size'] == (200, 400)
         assert call_args[1]['model'] == "gpt-3.5-turbo"
-        assert call_args[1]['file_type'] == "markdown"
\ No newline at end of file
+        assert call_args[1]['file_type'] == "markdown"
+
+
+class TestStatusCommand:
+    """Test cases for the status command."""
+
+    @pytest.fixture
+    def task_file(self, temp_dir, monkeypatch):
+        """A task file with ten pending tasks."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_dir / "config.json"))
+        path = temp_dir / "doc.tasks.md"
+        path.write_text(
+            TaskFormatter().format_as_tasks([f"Chunk {i}" for i in range(1, 11)], "doc.txt"),
+            encoding='utf-8'
+        )
+        return path
+
+    def test_parse_task_numbers(self):
+        """Test task selections with numbers and ranges."""
+        assert parse_task_numbers("3-5,1, 4") == [1, 3, 4, 5]
+        for spec in ("", "a", "5-3", "0", "1-"):
+            with pytest.raises(ValueError):
+                parse_task_numbers(spec)
+
+    def test_set_status(self, task_file):
+        """Test selected tasks are updated in place."""
+        result = CliRunner().invoke(app, ["status", str(task_file), "2-4,7", "--set", "completed"])
+        
+        assert result.exit_code == 0, result.stdout
+        assert "Tasks updated: 4" in result.stdout
+        statuses = TaskFormatter().get_task_statuses(task_file.read_text(encoding='utf-8'))
+        assert [number for number, status in statuses.items() if status == "Completed"] == [2, 3, 4, 7]
+        assert list(task_file.parent.glob("*.tmp")) == []
+
+    def test_show_status(self, task_file):
+        """Test statuses are listed without modifying the file."""
+        before = task_file.read_text(encoding='utf-8')
+        
+        result = CliRunner().invoke(app, ["status", str(task_file), "9-12"])
+        
+        assert result.exit_code == 0, result.stdout
+        assert "9: Pending" in result.stdout
+        assert "Tasks not found: 11, 12" in result.stdout
+        assert task_file.read_text(encoding='utf-8') == before
+
+    def test_invalid_status(self, task_file):
+        """Test unknown statuses are rejected."""
+        result = CliRunner().invoke(app, ["status", str(task_file), "1", "--set", "done"])
+        assert result.exit_code == 1
+        assert "Invalid status" in result.stdout
+
+    def test_portuguese_file(self, temp_dir, monkeypatch):
+        """Test a Portuguese task file is updated with English settings."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_dir / "config.json"))
+        formatter = TaskFormatter(pt_br=True)
+        path = temp_dir / "doc.tasks.md"
+        path.write_text(formatter.format_as_tasks(["a", "b"], "doc.txt"), encoding='utf-8')
+        
+        result = CliRunner().invoke(app, ["status", str(path), "--set", "started"])
+        
+        assert result.exit_code == 0, result.stdout
+        assert formatter.get_task_statuses(path.read_text(encoding='utf-8')) == {1: "Started", 2: "Started"}
+
+
+class TestOverlapOption:
+    """Test cases for the --overlap option."""
+    
+    @pytest.fixture(autouse=True)
+    def config_path(self, temp_dir, monkeypatch):
+        """Use a fresh configuration file."""
+        path = temp_dir / "config.json"
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(path))
+        return path
+    
+    def test_process_with_overlap(self, temp_dir, document_factory):
+        """Test overlapping chunks are written as tasks."""
+        source = temp_dir / "doc.txt"
+        source.write_text(document_factory(paragraphs=40), encoding='utf-8')
+        
+        result = CliRunner().invoke(app, ["process", str(source), "--size", "50", "100", "--overlap", "20"])
+        
+        assert result.exit_code == 0, result.stdout
+        assert (temp_dir / "doc.tasks.md").exists()
+    
+    def test_overlap_too_large(self, temp_dir):
+        """Test an overlap reaching the minimum chunk size is rejected."""
+        source = temp_dir / "doc.txt"
+        source.write_text("Some text.", encoding='utf-8')
+        
+        result = CliRunner().invoke(app, ["process", str(source), "--size", "50", "100", "--overlap", "50"])
+        
+        assert result.exit_code == 1
+        assert not (temp_dir / "doc.tasks.md").exists()
+    
+    def test_incremental_with_overlap(self, temp_dir):
+        """Test incremental processing refuses overlapping chunks."""
+        source = temp_dir / "doc.txt"
+        source.write_text("Some text.", encoding='utf-8')
+        
+        result = CliRunner().invoke(app, ["process", str(source), "--overlap", "20", "--incremental"])
+        
+        assert result.exit_code == 1
+        assert "--overlap" in result.stdout
+    
+    def test_config_overlap(self, config_path):
+        """Test the default overlap is saved and shown."""
+        runner = CliRunner()
+        
+        assert runner.invoke(app, ["config-cmd", "--overlap", "40"]).exit_code == 0
+        
+        assert ConfigManager(config_path).load().overlap == 40
+        assert "Chunk overlap: 40 tokens" in runner.invoke(app, ["config-cmd", "--show"]).stdout
@@ -68,9 +68,13 @@ class TestConfig:
         expected = {
             "chunk_size_min": 350,
             "chunk_size_max": 500,
+            "overlap": 0,
             "model": "gpt-4",
             "pt_br": True,
-            "cli_mode": True
+            "cli_mode": True,
+            "mmap_threshold_mb": 64,
+            "cache_enabled": False,
+            "cache_max_mb": 512
         }
         assert data == expected
 
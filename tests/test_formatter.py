@@ -1,7 +1,9 @@
 """Tests for the task formatter module."""
 
+import io
+import tempfile
 import pytest
-from cut_it.formatter import TaskFormatter
+from cut_it.formatter import TaskDocument, TaskFormatter
 
 
 class TestTaskFormatter:
@@ -113,4 +115,154 @@ class TestTaskFormatter:
         task2_content = formatter.extract_task_content(content, 2)
         
         assert task1_content == "First chunk content"
-        assert task2_content == "Second chunk content"
\ No newline at end of file
+        assert task2_content == "Second chunk content"
+
+    def test_format_as_tasks_accepts_iterator(self):
+        """Test lazily produced chunks format the same as a list."""
+        formatter = TaskFormatter()
+        chunks = ["First chunk", "Second chunk"]
+        
+        from_list = formatter.format_as_tasks(chunks, "test.txt")
+        from_iterator = formatter.format_as_tasks(iter(chunks), "test.txt")
+        
+        assert from_iterator == from_list
+
+    def test_format_as_tasks_empty_iterator(self):
+        """Test an exhausted iterator is formatted as empty content."""
+        formatter = TaskFormatter()
+        result = formatter.format_as_tasks(iter([]), "test.txt")
+        assert result == formatter.format_as_tasks([], "test.txt")
+
+    @pytest.mark.parametrize("chunks", [
+        [],
+        ["Single chunk"],
+        ["First chunk", "  Second chunk\n\nwith paragraphs  ", "Terceiro bloco ç"],
+    ])
+    @pytest.mark.parametrize("pt_br", [False, True])
+    def test_write_tasks_matches_format_as_tasks(self, chunks, pt_br):
+        """Test streamed output is byte-identical to format_as_tasks."""
+        formatter = TaskFormatter(pt_br=pt_br)
+        expected = formatter.format_as_tasks(chunks, "test.txt", "Started")
+        
+        text_fp = io.StringIO()
+        text_count = formatter.write_tasks(iter(chunks), "test.txt", text_fp, "Started")
+        binary_fp = io.BytesIO()
+        binary_count = formatter.write_tasks(iter(chunks), "test.txt", binary_fp, "Started")
+        
+        assert text_fp.getvalue() == expected
+        assert binary_fp.getvalue() == expected.encode('utf-8')
+        assert text_count == binary_count == len(chunks)
+
+    @pytest.mark.parametrize("factory, mode", [
+        (tempfile.NamedTemporaryFile, "w+"),
+        (tempfile.NamedTemporaryFile, "w+b"),
+        (tempfile.SpooledTemporaryFile, "w+"),
+        (tempfile.SpooledTemporaryFile, "w+b"),
+        (tempfile.TemporaryFile, "w+b"),
+    ])
+    def test_write_tasks_to_temporary_files(self, sample_chunks, factory, mode):
+        """Test text and binary temporary file wrappers get str and bytes respectively."""
+        formatter = TaskFormatter()
+        expected = formatter.format_as_tasks(sample_chunks, "test.txt")
+        kwargs = {} if "b" in mode else {"encoding": "utf-8"}
+        
+        with factory(mode=mode, **kwargs) as fp:
+            formatter.write_tasks(iter(sample_chunks), "test.txt", fp)
+            fp.seek(0)
+            written = fp.read()
+        
+        assert written == (expected.encode('utf-8') if "b" in mode else expected)
+
+    def test_write_tasks_streams_each_chunk(self):
+        """Test each task is written before the next chunk is requested."""
+        formatter = TaskFormatter()
+        fp = io.StringIO()
+        
+        def chunks():
+            yield "First chunk"
+            assert "First chunk" in fp.getvalue()
+            yield "Second chunk"
+        
+        assert formatter.write_tasks(chunks(), "test.txt", fp) == 2
+
+    def test_get_task_statuses(self, formatted_tasks):
+        """Test recorded statuses are read back for every task."""
+        formatter = TaskFormatter()
+        content = formatter.update_task_status(formatted_tasks, 2, "Completed")
+        
+        assert formatter.get_task_statuses(content) == {
+            1: "Pending", 2: "Completed", 3: "Pending"
+        }
+
+    def test_write_tasks_per_task_statuses(self):
+        """Test per-task statuses override the initial status."""
+        formatter = TaskFormatter(pt_br=True)
+        content = formatter.format_as_tasks(["a", "b"], "test.txt")
+        
+        fp = io.StringIO()
+        formatter.write_tasks(["a", "b"], "test.txt", fp, statuses=["Started", "Pending"])
+        
+        assert formatter.get_task_statuses(fp.getvalue()) == {1: "Started", 2: "Pending"}
+        assert formatter.get_task_statuses(content) == {1: "Pending", 2: "Pending"}
+
+
+class TestTaskDocument:
+    """Test cases for TaskDocument class."""
+
+    def test_parse_index(self, formatted_tasks):
+        """Test every task is indexed with its status and content."""
+        document = TaskFormatter().parse(formatted_tasks)
+        
+        assert len(document) == 3
+        assert document.task_numbers == [1, 2, 3]
+        assert 2 in document and 4 not in document
+        assert document.get_status(1) == "Pending"
+        assert document.get_status(4) is None
+        assert document.get_content(2) == "Here is the second chunk with different content for testing."
+        assert document.get_content(4) == ""
+
+    def test_round_trip(self, formatted_tasks):
+        """Test an unmodified document serializes to the original content."""
+        assert TaskDocument(formatted_tasks).to_string() == formatted_tasks
+
+    def test_set_status(self, formatted_tasks):
+        """Test in-place updates match updating the content string."""
+        formatter = TaskFormatter()
+        document = formatter.parse(formatted_tasks)
+        
+        assert document.set_status(2, "Completed")
+        assert document.set_status(2, "started")
+        assert not document.set_status(9, "Completed")
+        
+        expected = formatter.update_task_status(formatted_tasks, 2, "Started")
+        assert document.to_string() == expected
+        assert document.get_status(2) == "Started"
+        assert document.get_content(2) == "Here is the second chunk with different content for testing."
+
+    def test_many_updates(self):
+        """Test updating every task of a long document."""
+        formatter = TaskFormatter(pt_br=True)
+        content = formatter.format_as_tasks([f"Bloco {i}" for i in range(200)], "doc.txt")
+        document = formatter.parse(content)
+        
+        for number in document.task_numbers:
+            document.set_status(number, "Completed")
+        
+        assert formatter.parse(document.to_string()).statuses() == {
+            number: "Completed" for number in range(1, 201)
+        }
+        assert document.to_string() == formatter.format_as_tasks(
+            [f"Bloco {i}" for i in range(200)], "doc.txt", "Completed"
+        )
+
+    def test_update_statuses(self, formatted_tasks):
+        """Test bulk updates match applying each update in turn."""
+        formatter = TaskFormatter()
+        expected = formatter.update_task_status(formatted_tasks, 1, "Completed")
+        expected = formatter.update_task_status(expected, 3, "Started")
+        
+        assert formatter.update_statuses(formatted_tasks, {1: "Completed", 3: "Started"}) == expected
+        
+        document = formatter.parse(formatted_tasks)
+        assert document.update_statuses({2: "Completed", 5: "Started"}) == [5]
+        assert document.statuses() == {1: "Pending", 2: "Completed", 3: "Pending"}
@@ -0,0 +1,164 @@
+"""Tests for the tree-sitter grammar registry."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from cut_it import grammars as grammars_module
+from cut_it.grammars import available_languages, language_for_path, load_grammar, splitter_type
+from cut_it.splitter import SplitterCache, TextProcessor
+
+
+@pytest.fixture(autouse=True)
+def clear_grammar_cache():
+    """Forget grammars loaded by other tests."""
+    load_grammar.cache_clear()
+    yield
+    load_grammar.cache_clear()
+
+
+def fake_import(modules):
+    """Build an import_module replacement that only knows ``modules``."""
+    def import_module(name):
+        if name not in modules:
+            raise ImportError(f"No module named '{name}'")
+        return modules[name]
+    return import_module
+
+
+class TestLanguageForPath:
+    """Test cases for language_for_path."""
+
+    @pytest.mark.parametrize("name, language", [
+        ("app.py", "python"),
+        ("component.tsx", "tsx"),
+        ("index.ts", "typescript"),
+        ("Main.java", "java"),
+        ("lib.RS", "rust"),
+        ("build.sh", "bash"),
+    ])
+    def test_known_extensions(self, name, language):
+        """Test code extensions map to their grammar language."""
+        assert language_for_path(name) == language
+
+    def test_unknown_extension(self):
+        """Test files without a grammar have no language."""
+        assert language_for_path("notes.txt") is None
+        assert language_for_path("Makefile") is None
+
+
+class TestLoadGrammar:
+    """Test cases for load_grammar."""
+
+    def test_unknown_language(self):
+        """Test unknown languages have no grammar."""
+        assert load_grammar("cobol") is None
+
+    def test_missing_package(self, monkeypatch):
+        """Test languages whose package is not installed have no grammar."""
+        monkeypatch.setattr(grammars_module, "import_module", fake_import({}))
+
+        assert load_grammar("python") is None
+
+    def test_loads_once(self, monkeypatch):
+        """Test a grammar is imported once and then cached."""
+        language = Mock(return_value="python grammar")
+        monkeypatch.setattr(grammars_module, "import_module", fake_import({
+            "tree_sitter_python": SimpleNamespace(language=language),
+        }))
+
+        assert load_grammar("python") == "python grammar"
+        assert load_grammar("python") == "python grammar"
+        language.assert_called_once()
+
+    def test_package_with_several_languages(self, monkeypatch):
+        """Test the language function is chosen per language."""
+        monkeypatch.setattr(grammars_module, "import_module", fake_import({
+            "tree_sitter_typescript": SimpleNamespace(
+                language_typescript=lambda: "typescript grammar",
+                language_tsx=lambda: "tsx grammar",
+            ),
+        }))
+
+        assert load_grammar("typescript") == "typescript grammar"
+        assert load_grammar("tsx") == "tsx grammar"
+
+    def test_available_languages(self, monkeypatch):
+        """Test only installed grammars are listed."""
+        monkeypatch.setattr(grammars_module, "import_module", fake_import({
+            "tree_sitter_go": SimpleNamespace(language=lambda: "go grammar"),
+            "tree_sitter_python": SimpleNamespace(language=lambda: "python grammar"),
+        }))
+
+        assert available_languages() == ["go", "python"]
+
+
+class TestSplitterType:
+    """Test cases for splitter_type."""
+
+    def test_code_with_grammar(self, monkeypatch):
+        """Test code with an installed grammar is identified by its language."""
+        monkeypatch.setattr(grammars_module, "load_grammar", lambda language: object())
+
+        assert splitter_type("code", "python") == "code:python"
+        assert splitter_type("text", "python") == "text"
+
+    def test_code_without_grammar(self, monkeypatch):
+        """Test code without a grammar is identified by its file type."""
+        monkeypatch.setattr(grammars_module, "load_grammar", lambda language: None)
+
+        assert splitter_type("code", "python") == "code"
+        assert splitter_type("code", None) == "code"
+
+
+class TestCodeSplitting:
+    """Test cases for splitting code with grammars."""
+
+    @patch('cut_it.splitter.load_grammar')
+    @patch('cut_it.splitter.TextSplitter')
+    @patch('cut_it.splitter.CodeSplitter')
+    def test_uses_code_splitter_with_grammar(self, mock_code_splitter, mock_text_splitter, mock_load_grammar):
+        """Test code with a grammar is split by CodeSplitter."""
+        grammar = object()
+        mock_load_grammar.return_value = grammar
+        cache = SplitterCache()
+
+        splitter = cache.get("code", "gpt-4", (300, 500), "python")
+
+        assert splitter is mock_code_splitter.from_tiktoken_model.return_value
+        mock_code_splitter.from_tiktoken_model.assert_called_once_with(grammar, "gpt-4", capacity=(300, 500), overlap=0)
+        mock_text_splitter.from_tiktoken_model.assert_not_called()
+
+    @patch('cut_it.splitter.load_grammar')
+    @patch('cut_it.splitter.TextSplitter')
+    @patch('cut_it.splitter.CodeSplitter')
+    def test_key_includes_language(self, mock_code_splitter, mock_text_splitter, mock_load_grammar):
+        """Test each code language gets its own splitter, other types ignore it."""
+        mock_load_grammar.side_effect = lambda language: object()
+        mock_code_splitter.from_tiktoken_model.side_effect = lambda *a, **k: Mock()
+        mock_text_splitter.from_tiktoken_model.side_effect = lambda *a, **k: Mock()
+        cache = SplitterCache()
+
+        python = cache.get("code", "gpt-4", 500, "python")
+        assert cache.get("code", "gpt-4", 500, "go") is not python
+        assert cache.get("code", "gpt-4", 500, "python") is python
+        assert cache.get("text", "gpt-4", 500, "python") is cache.get("text", "gpt-4", 500)
+
+    def test_falls_back_to_text_splitter(self, monkeypatch):
+        """Test code whose grammar is not installed is split as text."""
+        monkeypatch.setattr(grammars_module, "import_module", fake_import({}))
+        processor = TextProcessor(chunk_size=(20, 60), file_type="code", language="python")
+        code = "def first():\n    return 1\n\n\ndef second():\n    return 2\n"
+
+        chunks = processor.split_text(code)
+
+        assert processor.splitter_type == "code"
+        assert chunks
+        assert all(chunk in code for chunk in chunks)
+
+    def test_splitter_type_of_processor(self, monkeypatch):
+        """Test processors report the grammar they split with."""
+        monkeypatch.setattr(grammars_module, "load_grammar", lambda language: object())
+
+        assert TextProcessor(file_type="markdown").splitter_type == "markdown"
+        assert TextProcessor(file_type="code", language="rust").splitter_type == "code:rust"
@@ -0,0 +1,224 @@
+"""Tests for the incremental re-chunking module."""
+
+import pytest
+from pathlib import Path
+from typer.testing import CliRunner
+from cut_it.cli import app
+from cut_it.config import ConfigManager
+from cut_it.formatter import TaskFormatter
+from cut_it.incremental import (
+    ChunkManifest,
+    manifest_path_for,
+    process_incremental,
+    rechunk,
+)
+from cut_it.splitter import TextProcessor
+
+
+@pytest.fixture
+def document(document_factory):
+    """A markdown document long enough for many chunks."""
+    return document_factory(paragraphs=400, markdown=True)
+
+
+@pytest.fixture
+def processor():
+    """A markdown processor with small chunks."""
+    return TextProcessor(chunk_size=(50, 100), file_type="markdown")
+
+
+def edit(text, position, removed, inserted):
+    """Replace ``removed`` characters at ``position`` with ``inserted``."""
+    return text[:position] + inserted + text[position + removed:]
+
+
+class TestManifest:
+    """Test cases for ChunkManifest."""
+
+    def test_manifest_path(self):
+        """Test the manifest is stored next to the task output."""
+        assert manifest_path_for(Path("docs/a.tasks.md")) == Path("docs/a.tasks.manifest.json")
+
+    def test_round_trip(self, temp_dir, processor, document):
+        """Test a manifest survives saving and loading."""
+        manifest = ChunkManifest.from_records(processor, document, processor.split_with_offsets(document))
+        path = temp_dir / "a.tasks.manifest.json"
+
+        manifest.save(path)
+
+        assert ChunkManifest.load(path) == manifest
+        assert ChunkManifest.load(path).matches(processor)
+
+    def test_load_invalid(self, temp_dir):
+        """Test unreadable manifests are ignored."""
+        path = temp_dir / "bad.manifest.json"
+        path.write_text("not json", encoding='utf-8')
+        assert ChunkManifest.load(path) is None
+        assert ChunkManifest.load(temp_dir / "missing.json") is None
+
+
+class TestRechunk:
+    """Test cases for rechunk."""
+
+    @pytest.mark.parametrize("position,removed,inserted", [
+        (0.0, 0, "New opening paragraph.\n\n"),
+        (0.3, 0, " a few extra words "),
+        (0.5, 150, ""),
+        (0.5, 5, "\n\n# Inserted heading\n\n"),
+        (0.99, 0, "\n\nClosing remarks."),
+    ])
+    def test_matches_full_split(self, processor, document, position, removed, inserted):
+        """Test incremental chunks equal re-splitting the whole document."""
+        manifest = ChunkManifest.from_records(processor, document, processor.split_with_offsets(document))
+        new_text = edit(document, int(len(document) * position), removed, inserted)
+
+        result = rechunk(processor, new_text, manifest)
+
+        assert [record.text for record in result.records] == processor.split_text(new_text)
+        for record in result.records:
+            assert new_text[record.start:record.end] == record.text
+
+    def test_reuses_unchanged_chunks(self, processor, document):
+        """Test most chunks of a small edit are carried over."""
+        records = processor.split_with_offsets(document)
+        manifest = ChunkManifest.from_records(processor, document, records)
+        new_text = edit(document, len(document) // 2, 0, " edited ")
+
+        result = rechunk(processor, new_text, manifest)
+
+        assert result.reused >= len(records) - 10
+        assert result.previous[0] == 0
+        assert result.previous[-1] == len(records) - 1
+
+    def test_unchanged_text(self, processor, document):
+        """Test an unchanged document reuses every chunk."""
+        records = processor.split_with_offsets(document)
+        manifest = ChunkManifest.from_records(processor, document, records)
+
+        result = rechunk(processor, document, manifest)
+
+        assert result.records == records
+        assert result.reused == len(records)
+
+    def test_settings_changed(self, processor, document):
+        """Test a manifest from other settings triggers a full split."""
+        other = TextProcessor(chunk_size=(100, 200), file_type="markdown")
+        manifest = ChunkManifest.from_records(other, document, other.split_with_offsets(document))
+
+        result = rechunk(processor, document, manifest)
+
+        assert result.reused == 0
+        assert [record.text for record in result.records] == processor.split_text(document)
+
+    def test_overlap(self, document):
+        """Test overlapping chunks are recorded and always split in full."""
+        overlapping = TextProcessor(chunk_size=(50, 100), file_type="markdown", overlap=20)
+        manifest = ChunkManifest.from_records(overlapping, document, overlapping.split_with_offsets(document))
+
+        result = rechunk(overlapping, document, manifest)
+
+        assert ChunkManifest.from_dict(manifest.to_dict()).overlap == 20
+        assert not manifest.matches(TextProcessor(chunk_size=(50, 100), file_type="markdown"))
+        assert result.reused == 0
+        assert [record.text for record in result.records] == overlapping.split_text(document)
+
+
+class TestProcessIncremental:
+    """Test cases for updating task output files."""
+
+    def test_keeps_status_of_unchanged_tasks(self, temp_dir, processor, document):
+        """Test recorded statuses survive for unchanged chunks only."""
+        formatter = TaskFormatter()
+        output_path = temp_dir / "doc.tasks.md"
+        process_incremental(processor, formatter, document, "doc.md", output_path)
+
+        content = output_path.read_text(encoding='utf-8')
+        task_count = formatter.get_task_count(content)
+        content = formatter.update_task_status(content, 1, "Completed")
+        content = formatter.update_task_status(content, task_count, "Started")
+        output_path.write_text(content, encoding='utf-8')
+
+        new_text = edit(document, len(document) // 2, 0, " edited ")
+        result = process_incremental(processor, formatter, new_text, "doc.md", output_path)
+
+        statuses = formatter.get_task_statuses(output_path.read_text(encoding='utf-8'))
+        assert statuses[1] == "Completed"
+        assert statuses[len(result.records)] == "Started"
+        for number, previous in enumerate(result.previous, 1):
+            if previous is None:
+                assert statuses[number] == "Pending"
+
+    def test_output_without_manifest(self, temp_dir, processor, document):
+        """Test statuses of an output written without a manifest follow task content."""
+        formatter = TaskFormatter()
+        output_path = temp_dir / "doc.tasks.md"
+        chunks = processor.split_text(document)
+        content = formatter.format_as_tasks(chunks, "doc.md")
+        output_path.write_text(formatter.update_statuses(content, {1: "Completed", 3: "Started"}), encoding='utf-8')
+
+        result = process_incremental(processor, formatter, document, "doc.md", output_path)
+
+        statuses = formatter.get_task_statuses(output_path.read_text(encoding='utf-8'))
+        assert len(result.records) == len(chunks)
+        assert statuses[1] == "Completed"
+        assert statuses[2] == "Pending"
+        assert statuses[3] == "Started"
+
+    def test_stale_manifest(self, temp_dir, processor, document):
+        """Test a manifest that no longer describes the output is not trusted for statuses."""
+        formatter = TaskFormatter()
+        output_path = temp_dir / "doc.tasks.md"
+        process_incremental(processor, formatter, document, "doc.md", output_path)
+
+        # Regenerate the output from other content, leaving the old manifest behind
+        other = ["Unrelated first task.", "Unrelated second task."]
+        content = formatter.format_as_tasks(other, "doc.md")
+        output_path.write_text(formatter.update_statuses(content, {1: "Completed", 2: "Completed"}), encoding='utf-8')
+
+        process_incremental(processor, formatter, document, "doc.md", output_path)
+
+        statuses = formatter.get_task_statuses(output_path.read_text(encoding='utf-8'))
+        assert set(statuses.values()) == {"Pending"}
+
+    def test_interrupted_write_keeps_files(self, temp_dir, processor, document, monkeypatch):
+        """Test an update interrupted mid-write leaves the output and manifest untouched."""
+        formatter = TaskFormatter()
+        output_path = temp_dir / "doc.tasks.md"
+        process_incremental(processor, formatter, document, "doc.md", output_path)
+        content = formatter.update_task_status(output_path.read_text(encoding='utf-8'), 1, "Completed")
+        output_path.write_text(content, encoding='utf-8')
+        manifest = manifest_path_for(output_path).read_text(encoding='utf-8')
+
+        write_tasks = formatter.write_tasks
+
+        def interrupted(chunks, filename, fp, initial_status="Pending", statuses=None):
+            if statuses is None:
+                return write_tasks(chunks, filename, fp, initial_status)
+            # Writing the output itself is interrupted after its heading
+            fp.write(f"# {filename}\n\n")
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(formatter, "write_tasks", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            process_incremental(processor, formatter, edit(document, 0, 0, "New start. "), "doc.md", output_path)
+
+        assert output_path.read_text(encoding='utf-8') == content
+        assert manifest_path_for(output_path).read_text(encoding='utf-8') == manifest
+        assert sorted(path.name for path in temp_dir.iterdir()) == ["doc.tasks.manifest.json", "doc.tasks.md"]
+
+    def test_cli_incremental(self, temp_dir, monkeypatch, document):
+        """Test the process command reports reused chunks."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_dir / "config.json"))
+        source = temp_dir / "doc.md"
+        source.write_text(document, encoding='utf-8')
+        runner = CliRunner()
+
+        first = runner.invoke(app, ["process", str(source), "--incremental"])
+        source.write_text(edit(document, len(document) // 2, 0, " edited "), encoding='utf-8')
+        second = runner.invoke(app, ["process", str(source), "--incremental"])
+
+        assert first.exit_code == 0, first.stdout
+        assert second.exit_code == 0, second.stdout
+        assert (temp_dir / "doc.tasks.manifest.json").exists()
+        assert "Unchanged chunks reused: 0" in first.stdout
+        assert "Unchanged chunks reused: 0" not in second.stdout
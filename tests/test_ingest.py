@@ -0,0 +1,146 @@
+"""Tests for the source tree ingestion module."""
+
+import json
+
+import pytest
+from pathlib import Path
+from typer.testing import CliRunner
+from cut_it import ingest as ingest_module
+from cut_it.batch import BatchItem, BatchSettings, run_stream
+from cut_it.cli import app
+from cut_it.config import ConfigManager
+from cut_it.ingest import Throughput, output_path
+from cut_it.walk import SourceFile, walk_files
+
+
+class TestRunStream:
+    """Test cases for run_stream."""
+
+    def _items(self, source_tree, combined=False):
+        for source in walk_files(source_tree, extensions=[".md", ".py"]):
+            yield BatchItem(
+                source.path,
+                None if combined else output_path(source, ".tasks.md", source_tree / "out"),
+                "markdown" if source.path.suffix == ".md" else "code",
+                source.size
+            )
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_writes_outputs(self, source_tree, jobs):
+        """Test every file is processed and written once, in any order."""
+        results = list(run_stream(self._items(source_tree), BatchSettings(), jobs=jobs))
+
+        assert sorted(result.input_path.name for result in results) == [
+            "README.md", "app.py", "generated_keep.py", "guide.md"
+        ]
+        assert all(result.ok and result.chunks >= 1 and result.size > 0 for result in results)
+        assert (source_tree / "out" / "docs" / "guide.md.tasks.md").exists()
+
+    def test_returns_records(self, source_tree):
+        """Test items without an output path return their JSONL records."""
+        results = list(run_stream(self._items(source_tree, combined=True), BatchSettings(output_format="jsonl")))
+
+        assert all(result.output_path is None for result in results)
+        readme = next(result for result in results if result.input_path.name == "README.md")
+        assert readme.chunks == len(readme.records)
+        assert "".join(record.text for record in readme.records) in "# Project\n\nIntroduction."
+
+    def test_bounded_submission(self, source_tree):
+        """Test items are pulled only as workers free up."""
+        pulled = []
+
+        def items():
+            for index in range(40):
+                pulled.append(index)
+                yield BatchItem(source_tree / "README.md", None, "markdown", 1)
+
+        results = run_stream(items(), BatchSettings(), jobs=2, max_pending=3)
+        next(results)
+
+        assert len(pulled) <= 4
+        assert len(list(results)) == 39
+
+
+class TestThroughput:
+    """Test cases for Throughput."""
+
+    def test_rates(self, monkeypatch):
+        """Test files/s and MB/s are computed from elapsed time."""
+        monkeypatch.setattr(ingest_module.time, "perf_counter", lambda: 100.0)
+        throughput = Throughput()
+        monkeypatch.setattr(ingest_module.time, "perf_counter", lambda: 102.0)
+        throughput.add(3 * 1024 * 1024, chunks=5)
+        throughput.add(1024 * 1024, ok=False)
+
+        assert throughput.files == 2
+        assert throughput.failures == 1
+        assert throughput.chunks == 5
+        assert throughput.files_per_second == 1.0
+        assert throughput.mb_per_second == 2.0
+        assert throughput.describe() == "1.0 files/s, 2.00 MB/s"
+
+    def test_output_path(self):
+        """Test outputs keep the full file name and mirror the tree."""
+        source = SourceFile(Path("/repo/src/app.py"), "src/app.py", 10)
+
+        assert output_path(source, ".tasks.md") == Path("/repo/src/app.py.tasks.md")
+        assert output_path(source, ".tasks.jsonl", Path("/out")) == Path("/out/src/app.py.tasks.jsonl")
+
+
+class TestIngestCommand:
+    """Test cases for the ingest command."""
+
+    @pytest.fixture(autouse=True)
+    def config(self, temp_config_file, monkeypatch):
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_config_file))
+
+    def test_per_file_outputs(self, source_tree):
+        """Test one output per file is written into a mirrored tree."""
+        output_dir = source_tree.parent / "ingested"
+
+        result = CliRunner().invoke(app, ["ingest", str(source_tree), "-o", str(output_dir), "-e", "py,md", "-j", "2"])
+
+        assert result.exit_code == 0, result.stdout
+        assert sorted(path.relative_to(output_dir).as_posix() for path in output_dir.rglob("*.tasks.md")) == [
+            "README.md.tasks.md",
+            "docs/guide.md.tasks.md",
+            "src/app.py.tasks.md",
+            "src/generated_keep.py.tasks.md",
+        ]
+        assert "4 file(s) ingested, 0 failed" in result.stdout
+        assert "files/s" in result.stdout
+
+    def test_combined_jsonl(self, source_tree):
+        """Test every chunk is written to one JSONL file with relative sources."""
+        combined = source_tree / "corpus.jsonl"
+
+        result = CliRunner().invoke(app, ["ingest", str(source_tree), "--combined", "-o", str(combined), "-j", "1"])
+
+        assert result.exit_code == 0, result.stdout
+        records = [json.loads(line) for line in combined.read_text(encoding='utf-8').splitlines()]
+        assert {record["source"] for record in records} == {
+            ".gitignore", "README.md", "docs/guide.md", "src/.gitignore",
+            "src/app.py", "src/generated_keep.py", "src/top.txt",
+        }
+        assert all(record["index"] >= 1 for record in records)
+
+    def test_combined_stdout(self, source_tree):
+        """Test combined output goes to stdout by default."""
+        result = CliRunner().invoke(app, ["ingest", str(source_tree), "--combined", "-e", "md", "-j", "1"])
+
+        assert result.exit_code == 0
+        sources = {json.loads(line)["source"] for line in result.stdout.splitlines() if line.startswith("{")}
+        assert sources == {"README.md", "docs/guide.md"}
+
+    def test_no_files(self, source_tree):
+        """Test an empty selection is an error."""
+        result = CliRunner().invoke(app, ["ingest", str(source_tree), "-e", "rs", "-j", "1"])
+
+        assert result.exit_code == 1
+
+    def test_invalid_max_size(self, source_tree):
+        """Test malformed sizes are rejected."""
+        result = CliRunner().invoke(app, ["ingest", str(source_tree), "--max-size", "lots"])
+
+        assert result.exit_code == 1
+        assert "invalid size" in result.stdout
@@ -2,7 +2,7 @@
 
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 from cut_it.cli import app
 from cut_it.config import ConfigManager
 from cut_it.splitter import TextProcessor
@@ -185,6 +185,9 @@ class TestIntegration:
         mock_config.chunk_size_max = 500
         mock_config.model = "gpt-4"
         mock_config.pt_br = False
+        mock_config.mmap_threshold_mb = 64
+        mock_config.overlap = 0
+        mock_config.cache_enabled = False
         
         mock_config_manager_instance = Mock()
         mock_config_manager_instance.load.return_value = mock_config
@@ -193,11 +196,11 @@ class TestIntegration:
         # Setup file path mocks
         mock_input_path = Mock()
         mock_input_path.exists.return_value = True
+        mock_input_path.stat.return_value.st_size = 1024
         mock_input_path.read_text.return_value = "Sample text content for processing"
         mock_input_path.name = "test.txt"
-        mock_input_path.with_suffix.return_value = Path("test.tasks.md")
-        
-        mock_output_path = Mock()
+        mock_output_path = MagicMock()
+        mock_input_path.with_suffix.return_value = mock_output_path
         
         def path_side_effect(x):
             if "test.txt" in str(x):
@@ -209,39 +212,15 @@ class TestIntegration:
         
         # Setup processor mock
         mock_processor_instance = Mock()
-        mock_processor_instance.split_text.return_value = [
+        mock_processor_instance.iter_chunks.return_value = iter([
             "First chunk of processed text",
             "Second chunk of processed text"
-        ]
+        ])
         mock_processor.return_value = mock_processor_instance
         
         # Setup formatter mock
         mock_formatter_instance = Mock()
-        mock_formatter_instance.format_as_tasks.return_value = """# test.txt
-
----
-
-## TASK 1
-**Progress:** Pending
-
-- ☐ Pending
-- ☐ Started
-- ☐ Completed
-
-First chunk of processed text
-
----
-
-## TASK 2
-**Progress:** Pending
-
-- ☐ Pending
-- ☐ Started
-- ☐ Completed
-
-Second chunk of processed text
-
----"""
+        mock_formatter_instance.write_tasks.return_value = 2
         mock_formatter.return_value = mock_formatter_instance
         
         # Run the CLI command
@@ -256,12 +235,14 @@ Second chunk of processed text
         mock_processor.assert_called_once_with(
             chunk_size=(300, 500),
             model="gpt-4",
-            file_type="text"
+            file_type="text",
+            language=None,
+            overlap=0
         )
-        mock_processor_instance.split_text.assert_called_once_with("Sample text content for processing")
+        mock_processor_instance.iter_chunks.assert_called_once_with("Sample text content for processing")
         mock_formatter.assert_called_once_with(pt_br=False)
-        mock_formatter_instance.format_as_tasks.assert_called_once()
-        mock_output_path.write_text.assert_called_once()
+        mock_formatter_instance.write_tasks.assert_called_once()
+        mock_output_path.open.assert_called_once_with('w', encoding='utf-8')
 
     def test_task_status_update_integration(self, sample_chunks):
         """Test task status update functionality integration."""
@@ -0,0 +1,180 @@
+"""Tests for the JSON Lines output module."""
+
+import io
+import json
+import tempfile
+
+import pytest
+from typer.testing import CliRunner
+from cut_it.batch import BatchItem, BatchSettings, expand_inputs, plan_outputs, run_batch
+from cut_it.cli import app
+from cut_it.config import ConfigManager
+from cut_it.jsonl import JsonlRecord, read_jsonl, write_jsonl
+from cut_it.splitter import ChunkRecord, TextProcessor
+
+
+class TestWriteJsonl:
+    """Test cases for write_jsonl."""
+
+    def test_one_record_per_line(self):
+        """Test each chunk becomes one JSON object on its own line."""
+        records = [ChunkRecord(0, 5, 2, "Hello"), ChunkRecord(7, 12, None, "World")]
+        buffer = io.StringIO()
+
+        count = write_jsonl(records, buffer, source="doc.txt")
+
+        lines = buffer.getvalue().splitlines()
+        assert count == 2
+        assert len(lines) == 2
+        assert json.loads(lines[0]) == {
+            "index": 1, "status": "Pending", "text": "Hello",
+            "token_count": 2, "start": 0, "end": 5, "source": "doc.txt"
+        }
+        assert json.loads(lines[1])["index"] == 2
+
+    def test_plain_chunks_have_no_offsets(self):
+        """Test plain string chunks are written with null offsets."""
+        buffer = io.StringIO()
+        write_jsonl(["Only text"], buffer, status="Started")
+
+        data = json.loads(buffer.getvalue())
+        assert data == {
+            "index": 1, "status": "Started", "text": "Only text",
+            "token_count": None, "start": None, "end": None
+        }
+
+    def test_binary_output_is_utf8(self):
+        """Test binary file objects receive UTF-8 with non-ASCII text unescaped."""
+        buffer = io.BytesIO()
+        write_jsonl(["ação\nlinha"], buffer)
+
+        assert buffer.getvalue() == (
+            '{"index":1,"status":"Pending","text":"ação\\nlinha",'
+            '"token_count":null,"start":null,"end":null}\n'
+        ).encode('utf-8')
+
+    @pytest.mark.parametrize("factory, mode", [
+        (tempfile.NamedTemporaryFile, "w+"),
+        (tempfile.NamedTemporaryFile, "w+b"),
+        (tempfile.SpooledTemporaryFile, "w+"),
+        (tempfile.SpooledTemporaryFile, "w+b"),
+    ])
+    def test_temporary_files(self, factory, mode):
+        """Test text and binary temporary file wrappers get str and bytes respectively."""
+        kwargs = {} if "b" in mode else {"encoding": "utf-8"}
+
+        with factory(mode=mode, **kwargs) as fp:
+            write_jsonl(["ação"], fp)
+            fp.seek(0)
+            written = fp.read()
+
+        line = '{"index":1,"status":"Pending","text":"ação","token_count":null,"start":null,"end":null}\n'
+        assert written == (line.encode('utf-8') if "b" in mode else line)
+
+    def test_empty(self):
+        """Test no records write nothing."""
+        buffer = io.StringIO()
+        assert write_jsonl([], buffer) == 0
+        assert buffer.getvalue() == ""
+
+
+class TestReadJsonl:
+    """Test cases for read_jsonl."""
+
+    def test_round_trip(self, document_factory, temp_dir):
+        """Test records read back match the written chunk records."""
+        text = document_factory(markdown=True)
+        records = TextProcessor(file_type="markdown").split_with_offsets(text)
+        path = temp_dir / "doc.tasks.jsonl"
+        with path.open('w', encoding='utf-8') as f:
+            write_jsonl(records, f, source="doc.md")
+
+        read = list(read_jsonl(path))
+
+        assert len(read) == len(records)
+        for index, (record, chunk) in enumerate(zip(read, records), 1):
+            assert record == JsonlRecord(
+                index, "Pending", chunk.text, chunk.token_count, chunk.start, chunk.end, "doc.md"
+            )
+            assert text[record.start:record.end] == record.text
+
+    def test_file_object_and_blank_lines(self):
+        """Test reading from a binary file object skips blank lines."""
+        data = b'{"index": 1, "text": "a"}\n\n{"index": 2, "text": "b", "status": "Completed"}\n'
+
+        read = list(read_jsonl(io.BytesIO(data)))
+
+        assert [record.text for record in read] == ["a", "b"]
+        assert read[0].status == "Pending"
+        assert read[1].status == "Completed"
+        assert read[0].start is None
+
+    @pytest.mark.parametrize("line", [b"not json", b'{"index": 1}', b"[1, 2]"])
+    def test_invalid_line(self, line):
+        """Test malformed lines report their line number."""
+        data = b'{"index": 1, "text": "a"}\n' + line + b"\n"
+
+        with pytest.raises(ValueError, match="line 2"):
+            list(read_jsonl(io.BytesIO(data)))
+
+
+class TestJsonlOutput:
+    """Test cases for JSONL output from the CLI and batch runs."""
+
+    def test_cli_process_jsonl(self, document_factory, temp_dir, temp_config_file, monkeypatch):
+        """Test the process command writes JSONL next to the input."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_config_file))
+        text = document_factory(markdown=True)
+        path = temp_dir / "doc.md"
+        path.write_text(text, encoding='utf-8')
+
+        result = CliRunner().invoke(app, ["process", str(path), "--format", "jsonl"])
+
+        assert result.exit_code == 0, result.stdout
+        read = list(read_jsonl(temp_dir / "doc.tasks.jsonl"))
+        assert [record.text for record in read] == TextProcessor(file_type="markdown").split_text(text)
+        assert all(text[record.start:record.end] == record.text for record in read)
+
+    def test_cli_stdin_jsonl(self, temp_config_file, monkeypatch):
+        """Test piped input can be streamed to stdout as JSONL."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_config_file))
+
+        result = CliRunner().invoke(app, ["process", "-", "-f", "jsonl"], input="Some text.\n")
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)["source"] == "stdin"
+
+    def test_cli_invalid_format(self, temp_dir):
+        """Test unknown formats are rejected."""
+        path = temp_dir / "doc.txt"
+        path.write_text("text", encoding='utf-8')
+
+        result = CliRunner().invoke(app, ["process", str(path), "--format", "xml"])
+
+        assert result.exit_code == 1
+        assert "xml" in result.stdout
+
+    def test_cli_incremental_needs_markdown(self, temp_dir):
+        """Test incremental updates are only available for markdown output."""
+        path = temp_dir / "doc.txt"
+        path.write_text("text", encoding='utf-8')
+
+        result = CliRunner().invoke(app, ["process", str(path), "-f", "jsonl", "--incremental"])
+
+        assert result.exit_code == 1
+
+    def test_batch_jsonl(self, temp_dir):
+        """Test batch runs write JSONL and skip previous JSONL outputs as inputs."""
+        (temp_dir / "a.txt").write_text("First file.\n\nWith two paragraphs.", encoding='utf-8')
+        (temp_dir / "old.tasks.jsonl").write_text("{}", encoding='utf-8')
+        inputs = expand_inputs([str(temp_dir)])
+        pairs = plan_outputs(inputs, suffix=".tasks.jsonl")
+        items = [BatchItem(input_path, output_path, "text") for input_path, output_path in pairs]
+
+        results = list(run_batch(items, BatchSettings(output_format="jsonl")))
+
+        assert inputs == [temp_dir / "a.txt"]
+        assert results[0].ok
+        read = list(read_jsonl(temp_dir / "a.tasks.jsonl"))
+        assert len(read) == results[0].chunks
+        assert read[0].source == "a.txt"
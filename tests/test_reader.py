@@ -0,0 +1,235 @@
+"""Tests for the memory-mapped reader module."""
+
+import io
+
+import pytest
+from typer.testing import CliRunner
+from cut_it.bench import generate_corpus
+from cut_it.cli import app
+from cut_it.config import Config, ConfigManager
+from cut_it.reader import read_stream_windows, read_windows
+from cut_it.splitter import TextProcessor
+
+
+class TestReadWindows:
+    """Test cases for read_windows."""
+
+    def test_windows_reassemble_file(self, document_factory, temp_dir):
+        """Test windows concatenate back to the file contents."""
+        text = document_factory(markdown=True)
+        path = temp_dir / "doc.md"
+        path.write_text(text, encoding='utf-8')
+
+        windows = list(read_windows(path, window_size=4096))
+
+        assert len(windows) > 1
+        assert "".join(windows) == text
+        assert all(len(window.encode('utf-8')) <= 4096 for window in windows)
+
+    def test_windows_cut_at_boundaries(self, document_factory, temp_dir):
+        """Test windows end at paragraph breaks or before headings."""
+        text = document_factory(markdown=True)
+        path = temp_dir / "doc.md"
+        path.write_text(text, encoding='utf-8')
+
+        windows = list(read_windows(path, window_size=4096))
+        offset = 0
+        for window in windows[:-1]:
+            offset += len(window)
+            assert window.endswith("\n\n") or text[offset] == "#"
+
+    def test_windows_multibyte_without_newlines(self, temp_dir):
+        """Test hard cuts never split a multi-byte character."""
+        text = "ação çã 日本語 " * 500
+        path = temp_dir / "doc.txt"
+        path.write_text(text, encoding='utf-8')
+
+        assert "".join(read_windows(path, window_size=101)) == text
+
+    def test_windows_normalize_newlines(self, temp_dir):
+        """Test CRLF line endings are normalized like read_text."""
+        path = temp_dir / "doc.txt"
+        path.write_bytes(b"first line\r\nsecond line\r\n\r\nthird\rfourth" * 50)
+
+        assert "".join(read_windows(path, window_size=64)) == path.read_text(encoding='utf-8')
+
+    def test_windows_empty_file(self, temp_dir):
+        """Test an empty file yields no windows."""
+        path = temp_dir / "empty.txt"
+        path.write_bytes(b"")
+        assert list(read_windows(path)) == []
+
+    def test_windows_invalid_utf8(self, temp_dir):
+        """Test invalid UTF-8 raises a decode error."""
+        path = temp_dir / "bad.txt"
+        path.write_bytes(b"valid\n\n\xff\xfe invalid")
+        with pytest.raises(UnicodeDecodeError):
+            list(read_windows(path))
+
+
+class TestReadStreamWindows:
+    """Test cases for read_stream_windows."""
+
+    def test_stream_windows_match_file_windows(self, document_factory, temp_dir):
+        """Test a stream is cut into the same windows as the file."""
+        text = document_factory(markdown=True)
+        path = temp_dir / "doc.md"
+        path.write_text(text, encoding='utf-8')
+
+        windows = list(read_stream_windows(io.BytesIO(text.encode('utf-8')), window_size=4096))
+
+        assert len(windows) > 1
+        assert "".join(windows) == text
+        assert windows == list(read_windows(path, window_size=4096))
+
+    def test_stream_windows_multibyte_without_newlines(self):
+        """Test hard cuts never split a multi-byte character."""
+        text = "ação çã 日本語 " * 500
+        stream = io.BytesIO(text.encode('utf-8'))
+
+        assert "".join(read_stream_windows(stream, window_size=101)) == text
+
+    def test_stream_windows_normalize_newlines(self):
+        """Test CRLF line endings are normalized, even across read boundaries."""
+        data = b"first line\r\nsecond line\r\n\r\nthird\rfourth" * 50
+        expected = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+        assert "".join(read_stream_windows(io.BytesIO(data), window_size=63)) == expected
+
+    def test_stream_windows_empty(self):
+        """Test an empty stream yields no windows."""
+        assert list(read_stream_windows(io.BytesIO(b""))) == []
+
+    def test_cli_stdin_to_stdout(self, document_factory, temp_dir):
+        """Test piped input is written to stdout as the file would be."""
+        text = document_factory(markdown=True)
+        path = temp_dir / "stdin"
+        path.write_text(text, encoding='utf-8')
+        output_path = temp_dir / "file.md"
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["process", "-", "--type", "markdown"], input=text)
+        file_result = runner.invoke(app, ["process", str(path), "--type", "markdown", "-o", str(output_path)])
+
+        assert result.exit_code == 0
+        assert file_result.exit_code == 0
+        assert result.stdout == output_path.read_text(encoding='utf-8')
+
+    def test_cli_stdin_to_file(self, temp_dir):
+        """Test piped input can still be written to an output file."""
+        output_path = temp_dir / "out.md"
+
+        result = CliRunner().invoke(app, ["process", "-", "-o", str(output_path)], input="Some text.\n")
+
+        assert result.exit_code == 0
+        assert "# stdin" in output_path.read_text(encoding='utf-8')
+
+    def test_cli_file_to_stdout(self, temp_dir):
+        """Test status messages stay off stdout when it carries the task list."""
+        path = temp_dir / "doc.txt"
+        path.write_text("Some text.\n", encoding='utf-8')
+
+        result = CliRunner().invoke(app, ["process", str(path), "-o", "-"])
+
+        assert result.exit_code == 0
+        assert result.stdout.startswith("# doc.txt")
+        assert "Some text." in result.stdout
+        assert not (temp_dir / "doc.tasks.md").exists()
+
+    def test_cli_stdin_rejects_incremental(self):
+        """Test incremental updates need real input and output files."""
+        result = CliRunner().invoke(app, ["process", "-", "--incremental"], input="text")
+
+        assert result.exit_code == 1
+
+
+class TestWindowChunks:
+    """Test cases for splitting text supplied in windows."""
+
+    @pytest.mark.parametrize("file_type", ["text", "markdown"])
+    @pytest.mark.parametrize("chunk_size", [(50, 100), (300, 500), 200])
+    def test_matches_whole_file(self, document_factory, temp_dir, file_type, chunk_size):
+        """Test windowed chunks match splitting the whole file at once."""
+        text = document_factory(markdown=file_type == "markdown")
+        path = temp_dir / "doc.md"
+        path.write_text(text, encoding='utf-8')
+        processor = TextProcessor(chunk_size=chunk_size, file_type=file_type)
+
+        windowed = list(processor.iter_window_chunks(read_windows(path, window_size=8192)))
+
+        assert windowed == processor.split_text(text)
+
+    @pytest.mark.parametrize("window_size", [65536, 16384, 4096])
+    def test_markdown_corpus_matches_whole_file(self, temp_dir, window_size):
+        """Test small windows of a large markdown corpus split like the whole file.
+
+        The markdown splitter looks further ahead than a couple of chunks, so
+        holding back a fixed number of chunks per window is not enough here.
+        """
+        text = generate_corpus("markdown", 600 * 1024, seed=3)
+        path = temp_dir / "corpus.md"
+        path.write_text(text, encoding='utf-8')
+        processor = TextProcessor(chunk_size=(50, 100), file_type="markdown")
+
+        windowed = list(processor.iter_window_records(read_windows(path, window_size)))
+
+        assert [record.text for record in windowed] == processor.split_text(text)
+        assert windowed == processor.split_with_offsets(text)
+
+    def test_markdown_stream_matches_whole_text(self):
+        """Test windows read from a stream split like the whole text."""
+        text = generate_corpus("markdown", 200 * 1024, seed=2)
+        processor = TextProcessor(chunk_size=(50, 100), file_type="markdown")
+
+        windows = read_stream_windows(io.BytesIO(text.encode('utf-8')), window_size=2048)
+
+        assert list(processor.iter_window_chunks(windows)) == processor.split_text(text)
+
+    def test_window_records_match_whole_text(self, document_factory):
+        """Test windowed records carry offsets into the whole text."""
+        text = document_factory(markdown=True)
+        windows = [text[i:i + 2048] for i in range(0, len(text), 2048)]
+        processor = TextProcessor(chunk_size=(50, 100), file_type="markdown")
+
+        records = list(processor.iter_window_records(windows))
+
+        assert records == processor.split_with_offsets(text)
+        assert all(text[record.start:record.end] == record.text for record in records)
+
+    def test_whitespace_windows(self):
+        """Test whitespace-only input yields nothing."""
+        processor = TextProcessor()
+        assert list(processor.iter_window_chunks(["  \n\n", "\n  "])) == []
+
+    def test_cli_mmap_matches_read_text(self, document_factory, temp_dir, monkeypatch):
+        """Test the process command output is the same with memory mapping."""
+        path = temp_dir / "doc.md"
+        path.write_text(document_factory(markdown=True), encoding='utf-8')
+        outputs = {}
+
+        for threshold in (64, 0):
+            config_manager = ConfigManager(temp_dir / f"config-{threshold}.json")
+            config_manager.save(Config(mmap_threshold_mb=threshold))
+            monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: config_manager)
+            output_path = temp_dir / f"out-{threshold}.md"
+
+            result = CliRunner().invoke(app, ["process", str(path), "-o", str(output_path)])
+
+            assert result.exit_code == 0, result.stdout
+            outputs[threshold] = output_path.read_text(encoding='utf-8')
+
+        assert outputs[0] == outputs[64]
+
+    def test_cli_mmap_encoding_error(self, temp_dir, monkeypatch):
+        """Test invalid UTF-8 is reported when memory mapping."""
+        path = temp_dir / "bad.txt"
+        path.write_bytes(b"valid\n\n\xff\xfe invalid")
+        config_manager = ConfigManager(temp_dir / "config.json")
+        config_manager.save(Config(mmap_threshold_mb=0))
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: config_manager)
+
+        result = CliRunner().invoke(app, ["process", str(path)])
+
+        assert result.exit_code == 1
+        assert "encoding" in result.stdout.lower()
+        assert not (temp_dir / "bad.tasks.md").exists()
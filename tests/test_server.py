@@ -0,0 +1,210 @@
+"""Tests for the chunking daemon module."""
+
+import json
+import socket
+import threading
+import pytest
+from typer.testing import CliRunner
+from cut_it.cli import app
+from cut_it.config import ConfigManager
+from cut_it.formatter import TaskFormatter
+from cut_it.server import (
+    ChunkingService,
+    RemoteClient,
+    ServerError,
+    create_server,
+    parse_address,
+    serve,
+)
+from cut_it.splitter import TextProcessor
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets unavailable")
+
+
+@pytest.fixture
+def running_server(temp_dir):
+    """A daemon answering requests on a Unix socket in a background thread."""
+    address = str(temp_dir / "cut-it.sock")
+    server = create_server(address)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield address
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestAddresses:
+    """Test cases for address parsing."""
+
+    def test_parse_address(self):
+        """Test TCP addresses and socket paths are told apart."""
+        assert parse_address("localhost:9000") == ("localhost", 9000)
+        assert parse_address(":9000") == ("127.0.0.1", 9000)
+        assert parse_address("/tmp/cut-it.sock") == "/tmp/cut-it.sock"
+        assert str(parse_address(None)).endswith("cut-it.sock")
+
+
+class TestServer:
+    """Test cases for the daemon protocol."""
+
+    def test_split_and_process(self, running_server, document_factory):
+        """Test remote results match splitting and formatting locally."""
+        text = document_factory(paragraphs=40, markdown=True)
+        processor = TextProcessor(chunk_size=(100, 200), file_type="markdown")
+        expected_chunks = processor.split_text(text)
+        
+        with RemoteClient(running_server) as client:
+            assert client.ping()
+            chunks = client.split(text, file_type="markdown", chunk_size=[100, 200])
+            result = client.process(text, "doc.md", file_type="markdown", chunk_size=[100, 200], pt_br=True)
+            stats = client.request("stats")
+        
+        assert chunks == expected_chunks
+        assert result["chunks"] == len(expected_chunks)
+        assert result["content"] == TaskFormatter(pt_br=True).format_as_tasks(expected_chunks, "doc.md")
+        assert stats["requests"] == 4
+        assert stats["processors"] == 1
+
+    def test_errors(self, running_server):
+        """Test bad requests are answered with errors without dropping the connection."""
+        with RemoteClient(running_server) as client:
+            with pytest.raises(ServerError, match="unknown op"):
+                client.request("explode")
+            with pytest.raises(ServerError, match="KeyError"):
+                client.request("split")
+            assert client.ping()
+
+    def test_invalid_json(self, running_server):
+        """Test malformed lines get an error response."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(running_server)
+            sock.sendall(b"{not json\n")
+            response = json.loads(sock.makefile('rb').readline())
+        assert response["ok"] is False
+
+    def test_concurrent_clients(self, running_server):
+        """Test several clients are answered at the same time."""
+        results = []
+        
+        def work(i):
+            with RemoteClient(running_server) as client:
+                results.append(client.split(f"Paragraph {i}.\n\nAnother paragraph."))
+        
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(results) == 8
+
+    def test_tcp_and_shutdown(self):
+        """Test a TCP daemon stops after a shutdown request."""
+        server = create_server(("127.0.0.1", 0))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        
+        with RemoteClient(server.server_address) as client:
+            assert client.split("Hello world.") == ["Hello world."]
+            client.request("shutdown")
+        
+        thread.join(timeout=5)
+        server.server_close()
+        assert not thread.is_alive()
+
+    def test_serve_replaces_stale_socket(self, temp_dir):
+        """Test a leftover socket file is replaced and removed on exit."""
+        address = str(temp_dir / "stale.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(address)
+        stale.close()
+        
+        thread = threading.Thread(target=serve, args=(address,), daemon=True)
+        thread.start()
+        for _ in range(100):
+            try:
+                with RemoteClient(address) as client:
+                    client.request("shutdown")
+                break
+            except OSError:
+                threading.Event().wait(0.05)
+        thread.join(timeout=5)
+        
+        assert not thread.is_alive()
+        assert not (temp_dir / "stale.sock").exists()
+
+    def test_refuses_live_socket(self, running_server):
+        """Test a second server does not steal a live socket."""
+        with pytest.raises(ServerError):
+            create_server(running_server)
+
+
+class TestChunkingService:
+    """Test cases for the request dispatcher."""
+
+    def test_processors_are_bounded(self):
+        """Test processors for many distinct settings are evicted least recently used first."""
+        service = ChunkingService(max_processors=3)
+        first = service.get_processor(chunk_size=100)
+        for size in range(101, 110):
+            service.get_processor(chunk_size=size)
+            service.get_processor(chunk_size=100)
+
+        result = service.handle({"op": "stats"})["result"]
+
+        assert result["processors"] == 3
+        assert service.get_processor(chunk_size=100) is first
+
+
+class TestRemoteProcess:
+    """Test cases for process --remote."""
+
+    def test_matches_local(self, running_server, temp_dir, monkeypatch, document_factory):
+        """Test remote processing writes the same output as local processing."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_dir / "config.json"))
+        source = temp_dir / "doc.md"
+        source.write_text(document_factory(paragraphs=40, markdown=True), encoding='utf-8')
+        runner = CliRunner()
+        
+        local = runner.invoke(app, ["process", str(source), "-o", str(temp_dir / "local.md")])
+        remote = runner.invoke(app, [
+            "process", str(source), "-o", str(temp_dir / "remote.md"), "--remote", "--server", running_server
+        ])
+        
+        assert local.exit_code == 0, local.stdout
+        assert remote.exit_code == 0, remote.stdout
+        assert (temp_dir / "remote.md").read_text(encoding='utf-8') == (temp_dir / "local.md").read_text(encoding='utf-8')
+
+    def test_stdin_and_stdout(self, running_server, temp_dir, monkeypatch):
+        """Test '-' reads stdin and writes stdout as local processing does."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_dir / "config.json"))
+        monkeypatch.chdir(temp_dir)
+        source = temp_dir / "doc.md"
+        source.write_text("# Title\n\nSome markdown.", encoding='utf-8')
+        runner = CliRunner()
+        remote = ["--remote", "--server", running_server]
+        
+        piped = runner.invoke(app, ["process", "-", *remote], input="Some text.\n")
+        to_stdout = runner.invoke(app, ["process", str(source), "-o", "-", *remote])
+        local = runner.invoke(app, ["process", str(source), "-o", "-"])
+        
+        assert piped.exit_code == 0, piped.stdout
+        assert piped.stdout.startswith("# stdin")
+        assert "Some text." in piped.stdout
+        assert to_stdout.exit_code == 0, to_stdout.stdout
+        assert to_stdout.stdout == local.stdout
+        assert not (temp_dir / "-").exists()
+
+    def test_server_unavailable(self, temp_dir, monkeypatch):
+        """Test a missing daemon is reported."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_dir / "config.json"))
+        source = temp_dir / "doc.txt"
+        source.write_text("Some text.", encoding='utf-8')
+        
+        result = CliRunner().invoke(app, [
+            "process", str(source), "--remote", "--server", str(temp_dir / "missing.sock")
+        ])
+        
+        assert result.exit_code == 1
+        assert "Could not use the server" in result.stdout
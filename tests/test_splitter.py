@@ -1,8 +1,13 @@
 """Tests for the text splitter module."""
 
+import os
+import subprocess
+import sys
+import threading
 import pytest
 from unittest.mock import Mock, patch
-from cut_it.splitter import TextProcessor
+from cut_it import splitter as splitter_module
+from cut_it.splitter import ChunkView, SplitterCache, TextProcessor, threads_scale, validate_overlap
 
 
 class TestTextProcessor:
@@ -134,6 +139,59 @@ class TestTextProcessor:
         # Should filter out empty paragraphs
         assert all(chunk.strip() for chunk in result)
 
+    @pytest.mark.parametrize("chunk_size", [(30, 50), (100, 200), 80])
+    def test_fallback_split_enforces_size(self, document_factory, monkeypatch, chunk_size):
+        """Test fallback chunks stay within the maximum and keep every word."""
+        monkeypatch.setattr(splitter_module, "_get_token_counter", lambda model: None)
+        processor = TextProcessor(chunk_size=chunk_size)
+        text = document_factory() + "\n\n" + "A long sentence that keeps going on. " * 20
+        max_size = chunk_size[1] if isinstance(chunk_size, tuple) else chunk_size
+
+        result = processor._fallback_split(text)
+
+        assert all(len(chunk) <= max_size for chunk in result)
+        assert " ".join(result).split() == text.split()
+
+    def test_fallback_split_fills_to_minimum(self, monkeypatch):
+        """Test chunks below the minimum are topped up from the next sentences."""
+        monkeypatch.setattr(splitter_module, "_get_token_counter", lambda model: None)
+        processor = TextProcessor(chunk_size=(30, 50))
+        text = "Tiny.\n\n" + "A very long sentence that goes on. And another one here! " * 3
+
+        result = processor._fallback_split(text)
+
+        assert all(len(chunk) >= 30 for chunk in result[:-1])
+        assert all(len(chunk) <= 50 for chunk in result)
+
+    def test_fallback_split_long_word(self, monkeypatch):
+        """Test words longer than a chunk are cut into slices."""
+        monkeypatch.setattr(splitter_module, "_get_token_counter", lambda model: None)
+        processor = TextProcessor(chunk_size=(10, 20))
+
+        assert processor._fallback_split("x" * 45) == ["x" * 20, "x" * 20, "x" * 5]
+
+    def test_fallback_split_uses_tokens(self, monkeypatch):
+        """Test sizes are measured in tokens when a tokenizer is available."""
+        monkeypatch.setattr(
+            splitter_module, "_get_token_counter", lambda model: lambda text: len(text.split())
+        )
+        processor = TextProcessor(chunk_size=(2, 4))
+
+        result = processor._fallback_split("one two\n\nthree four\n\nfive six seven")
+
+        assert result == ["one two\n\nthree four", "five six seven"]
+
+    def test_fallback_split_many_paragraphs(self, monkeypatch):
+        """Test 100k paragraphs are packed without losing any."""
+        monkeypatch.setattr(splitter_module, "_get_token_counter", lambda model: None)
+        processor = TextProcessor(chunk_size=(300, 500))
+        text = "\n\n".join(f"Paragraph {i} is short." for i in range(100_000))
+
+        result = processor._fallback_split(text)
+
+        assert "\n\n".join(result) == text
+        assert all(300 <= len(chunk) <= 500 for chunk in result[:-1])
+
     def test_get_chunk_info_empty(self):
         """Test chunk info for empty chunks."""
         processor = TextProcessor()
@@ -170,4 +228,470 @@ class TestTextProcessor:
         assert info["total_characters"] == 12
         assert info["min_chunk_size"] == 12
         assert info["max_chunk_size"] == 12
-        assert info["average_chunk_size"] == 12
\ No newline at end of file
+        assert info["average_chunk_size"] == 12
+
+
+class TestSplitterCache:
+    """Test cases for SplitterCache class."""
+
+    @patch('cut_it.splitter.TextSplitter')
+    def test_processors_share_splitter(self, mock_text_splitter):
+        """Test processors with the same settings reuse one splitter."""
+        mock_text_splitter.from_tiktoken_model.return_value = Mock()
+        
+        first = TextProcessor(chunk_size=(300, 500))
+        second = TextProcessor(chunk_size=(300, 500))
+        
+        assert first.splitter is second.splitter
+        mock_text_splitter.from_tiktoken_model.assert_called_once()
+
+    @patch('cut_it.splitter.MarkdownSplitter')
+    @patch('cut_it.splitter.TextSplitter')
+    def test_key_includes_settings(self, mock_text_splitter, mock_markdown_splitter):
+        """Test different settings get different splitters."""
+        mock_text_splitter.from_tiktoken_model.side_effect = lambda *a, **k: Mock()
+        mock_markdown_splitter.from_tiktoken_model.side_effect = lambda *a, **k: Mock()
+        cache = SplitterCache()
+        
+        text = cache.get("text", "gpt-4", (300, 500))
+        assert cache.get("markdown", "gpt-4", (300, 500)) is not text
+        assert cache.get("text", "gpt-3.5-turbo", (300, 500)) is not text
+        assert cache.get("text", "gpt-4", 500) is not text
+        assert cache.get("text", "gpt-4", [300, 500]) is text
+
+    @patch('cut_it.splitter.TextSplitter')
+    def test_stats(self, mock_text_splitter):
+        """Test hit/miss statistics."""
+        cache = SplitterCache(maxsize=4)
+        cache.get("text", "gpt-4", 100)
+        cache.get("text", "gpt-4", 100)
+        cache.get("text", "gpt-4", 200)
+        
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 2
+        assert stats.size == 2
+        assert stats.maxsize == 4
+
+    @patch('cut_it.splitter.TextSplitter')
+    def test_lru_eviction(self, mock_text_splitter):
+        """Test least recently used splitter is evicted first."""
+        mock_text_splitter.from_tiktoken_model.side_effect = lambda *a, **k: Mock()
+        cache = SplitterCache(maxsize=2)
+        
+        first = cache.get("text", "gpt-4", 100)
+        second = cache.get("text", "gpt-4", 200)
+        assert cache.get("text", "gpt-4", 100) is first
+        cache.get("text", "gpt-4", 300)
+        
+        assert cache.stats().size == 2
+        assert cache.get("text", "gpt-4", 100) is first
+        assert cache.get("text", "gpt-4", 200) is not second
+
+    @patch('cut_it.splitter.TextSplitter')
+    def test_clear(self, mock_text_splitter):
+        """Test clearing the cache resets splitters and statistics."""
+        cache = SplitterCache()
+        cache.get("text", "gpt-4", 100)
+        cache.get("text", "gpt-4", 100)
+        
+        cache.clear()
+        
+        assert cache.stats() == (0, 0, 0, cache.maxsize)
+
+    @patch('cut_it.splitter.TextSplitter')
+    def test_thread_safe_single_build(self, mock_text_splitter):
+        """Test concurrent lookups build the splitter only once."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        cache = SplitterCache()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda _: cache.get("text", "gpt-4", (300, 500)), range(32)
+            ))
+        
+        assert all(result is results[0] for result in results)
+        mock_text_splitter.from_tiktoken_model.assert_called_once()
+        assert cache.stats().hits == 31
+
+
+class TestIterChunks:
+    """Test cases for the streaming chunk iterator."""
+
+    @patch('cut_it.splitter.TextSplitter')
+    def test_iter_chunks_is_lazy(self, mock_text_splitter):
+        """Test chunks are yielded from a generator, stripped and filtered."""
+        mock_splitter = Mock()
+        mock_splitter.chunks.return_value = [" chunk1 ", "", "  ", "chunk2\n"]
+        mock_text_splitter.from_tiktoken_model.return_value = mock_splitter
+        
+        processor = TextProcessor()
+        iterator = processor.iter_chunks("Some test text")
+        
+        assert not isinstance(iterator, list)
+        mock_splitter.chunks.assert_not_called()
+        assert next(iterator) == "chunk1"
+        assert list(iterator) == ["chunk2"]
+
+    def test_iter_chunks_empty(self):
+        """Test empty and whitespace-only text yields nothing."""
+        processor = TextProcessor()
+        assert list(processor.iter_chunks("")) == []
+        assert list(processor.iter_chunks(" \n\n ")) == []
+
+    @patch('cut_it.splitter.TextSplitter')
+    def test_iter_chunks_fallback(self, mock_text_splitter):
+        """Test fallback splitting is used when the splitter fails."""
+        mock_splitter = Mock()
+        mock_splitter.chunks.side_effect = Exception("Splitter error")
+        mock_text_splitter.from_tiktoken_model.return_value = mock_splitter
+        
+        processor = TextProcessor(chunk_size=(5, 10))
+        text = "First paragraph.\n\nSecond paragraph."
+        
+        assert list(processor.iter_chunks(text)) == processor._fallback_split(text)
+
+    def test_iter_chunks_matches_split_text(self, sample_markdown):
+        """Test the iterator yields exactly what split_text returns."""
+        processor = TextProcessor(chunk_size=(10, 30), file_type="markdown")
+        assert list(processor.iter_chunks(sample_markdown)) == processor.split_text(sample_markdown)
+
+
+class TestSplitWithOffsets:
+    """Test cases for chunk records with source offsets."""
+
+    TEXT = (
+        "  Olá mundo, ação rápida.\n\n"
+        "Second paragraph with enough words to need its own chunk here.\n\n"
+        "日本語のテキストです。"
+    )
+
+    def test_character_offsets(self):
+        """Test character offsets slice each chunk out of the source."""
+        processor = TextProcessor(chunk_size=(10, 20))
+        records = processor.split_with_offsets(self.TEXT)
+        
+        assert [record.text for record in records] == processor.split_text(self.TEXT)
+        for record in records:
+            assert self.TEXT[record.start:record.end] == record.text
+
+    def test_byte_offsets(self):
+        """Test byte offsets slice each chunk out of the encoded source."""
+        processor = TextProcessor(chunk_size=(10, 20))
+        encoded = self.TEXT.encode('utf-8')
+        
+        for record in processor.split_with_offsets(self.TEXT, byte_offsets=True):
+            assert encoded[record.start:record.end].decode('utf-8') == record.text
+
+    def test_record_fields(self):
+        """Test records are compact named tuples."""
+        processor = TextProcessor()
+        record = processor.split_with_offsets("Short text.")[0]
+        
+        assert record == (0, 11, record.token_count, "Short text.")
+        assert record._fields == ("start", "end", "token_count", "text")
+        assert not hasattr(record, "__dict__")
+
+    @patch('cut_it.splitter._get_token_counter')
+    def test_token_counts(self, mock_get_counter):
+        """Test token counts come from the model's token counter."""
+        mock_get_counter.return_value = lambda text: len(text.split())
+        processor = TextProcessor(model="gpt-4")
+        
+        records = processor.split_with_offsets("one two three")
+        
+        assert records[0].token_count == 3
+        mock_get_counter.assert_called_with("gpt-4")
+
+    @patch('cut_it.splitter._get_token_counter', return_value=None)
+    def test_token_counts_unavailable(self, mock_get_counter):
+        """Test token counts are None without a tokenizer."""
+        processor = TextProcessor()
+        assert processor.split_with_offsets("one two three")[0].token_count is None
+
+    def test_empty_text(self):
+        """Test empty text yields no records."""
+        processor = TextProcessor()
+        assert processor.split_with_offsets("  \n ") == []
+
+    @patch('cut_it.splitter.TextSplitter')
+    def test_fallback_offsets(self, mock_text_splitter):
+        """Test fallback chunks are located in the source text."""
+        mock_splitter = Mock()
+        mock_splitter.chunk_indices.side_effect = Exception("Splitter error")
+        mock_text_splitter.from_tiktoken_model.return_value = mock_splitter
+        text = "First para.\n\n\n\nSecond para.\n\nA much longer third paragraph here."
+        
+        processor = TextProcessor(chunk_size=(10, 30))
+        records = processor.split_with_offsets(text)
+        
+        assert len(records) >= 2
+        for record in records:
+            assert text[record.start:record.end] == record.text
+
+
+class TestTokenStats:
+    """Test cases for token counting and statistics."""
+
+    @pytest.fixture
+    def counted(self, monkeypatch):
+        """Count whitespace-separated words as tokens, recording each call."""
+        calls = []
+
+        def count_tokens(text):
+            calls.append(text)
+            return len(text.split())
+
+        monkeypatch.setattr(splitter_module, "_get_token_counter", lambda model: count_tokens)
+        return calls
+
+    def test_without_tiktoken(self, monkeypatch):
+        """Test token APIs return None when no tokenizer is available."""
+        monkeypatch.setattr(splitter_module, "_get_token_counter", lambda model: None)
+        processor = TextProcessor()
+
+        assert processor.count_tokens("some text") is None
+        assert processor.get_token_stats(["some text"]) is None
+
+    def test_stats_of_chunks(self, counted):
+        """Test statistics of plain chunks."""
+        processor = TextProcessor()
+
+        stats = processor.get_token_stats(["one two", "three", "four five six"])
+
+        assert stats.token_counts == [2, 1, 3]
+        assert stats.total_tokens == 6
+        assert stats.min_tokens == 1
+        assert stats.max_tokens == 3
+        assert stats.mean_tokens == 2.0
+
+    def test_records_are_not_recounted(self, counted):
+        """Test counts taken while splitting are reused for records."""
+        processor = TextProcessor(chunk_size=(50, 100))
+        text = "\n\n".join(f"Paragraph {i} with a few words in it." for i in range(40))
+        records = processor.split_with_offsets(text)
+        counted.clear()
+
+        stats = processor.get_token_stats(records)
+
+        assert counted == []
+        assert stats.token_counts == [record.token_count for record in records]
+
+    def test_split_text_does_not_count(self, counted):
+        """Test plain chunks are only tokenized when statistics are asked for."""
+        processor = TextProcessor(chunk_size=(50, 100))
+        text = "\n\n".join(f"Paragraph {i} with a few words in it." for i in range(40))
+
+        chunks = processor.split_text(text)
+        assert counted == []
+
+        stats = processor.get_token_stats(chunks)
+        assert counted == chunks
+        assert stats.token_counts == [len(chunk.split()) for chunk in chunks]
+
+    def test_failed_encoding_is_retried(self, monkeypatch, caplog):
+        """Test a tokenizer that fails to load is logged and not remembered."""
+        attempts = []
+
+        class FakeEncoding:
+            def encode(self, text, disallowed_special=()):
+                return text.split()
+
+        class FakeTiktoken:
+            @staticmethod
+            def encoding_for_model(model):
+                attempts.append(model)
+                if len(attempts) == 1:
+                    raise OSError("network is unreachable")
+                return FakeEncoding()
+
+        monkeypatch.setattr(splitter_module, "_load_tiktoken", lambda: FakeTiktoken)
+        monkeypatch.setattr(splitter_module, "_token_counters", {})
+        monkeypatch.setattr(splitter_module, "_token_counter_failures", {})
+        monkeypatch.setattr(splitter_module, "_TOKEN_COUNTER_RETRY", 0.0)
+
+        with caplog.at_level("WARNING", logger="cut_it.splitter"):
+            assert splitter_module._get_token_counter("fake-model") is None
+        assert "network is unreachable" in caplog.text
+
+        counter = splitter_module._get_token_counter("fake-model")
+        assert counter("a b c") == 3
+        assert splitter_module._get_token_counter("fake-model") is counter
+        assert attempts == ["fake-model", "fake-model"]
+
+    def test_failed_encoding_retry_waits(self, monkeypatch):
+        """Test a failed tokenizer is not reloaded before the retry interval."""
+        attempts = []
+
+        class FakeTiktoken:
+            @staticmethod
+            def encoding_for_model(model):
+                attempts.append(model)
+                raise OSError("network is unreachable")
+
+        monkeypatch.setattr(splitter_module, "_load_tiktoken", lambda: FakeTiktoken)
+        monkeypatch.setattr(splitter_module, "_token_counters", {})
+        monkeypatch.setattr(splitter_module, "_token_counter_failures", {})
+
+        assert splitter_module._get_token_counter("fake-model") is None
+        assert splitter_module._get_token_counter("fake-model") is None
+        assert attempts == ["fake-model"]
+
+
+class TestSplitMany:
+    """Test cases for TextProcessor.split_many."""
+
+    @pytest.fixture(autouse=True)
+    def reset_probe(self):
+        """Forget the thread scaling probe result around each test."""
+        threads_scale.cache_clear()
+        yield
+        threads_scale.cache_clear()
+
+    @pytest.mark.parametrize("scales", [True, False])
+    def test_matches_serial(self, document_factory, monkeypatch, scales):
+        """Test results equal splitting each text in turn, in input order."""
+        monkeypatch.setattr(splitter_module, "threads_scale", lambda splitter: scales)
+        processor = TextProcessor(chunk_size=(50, 100))
+        texts = [document_factory(paragraphs=20, seed=seed) for seed in range(6)]
+        
+        assert processor.split_many(texts, workers=3) == [processor.split_text(text) for text in texts]
+
+    def test_uses_threads_when_they_scale(self, monkeypatch):
+        """Test texts are split on worker threads only when threads scale."""
+        processor = TextProcessor()
+        threads = set()
+        
+        def record_thread(text):
+            threads.add(threading.current_thread().name)
+            return [text]
+        
+        monkeypatch.setattr(processor, "split_text", record_thread)
+        monkeypatch.setattr(splitter_module, "threads_scale", lambda splitter: True)
+        processor.split_many(["a", "b", "c", "d"], workers=2)
+        assert all(name.startswith("cut-it") for name in threads)
+        
+        threads.clear()
+        monkeypatch.setattr(splitter_module, "threads_scale", lambda splitter: False)
+        processor.split_many(["a", "b", "c", "d"], workers=2)
+        assert threads == {threading.current_thread().name}
+
+    def test_probe_single_core(self, monkeypatch):
+        """Test threads are never used with a single core."""
+        monkeypatch.setattr(splitter_module, "available_cores", lambda: 1)
+        assert threads_scale(TextProcessor().splitter) is False
+
+    def test_probe_runs_once_per_splitter(self, monkeypatch):
+        """Test the probe result is cached for each splitter."""
+        monkeypatch.setattr(splitter_module, "available_cores", lambda: 2)
+        splitter = TextProcessor().splitter
+        first = threads_scale(splitter)
+        assert threads_scale(splitter) is first
+        assert threads_scale.cache_info().hits == 1
+
+    def test_probe_uses_the_processor_splitter(self, monkeypatch):
+        """Test split_many probes its own splitter without adding others to the cache."""
+        cache = SplitterCache()
+        monkeypatch.setattr(splitter_module, "splitter_cache", cache)
+        monkeypatch.setattr(splitter_module, "available_cores", lambda: 2)
+        processor = TextProcessor(chunk_size=(50, 100), file_type="markdown")
+
+        processor.split_many(["# One", "# Two"], workers=2)
+
+        assert threads_scale.cache_info().currsize == 1
+        assert cache.stats().size == 1
+
+    @pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="CPU affinity unavailable")
+    def test_single_core_falls_back_to_serial(self):
+        """Test a process pinned to one core splits serially with the real probe."""
+        code = (
+            "import os, threading\n"
+            "os.sched_setaffinity(0, {min(os.sched_getaffinity(0))})\n"
+            "from cut_it.splitter import TextProcessor, threads_scale\n"
+            "class Recording(TextProcessor):\n"
+            "    threads = set()\n"
+            "    def split_text(self, text):\n"
+            "        self.threads.add(threading.current_thread().name)\n"
+            "        return super().split_text(text)\n"
+            "processor = Recording(chunk_size=(50, 100))\n"
+            "texts = ['First paragraph.\\n\\nSecond paragraph.'] * 4\n"
+            "assert processor.split_many(texts, workers=4) == [processor.split_text(text) for text in texts]\n"
+            "print(threads_scale(processor.splitter), sorted(processor.threads))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.split() == ["False", "['MainThread']"]
+
+    def test_empty(self):
+        """Test splitting no texts."""
+        assert TextProcessor().split_many([]) == []
+
+
+class TestOverlap:
+    """Test cases for overlapping chunks and chunk views."""
+
+    @pytest.fixture
+    def text(self):
+        sentence = "The quick brown fox jumps over the lazy dog near the river bank. "
+        return "\n\n".join(sentence * 12 for _ in range(20))
+
+    def test_validate_overlap(self):
+        """Test the overlap must be smaller than the minimum chunk size."""
+        validate_overlap((100, 200), 99)
+        validate_overlap(100, 0)
+        with pytest.raises(ValueError, match="minimum chunk size"):
+            validate_overlap((100, 200), 100)
+        with pytest.raises(ValueError, match="negative"):
+            validate_overlap(100, -1)
+        with pytest.raises(ValueError):
+            TextProcessor(chunk_size=(50, 100), overlap=60)
+
+    @patch('cut_it.splitter.TextSplitter')
+    def test_key_includes_overlap(self, mock_text_splitter):
+        """Test each overlap gets its own splitter, built with that overlap."""
+        mock_text_splitter.from_tiktoken_model.side_effect = lambda *a, **k: Mock()
+        cache = SplitterCache()
+
+        plain = cache.get("text", "gpt-4", (300, 500))
+        overlapping = cache.get("text", "gpt-4", (300, 500), overlap=50)
+
+        assert overlapping is not plain
+        assert cache.get("text", "gpt-4", (300, 500), None, 50) is overlapping
+        mock_text_splitter.from_tiktoken_model.assert_called_with("gpt-4", capacity=(300, 500), overlap=50)
+
+    def test_chunks_overlap(self, text):
+        """Test chunks within a paragraph share text when an overlap is set."""
+        plain = TextProcessor(chunk_size=(60, 100)).split_views(text)
+        views = TextProcessor(chunk_size=(60, 100), overlap=30).split_views(text)
+
+        assert all(a.end <= b.start for a, b in zip(plain, plain[1:]))
+        assert len(views) > len(plain)
+        assert any(b.start < a.end for a, b in zip(views, views[1:]))
+
+    def test_views_match_chunks(self, text):
+        """Test views are offsets into the source matching the split chunks."""
+        processor = TextProcessor(chunk_size=(60, 100), overlap=30)
+
+        views = processor.split_views(text)
+
+        assert [str(view) for view in views] == processor.split_text(text)
+        assert all(view.source is text for view in views)
+        assert all(text[view.start:view.end] == view.text for view in views)
+
+    def test_views_of_empty_text(self):
+        """Test empty and whitespace-only texts have no views."""
+        assert TextProcessor().split_views("") == []
+        assert TextProcessor().split_views(" \n\n ") == []
+
+    def test_view_behaves_like_its_text(self):
+        """Test views compare, hash and measure like the chunk text."""
+        source = "alpha beta gamma"
+        view = ChunkView(source, 6, 10)
+
+        assert str(view) == "beta"
+        assert len(view) == 4
+        assert view == "beta"
+        assert view == ChunkView("beta", 0, 4)
+        assert view != "gamma"
+        assert hash(view) == hash("beta")
+        assert not hasattr(view, "__dict__")
+        assert "beta" in repr(view)
@@ -0,0 +1,101 @@
+"""Startup-time checks for the CLI's lazy imports."""
+
+import os
+import subprocess
+import sys
+import time
+import pytest
+
+# Slowest a command may start compared with an interpreter that only
+# imports typer, leaving room for rich's help rendering and slow CI machines
+STARTUP_OVERHEAD = 0.75
+
+STARTUP_COMMANDS = [("--help",), ("config-cmd", "--show")]
+
+# Prefixes of modules that must not load on the startup path; tree_sitter
+# also covers the per-language grammar packages
+HEAVY_MODULES = (
+    "semantic_text_splitter",
+    "cut_it.splitter",
+    "concurrent.futures",
+    "multiprocessing",
+    "rich.progress",
+    "numpy",
+    "tiktoken",
+    "tree_sitter",
+    "watchdog",
+)
+
+REPORT_HEAVY = f"print('LOADED', sorted(m for m in sys.modules if m.startswith({HEAVY_MODULES!r})))"
+
+
+def fastest_run(code, home, runs=3):
+    """Get the fastest wall-clock time of running Python code in a fresh interpreter."""
+    env = dict(os.environ, HOME=str(home), USERPROFILE=str(home))
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], capture_output=True, env=env)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def run_python(code, home):
+    """Run Python code in a fresh interpreter with an isolated home directory."""
+    env = dict(os.environ, HOME=str(home), USERPROFILE=str(home))
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True
+    )
+
+
+class TestStartup:
+    """Test cases for CLI startup cost."""
+
+    def test_package_import_is_lazy(self, temp_dir):
+        """Test importing the package does not load the native splitter."""
+        result = run_python(
+            "import sys, cut_it\n"
+            "print('semantic_text_splitter' in sys.modules)\n"
+            "cut_it.TextProcessor\n"
+            "print('semantic_text_splitter' in sys.modules)",
+            temp_dir
+        )
+        assert result.stdout.split() == ["False", "True"]
+
+    def test_cli_import_skips_heavy_imports(self, temp_dir):
+        """Test importing the CLI module loads none of the heavy modules."""
+        result = run_python("import sys\nimport cut_it.cli\n" + REPORT_HEAVY, temp_dir)
+        assert result.stdout.strip() == "LOADED []"
+
+    @pytest.mark.parametrize("args", [("--help",), ("config-cmd", "--show"), ("update",), ("cache", "stats")])
+    def test_commands_skip_heavy_imports(self, temp_dir, args):
+        """Test commands that do not split text never import heavy modules."""
+        result = run_python(
+            "import sys\n"
+            "from cut_it.cli import app\n"
+            f"sys.argv = ['cut-it', *{list(args)!r}]\n"
+            "try:\n"
+            "    app()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            + REPORT_HEAVY,
+            temp_dir
+        )
+        assert result.stdout.strip().splitlines()[-1] == "LOADED []"
+
+    @pytest.mark.parametrize("args", STARTUP_COMMANDS)
+    def test_startup_overhead(self, temp_dir, args):
+        """Test a command starts within a fixed overhead of a bare typer import."""
+        baseline = fastest_run("import typer", temp_dir)
+        duration = fastest_run(
+            "import sys\n"
+            "from cut_it.cli import app\n"
+            f"sys.argv = ['cut-it', *{list(args)!r}]\n"
+            "app()",
+            temp_dir
+        )
+        assert duration - baseline < STARTUP_OVERHEAD
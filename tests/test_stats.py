@@ -0,0 +1,204 @@
+"""Tests for the chunk statistics module."""
+
+import json
+import random
+from array import array
+
+import pytest
+from typer.testing import CliRunner
+from cut_it import stats as stats_module
+from cut_it.cli import app
+from cut_it.config import ConfigManager
+from cut_it.splitter import ChunkRecord, TextProcessor
+from cut_it.stats import CorpusStats, chunk_info, percentile, summarize, token_stats
+
+numpy_engine = pytest.mark.skipif(stats_module._load_numpy() is None, reason="NumPy is not installed")
+
+
+class TestPercentile:
+    """Test cases for percentile."""
+
+    @pytest.mark.parametrize("q, expected", [(0, 1.0), (50, 3.0), (90, 4.6), (100, 5.0)])
+    def test_linear_interpolation(self, q, expected):
+        """Test percentiles interpolate linearly between ranks."""
+        assert percentile([1, 2, 3, 4, 5], q) == pytest.approx(expected)
+
+    def test_single_and_empty(self):
+        """Test a single value and no values."""
+        assert percentile([7], 95) == 7.0
+        assert percentile([], 50) == 0.0
+
+
+class TestTokenStats:
+    """Test cases for token_stats."""
+
+    def test_summary(self):
+        """Test totals, extremes, mean and percentiles."""
+        stats = token_stats([30, 10, 20, 40])
+
+        assert stats.token_counts == [30, 10, 20, 40]
+        assert stats.total_tokens == 100
+        assert stats.min_tokens == 10
+        assert stats.max_tokens == 40
+        assert stats.mean_tokens == 25.0
+        assert stats.percentiles[50] == pytest.approx(25.0)
+        assert set(stats.percentiles) == {50, 90, 95, 99}
+
+    def test_empty(self):
+        """Test no chunks give all-zero statistics."""
+        stats = token_stats([], percentiles=(50,))
+
+        assert stats.total_tokens == 0
+        assert stats.min_tokens == stats.max_tokens == 0
+        assert stats.mean_tokens == 0.0
+        assert stats.percentiles == {50: 0.0}
+
+    def test_to_dict(self):
+        """Test the dictionary form omits per-chunk counts."""
+        data = token_stats([1, 3], percentiles=(50,)).to_dict()
+
+        assert data == {
+            "total_tokens": 4,
+            "min_tokens": 1,
+            "max_tokens": 3,
+            "mean_tokens": 2.0,
+            "percentiles": {"p50": 2.0},
+        }
+
+
+class TestSummarize:
+    """Test cases for summarize and the statistics engines."""
+
+    @numpy_engine
+    @pytest.mark.parametrize("size", [1, 2, 7, 5000])
+    def test_engines_agree(self, size):
+        """Test the NumPy and pure Python engines give identical summaries."""
+        rng = random.Random(size)
+        values = [rng.randint(1, 3000) for _ in range(size)]
+
+        python = summarize(values, engine="python")
+        vectorized = summarize(values, engine="numpy")
+
+        assert vectorized.count == python.count == size
+        assert (vectorized.total, vectorized.min, vectorized.max) == (python.total, python.min, python.max)
+        assert vectorized.percentiles == pytest.approx(python.percentiles)
+        assert all(type(value) is int for value in vectorized[:4])
+
+    @numpy_engine
+    def test_array_input(self):
+        """Test compact integer arrays are accepted by both engines."""
+        values = array('q', [5, 1, 4])
+
+        assert summarize(values, engine="numpy") == summarize(values, engine="python")
+
+    def test_unknown_engine(self):
+        """Test unknown engines are rejected."""
+        with pytest.raises(ValueError):
+            summarize([1], engine="gpu")
+
+    def test_numpy_engine_without_numpy(self, monkeypatch):
+        """Test requesting NumPy without it installed raises ImportError."""
+        monkeypatch.setattr(stats_module, "_load_numpy", lambda: None)
+
+        with pytest.raises(ImportError):
+            summarize([1, 2], engine="numpy")
+        assert summarize(list(range(5000)), engine="auto").total == sum(range(5000))
+
+
+class TestChunkInfo:
+    """Test cases for chunk_info and get_chunk_info."""
+
+    def test_default_keys_unchanged(self):
+        """Test the default keys match the original get_chunk_info."""
+        chunks = ["a" * 5, "b" * 13, "c" * 22]
+
+        info = TextProcessor().get_chunk_info(chunks)
+
+        assert info == {
+            "total_chunks": 3,
+            "total_characters": 40,
+            "average_chunk_size": 13,
+            "min_chunk_size": 5,
+            "max_chunk_size": 22,
+        }
+
+    @pytest.mark.parametrize("engine", ["python", pytest.param("numpy", marks=numpy_engine)])
+    def test_percentiles(self, engine):
+        """Test chunk size percentiles are added on request."""
+        chunks = ["x" * length for length in range(1, 2001)]
+
+        info = chunk_info(chunks, percentiles=(50, 99), engine=engine)
+
+        assert info["total_chunks"] == 2000
+        assert info["max_chunk_size"] == 2000
+        assert info["chunk_size_percentiles"] == pytest.approx({"p50": 1000.5, "p99": 1980.01})
+
+
+class TestCorpusStats:
+    """Test cases for CorpusStats."""
+
+    def test_accumulates_files(self):
+        """Test files are summarized together and individually."""
+        corpus = CorpusStats()
+        corpus.add([10, 20], [3, 5], source="a.txt")
+        corpus.add_records([ChunkRecord(0, 30, 7, "x" * 30)], source="b.txt")
+
+        report = corpus.report(percentiles=(50,))
+
+        assert len(corpus) == 3
+        assert report["files"] == 2
+        assert report["total_chunks"] == 3
+        assert report["total_characters"] == 60
+        assert report["average_chunk_size"] == 20
+        assert report["chunk_size_percentiles"] == {"p50": 20.0}
+        assert report["tokens"]["total_tokens"] == 15
+        assert report["tokens"]["max_tokens"] == 7
+        assert report["per_file"][0] == {"source": "a.txt", "chunks": 2, "characters": 30, "tokens": 8}
+
+    def test_missing_token_counts(self):
+        """Test token statistics are omitted unless every chunk was counted."""
+        corpus = CorpusStats()
+        corpus.add([10], [3])
+        corpus.add_chunks(["no counts"])
+
+        report = corpus.report(include_files=False)
+
+        assert report["tokens"] is None
+        assert report["total_characters"] == 19
+        assert "per_file" not in report
+
+    def test_merge(self):
+        """Test merging matches adding every file to one accumulator."""
+        combined, first, second = CorpusStats(), CorpusStats(), CorpusStats()
+        for corpus, lengths in ((first, [1, 2, 3]), (second, [40, 50])):
+            corpus.add(lengths, lengths)
+            combined.add(lengths, lengths)
+
+        first.merge(second)
+
+        assert first.report() == combined.report()
+
+    def test_empty(self):
+        """Test an empty corpus reports zeros."""
+        report = CorpusStats().report(percentiles=(50,))
+
+        assert report["total_chunks"] == 0
+        assert report["chunk_size_percentiles"] == {"p50": 0.0}
+        assert report["tokens"] is None
+
+    def test_cli_stats(self, temp_dir, temp_config_file, monkeypatch):
+        """Test the stats command writes a corpus report."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_config_file))
+        (temp_dir / "a.txt").write_text("First file.\n\nWith two paragraphs.", encoding='utf-8')
+        (temp_dir / "b.md").write_text("# Title\n\nSome markdown.", encoding='utf-8')
+        report_path = temp_dir / "report.json"
+
+        result = CliRunner().invoke(app, ["stats", str(temp_dir), "--output", str(report_path)])
+
+        assert result.exit_code == 0, result.stdout
+        report = json.loads(report_path.read_text(encoding='utf-8'))
+        assert report["files"] == 2
+        assert report["total_chunks"] >= 2
+        assert [entry["source"] for entry in report["per_file"]] == [
+            str(temp_dir / "a.txt"), str(temp_dir / "b.md")
+        ]
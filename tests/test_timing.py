@@ -0,0 +1,112 @@
+"""Tests for the stage timing module."""
+
+import pstats
+import time
+import pytest
+from typer.testing import CliRunner
+from cut_it.cli import app
+from cut_it.config import ConfigManager
+from cut_it.timing import StageTimer, StageTiming, register_stage_hook, unregister_stage_hook
+
+
+def slow_items(count, delay):
+    """Yield ``count`` items, sleeping before each one."""
+    for i in range(count):
+        time.sleep(delay)
+        yield i
+
+
+class TestStageTimer:
+    """Test cases for StageTimer."""
+
+    def test_stage(self):
+        """Test a stage records its wall time."""
+        timer = StageTimer()
+        with timer.stage("reading"):
+            time.sleep(0.01)
+        
+        assert [timing.stage for timing in timer.timings] == ["reading"]
+        assert timer.timings[0].wall_seconds >= 0.01
+
+    def test_stage_records_on_error(self):
+        """Test a stage is recorded even when its block raises."""
+        timer = StageTimer()
+        with pytest.raises(RuntimeError):
+            with timer.stage("reading"):
+                raise RuntimeError("boom")
+        assert "reading" in timer.totals()
+
+    def test_iterate_excluded_from_enclosing_stage(self):
+        """Test lazily produced items are timed separately from their consumer."""
+        timer = StageTimer()
+        items = timer.iterate("splitting", slow_items(5, 0.01))
+        
+        with timer.stage("formatting"):
+            assert list(items) == [0, 1, 2, 3, 4]
+        
+        totals = timer.totals()
+        assert totals["splitting"].wall_seconds >= 0.05
+        assert totals["formatting"].wall_seconds < 0.05
+
+    def test_totals_sum_repeated_stages(self):
+        """Test timings of the same stage are summed in order of appearance."""
+        timer = StageTimer()
+        timer.record("splitting", 1.0, 0.5)
+        timer.record("formatting", 2.0, 1.0)
+        timer.record("splitting", 3.0, 1.5)
+        
+        assert timer.totals() == {
+            "splitting": StageTiming("splitting", 4.0, 2.0),
+            "formatting": StageTiming("formatting", 2.0, 1.0),
+        }
+
+    def test_hooks(self):
+        """Test registered and per-timer hooks receive every timing."""
+        registered, local = [], []
+        hook = register_stage_hook(registered.append)
+        try:
+            timer = StageTimer(hooks=[local.append])
+            with timer.stage("reading"):
+                pass
+        finally:
+            unregister_stage_hook(hook)
+        with StageTimer().stage("ignored"):
+            pass
+        
+        assert [timing.stage for timing in registered] == ["reading"]
+        assert local == registered
+
+
+class TestProcessTimings:
+    """Test cases for the process command timing options."""
+
+    @pytest.fixture
+    def source(self, temp_dir, monkeypatch, document_factory):
+        """A markdown document to process."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_dir / "config.json"))
+        path = temp_dir / "doc.md"
+        path.write_text(document_factory(paragraphs=50, markdown=True), encoding='utf-8')
+        return path
+
+    def test_timings(self, source):
+        """Test --timings prints every stage and exports them to hooks."""
+        stages = []
+        hook = register_stage_hook(lambda timing: stages.append(timing.stage))
+        try:
+            result = CliRunner().invoke(app, ["process", str(source), "--timings"])
+        finally:
+            unregister_stage_hook(hook)
+        
+        assert result.exit_code == 0, result.stdout
+        for stage in ("reading", "splitting", "formatting", "total"):
+            assert stage in result.stdout
+        assert set(stages) == {"reading", "splitting", "formatting"}
+
+    def test_profile(self, source, temp_dir):
+        """Test --profile writes stats readable by pstats."""
+        profile_path = temp_dir / "out.prof"
+        
+        result = CliRunner().invoke(app, ["process", str(source), "--profile", str(profile_path)])
+        
+        assert result.exit_code == 0, result.stdout
+        assert pstats.Stats(str(profile_path)).total_calls > 0
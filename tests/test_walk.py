@@ -0,0 +1,156 @@
+"""Tests for the source tree walking module."""
+
+import os
+
+import pytest
+from cut_it import walk as walk_module
+from cut_it.walk import IgnoreRules, IgnoreTree, walk_files
+
+
+def relatives(sources):
+    return [source.relative for source in sources]
+
+
+class TestIgnoreRules:
+    """Test cases for gitignore pattern matching."""
+
+    @pytest.mark.parametrize("pattern, path, is_dir, expected", [
+        ("*.log", "debug.log", False, True),
+        ("*.log", "a/b/debug.log", False, True),
+        ("*.log", "debug.txt", False, None),
+        ("/top.txt", "top.txt", False, True),
+        ("/top.txt", "src/top.txt", False, None),
+        ("build/", "build", True, True),
+        ("build/", "build", False, None),
+        ("docs/*.md", "docs/guide.md", False, True),
+        ("docs/*.md", "docs/api/guide.md", False, None),
+        ("**/fixtures", "tests/unit/fixtures", True, True),
+        ("a/**/b", "a/b", False, True),
+        ("a/**/b", "a/x/y/b", False, True),
+        ("logs/**", "logs/2024/app.log", False, True),
+        ("file?.txt", "file1.txt", False, True),
+        ("file[0-9].txt", "filea.txt", False, None),
+        ("file[!0-9].txt", "filea.txt", False, True),
+        ("\\#notes", "#notes", False, True),
+    ])
+    def test_patterns(self, pattern, path, is_dir, expected):
+        """Test git's anchoring, directory, wildcard and escape rules."""
+        assert IgnoreRules([pattern]).match(path, is_dir) is expected
+
+    def test_last_match_wins(self):
+        """Test negated patterns re-include earlier matches."""
+        rules = IgnoreRules(["*.txt", "!keep.txt", "# comment", ""])
+
+        assert len(rules) == 2
+        assert rules.match("drop.txt", False) is True
+        assert rules.match("keep.txt", False) is False
+
+    def test_from_file(self, temp_dir):
+        """Test missing and empty files give no rules."""
+        (temp_dir / "empty").write_text("# only a comment\n", encoding='utf-8')
+
+        assert IgnoreRules.from_file(temp_dir / "missing") is None
+        assert IgnoreRules.from_file(temp_dir / "empty") is None
+
+
+class TestIgnoreTree:
+    """Test cases for checking single paths against a tree's gitignores."""
+
+    def test_matches_walk_files(self, source_tree):
+        """Test single paths are judged like walk_files judges them."""
+        tree = IgnoreTree(source_tree)
+        walked = set(relatives(walk_files(source_tree)))
+
+        for path in source_tree.rglob("*"):
+            relative = path.relative_to(source_tree).as_posix()
+            if path.is_file() and not relative.startswith(".git/") and path.suffix != ".png" and "tasks" not in path.name:
+                assert tree.is_ignored(path) == (relative not in walked), relative
+
+    def test_ignored_directory_and_outside(self, source_tree):
+        """Test files below ignored directories, in .git or outside the tree are ignored."""
+        tree = IgnoreTree(source_tree / "src")
+
+        assert IgnoreTree(source_tree).is_ignored(source_tree / "build" / "deep" / "new.txt")
+        assert IgnoreTree(source_tree).is_ignored(source_tree / ".git" / "HEAD")
+        assert tree.is_ignored(source_tree / "README.md")
+        assert not tree.is_ignored(source_tree / "src" / "app.py")
+
+
+class TestWalkFiles:
+    """Test cases for walk_files."""
+
+    def test_respects_gitignore(self, source_tree):
+        """Test ignored, generated, binary and .git files are skipped."""
+        assert relatives(walk_files(source_tree)) == [
+            ".gitignore",
+            "README.md",
+            "docs/guide.md",
+            "src/.gitignore",
+            "src/app.py",
+            "src/generated_keep.py",
+            "src/top.txt",
+        ]
+
+    def test_without_gitignore(self, source_tree):
+        """Test every text file is yielded when gitignore is disabled."""
+        found = relatives(walk_files(source_tree, gitignore=False))
+
+        assert "build/out.txt" in found
+        assert "debug.log" in found
+        assert "src/generated_parser.py" in found
+        assert not any(path.startswith(".git/") for path in found)
+        assert "logo.png" not in found
+
+    def test_git_info_exclude(self, source_tree):
+        """Test patterns in .git/info/exclude apply to the whole tree."""
+        (source_tree / ".git" / "info").mkdir()
+        (source_tree / ".git" / "info" / "exclude").write_text("*.md\n", encoding='utf-8')
+
+        assert not any(path.endswith(".md") for path in relatives(walk_files(source_tree)))
+
+    def test_filters(self, source_tree):
+        """Test extension and size filters."""
+        (source_tree / "src" / "big.py").write_text("z = 0\n" * 1000, encoding='utf-8')
+
+        by_extension = relatives(walk_files(source_tree, extensions=["py", ".MD"]))
+        assert by_extension == ["README.md", "docs/guide.md", "src/app.py", "src/big.py", "src/generated_keep.py"]
+        assert "src/big.py" not in relatives(walk_files(source_tree, max_size=1024))
+
+    def test_exclude(self, source_tree):
+        """Test excluded directories are never entered."""
+        found = relatives(walk_files(source_tree, exclude=[source_tree / "src"]))
+
+        assert not any(path.startswith("src/") for path in found)
+
+    def test_skips_symlinks(self, source_tree):
+        """Test symlinks are not followed."""
+        try:
+            os.symlink(source_tree / "src", source_tree / "linked")
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks are not supported")
+
+        assert not any(path.startswith("linked") for path in relatives(walk_files(source_tree)))
+
+    def test_sizes_and_paths(self, source_tree):
+        """Test yielded files carry absolute paths and sizes."""
+        source = next(walk_files(source_tree, extensions=[".py"]))
+
+        assert source.path == source_tree / "src" / "app.py"
+        assert source.size == (source_tree / "src" / "app.py").stat().st_size
+
+    def test_streams(self, source_tree, monkeypatch):
+        """Test the first file is yielded before the rest of the tree is read."""
+        scanned = []
+        scandir = os.scandir
+
+        def recording_scandir(path):
+            scanned.append(path)
+            return scandir(path)
+
+        monkeypatch.setattr(walk_module.os, "scandir", recording_scandir)
+        walker = walk_files(source_tree)
+
+        assert next(walker).relative == ".gitignore"
+        assert len(scanned) == 1
+        list(walker)
+        assert len(scanned) == 3
@@ -0,0 +1,261 @@
+"""Tests for the watch module."""
+
+import threading
+import time
+
+import pytest
+from typer.testing import CliRunner
+from cut_it import watch as watch_module
+from cut_it.cli import app
+from cut_it.config import ConfigManager
+from cut_it.formatter import TaskFormatter
+from cut_it.watch import Refresher, Watcher, changed_files, snapshot
+
+
+@pytest.fixture
+def docs_dir(temp_dir):
+    """Create a documentation folder with an ignored build directory."""
+    (temp_dir / ".gitignore").write_text("_build/\n", encoding='utf-8')
+    (temp_dir / "guide.md").write_text("# Guide\n\nHow to use it.", encoding='utf-8')
+    (temp_dir / "notes.txt").write_text("Some notes.", encoding='utf-8')
+    (temp_dir / "_build").mkdir()
+    (temp_dir / "_build" / "guide.html").write_text("<html></html>", encoding='utf-8')
+    return temp_dir
+
+
+def first_batch(watcher, timeout=5.0):
+    """Get the first batch of a running watcher, failing after ``timeout`` seconds."""
+    batches = []
+    thread = threading.Thread(target=lambda: batches.append(next(watcher.batches())), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    watcher.stop()
+    assert batches, "no change reported"
+    return batches[0]
+
+
+class TestSnapshots:
+    """Test cases for polling snapshots."""
+
+    def test_snapshot_follows_ingest_rules(self, docs_dir):
+        """Test ignored files and task outputs are not followed."""
+        (docs_dir / "guide.tasks.md").write_text("# guide.md", encoding='utf-8')
+        (docs_dir / "guide.tasks.manifest.json").write_text("{}", encoding='utf-8')
+
+        assert sorted(path.name for path in snapshot(docs_dir)) == [".gitignore", "guide.md", "notes.txt"]
+        assert [path.name for path in snapshot(docs_dir, extensions=["md"])] == ["guide.md"]
+
+    def test_changed_files(self, docs_dir):
+        """Test created and modified files are reported, deleted ones are not."""
+        before = snapshot(docs_dir)
+        (docs_dir / "notes.txt").write_text("Longer notes than before.", encoding='utf-8')
+        (docs_dir / "new.md").write_text("# New", encoding='utf-8')
+        (docs_dir / "guide.md").unlink()
+
+        assert [path.name for path in changed_files(before, snapshot(docs_dir))] == ["new.md", "notes.txt"]
+
+
+class TestWatcher:
+    """Test cases for Watcher."""
+
+    def test_accepts(self, docs_dir):
+        """Test event paths are filtered like walked files."""
+        watcher = Watcher(docs_dir, extensions=["md", "txt"], native=False, exclude=[docs_dir / "out"])
+
+        assert watcher.accepts(docs_dir / "guide.md")
+        assert not watcher.accepts(docs_dir / "guide.tasks.md")
+        assert not watcher.accepts(docs_dir / "guide.tasks.manifest.json")
+        assert not watcher.accepts(docs_dir / "_build" / "index.md")
+        assert not watcher.accepts(docs_dir / "image.png")
+        assert not watcher.accepts(docs_dir / "out" / "guide.md")
+        assert not watcher.accepts(docs_dir / ".git" / "notes.txt")
+
+    def test_gitignore_changes_are_picked_up(self, docs_dir):
+        """Test editing a .gitignore drops its cached rules."""
+        watcher = Watcher(docs_dir, native=False)
+        assert watcher.accepts(docs_dir / "notes.txt")
+
+        (docs_dir / ".gitignore").write_text("_build/\n*.txt\n", encoding='utf-8')
+        watcher.notify(docs_dir / ".gitignore")
+
+        assert not watcher.accepts(docs_dir / "notes.txt")
+
+    def test_debounces_bursts(self, docs_dir):
+        """Test repeated changes to a file are reported once, after it settles."""
+        watcher = Watcher(docs_dir, debounce=0.2, native=False)
+        start = time.monotonic()
+        for _ in range(5):
+            watcher.notify(docs_dir / "guide.md")
+        watcher.notify(docs_dir / "notes.txt")
+
+        batch = next(watcher.batches())
+
+        assert batch == [docs_dir / "guide.md", docs_dir / "notes.txt"]
+        assert time.monotonic() - start >= 0.2
+
+    def test_drops_deleted_and_binary_files(self, docs_dir):
+        """Test files gone or binary by the time they settle are not reported."""
+        watcher = Watcher(docs_dir, debounce=0.05, native=False)
+        (docs_dir / "data.txt").write_bytes(b"\x00\x01\x02")
+        watcher.notify(docs_dir / "data.txt")
+        watcher.notify(docs_dir / "gone.txt")
+        watcher.notify(docs_dir / "guide.md")
+
+        assert next(watcher.batches()) == [docs_dir / "guide.md"]
+
+    def test_polling(self, docs_dir):
+        """Test polling reports a modified file."""
+        watcher = Watcher(docs_dir, debounce=0.05, interval=0.05, native=False).start()
+        time.sleep(0.1)
+        (docs_dir / "notes.txt").write_text("Notes edited during the day.", encoding='utf-8')
+
+        assert first_batch(watcher) == [docs_dir / "notes.txt"]
+
+    def test_native_needs_watchdog(self, docs_dir, monkeypatch):
+        """Test asking for native watching without watchdog fails clearly."""
+        monkeypatch.setattr(watch_module, "_load_observer", lambda: None)
+
+        with pytest.raises(ImportError, match="watchdog"):
+            Watcher(docs_dir, native=True)
+        assert Watcher(docs_dir).native is False
+
+
+class TestRefresher:
+    """Test cases for Refresher."""
+
+    def test_refresh_keeps_statuses(self, docs_dir, document_factory):
+        """Test refreshing re-chunks incrementally, keeping unchanged task statuses."""
+        source = docs_dir / "long.md"
+        document = document_factory(paragraphs=200, markdown=True)
+        source.write_text(document, encoding='utf-8')
+        refresher = Refresher(docs_dir, classify=lambda path: "markdown", chunk_size=(50, 100))
+        formatter = TaskFormatter()
+
+        first = refresher.refresh(source)
+        assert first.ok
+        assert first.output_path == docs_dir / "long.tasks.md"
+        content = formatter.update_task_status(first.output_path.read_text(encoding='utf-8'), 1, "Completed")
+        first.output_path.write_text(content, encoding='utf-8')
+
+        source.write_text(document + "\n\nOne more paragraph.", encoding='utf-8')
+        second = refresher.refresh(source)
+
+        assert second.ok and second.chunks >= first.chunks
+        assert formatter.get_task_statuses(second.output_path.read_text(encoding='utf-8'))[1] == "Completed"
+
+    def test_reuses_processors(self, docs_dir):
+        """Test one processor per file type is kept warm across refreshes."""
+        refresher = Refresher(docs_dir, classify=lambda path: "markdown" if path.suffix == ".md" else "text")
+
+        refresher.refresh(docs_dir / "guide.md")
+        refresher.refresh(docs_dir / "notes.txt")
+        refresher.refresh(docs_dir / "guide.md")
+
+        assert sorted(refresher._processors) == [("markdown", None, 0), ("text", None, 0)]
+
+    def test_overlap(self, docs_dir, document_factory):
+        """Test refreshes split with the configured overlap and keep task statuses."""
+        source = docs_dir / "long.md"
+        document = document_factory(paragraphs=100, markdown=True)
+        source.write_text(document, encoding='utf-8')
+        refresher = Refresher(docs_dir, classify=lambda path: "markdown", chunk_size=(50, 100), overlap=20)
+        formatter = TaskFormatter()
+
+        first = refresher.refresh(source)
+        assert first.ok
+        assert list(refresher._processors) == [("markdown", None, 20)]
+        assert refresher._processors[("markdown", None, 20)].overlap == 20
+        content = formatter.update_task_status(first.output_path.read_text(encoding='utf-8'), 1, "Completed")
+        first.output_path.write_text(content, encoding='utf-8')
+
+        source.write_text(document + "\n\nOne more paragraph.", encoding='utf-8')
+        second = refresher.refresh(source)
+
+        assert second.ok
+        assert formatter.get_task_statuses(second.output_path.read_text(encoding='utf-8'))[1] == "Completed"
+
+    def test_output_dir_and_staleness(self, docs_dir):
+        """Test outputs mirror the tree and stale outputs are detected."""
+        (docs_dir / "sub").mkdir()
+        source = docs_dir / "sub" / "page.md"
+        source.write_text("# Page", encoding='utf-8')
+        refresher = Refresher(docs_dir, classify=lambda path: "markdown", output_dir=docs_dir / "out")
+
+        assert refresher.output_for(source) == docs_dir / "out" / "sub" / "page.tasks.md"
+        assert refresher.is_stale(source)
+        refresher.refresh(source)
+        assert not refresher.is_stale(source)
+
+    def test_name_clash_is_refused(self, docs_dir):
+        """Test a file sharing another file's output is refused, keeping that output."""
+        (docs_dir / "app.md").write_text("# App", encoding='utf-8')
+        (docs_dir / "app.py").write_text("print('app')", encoding='utf-8')
+        refresher = Refresher(docs_dir, classify=lambda path: "text")
+
+        assert refresher.refresh(docs_dir / "app.md").ok
+        clash = refresher.refresh(docs_dir / "app.py")
+
+        assert not clash.ok
+        assert "both write to" in clash.error
+        assert "# App" in (docs_dir / "app.tasks.md").read_text(encoding='utf-8')
+
+    def test_refreshes_process_output(self, docs_dir, document_factory, temp_config_file, monkeypatch):
+        """Test watch refreshes the task list written by process, keeping its statuses."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_config_file))
+        source = docs_dir / "guide.md"
+        source.write_text(document_factory(paragraphs=100, markdown=True), encoding='utf-8')
+        result = CliRunner().invoke(app, ["process", str(source)])
+        assert result.exit_code == 0, result.stdout
+        output = docs_dir / "guide.tasks.md"
+        formatter = TaskFormatter()
+        output.write_text(formatter.update_task_status(output.read_text(encoding='utf-8'), 1, "Completed"), encoding='utf-8')
+
+        source.write_text(source.read_text(encoding='utf-8') + "\n\nOne more paragraph.", encoding='utf-8')
+        refreshed = Refresher(docs_dir, classify=lambda path: "markdown").refresh(source)
+
+        assert refreshed.output_path == output
+        assert formatter.get_task_statuses(output.read_text(encoding='utf-8'))[1] == "Completed"
+        assert sorted(path.name for path in docs_dir.glob("guide*.tasks.md")) == ["guide.tasks.md"]
+
+    def test_failure_is_captured(self, docs_dir):
+        """Test unreadable files produce an error result."""
+        (docs_dir / "bad.txt").write_bytes(b"\xff\xfe invalid utf-8")
+
+        result = Refresher(docs_dir, classify=lambda path: "text").refresh(docs_dir / "bad.txt")
+
+        assert not result.ok
+        assert "UnicodeDecodeError" in result.error
+
+
+class TestWatchCommand:
+    """Test cases for the watch command."""
+
+    def test_catch_up_and_refresh(self, docs_dir, temp_config_file, monkeypatch):
+        """Test stale files are refreshed first, then each reported batch."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_config_file))
+
+        def batches(watcher):
+            (docs_dir / "notes.txt").write_text("Notes changed.", encoding='utf-8')
+            yield [docs_dir / "notes.txt"]
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(Watcher, "batches", batches)
+
+        result = CliRunner().invoke(app, ["watch", str(docs_dir), "--ext", "md,txt", "--polling"])
+
+        assert result.exit_code == 0, result.stdout
+        assert (docs_dir / "guide.tasks.md").exists()
+        assert "Notes changed." in (docs_dir / "notes.tasks.md").read_text(encoding='utf-8')
+        assert "(polling)" in result.stdout
+        assert result.stdout.count("refreshed") == 3
+        assert "Stopped watching" in result.stdout
+
+    def test_overlap_too_large(self, docs_dir, temp_config_file, monkeypatch):
+        """Test an overlap that does not fit the chunk size is rejected before watching."""
+        monkeypatch.setattr("cut_it.cli.ConfigManager", lambda: ConfigManager(temp_config_file))
+
+        result = CliRunner().invoke(app, ["watch", str(docs_dir), "--size", "50", "100", "--overlap", "50"])
+
+        assert result.exit_code == 1
+        assert "overlap" in result.stdout
+        assert not (docs_dir / "guide.tasks.md").exists()